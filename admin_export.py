@@ -0,0 +1,205 @@
+"""
+Admin Export
+Streams admin list queries as CSV, NDJSON or a JSON array straight from an unbuffered cursor,
+and a job's applicant resumes as a ZIP of PDFs
+"""
+
+import csv
+import io
+import zipfile
+from datetime import datetime
+
+from flask import Response, stream_with_context
+from werkzeug.utils import secure_filename
+
+from fast_json import dumps_bytes, stream_json_array
+from resume_pdf import parse_resume_data
+
+EXPORT_FORMATS = ('csv', 'ndjson', 'json')
+
+
+def stream_rows(get_connection, query, params, chunk_size=1000):
+    """
+    Yield rows of `query` without buffering the result set.
+
+    The connection stays checked out until the generator finishes or is
+    closed (e.g. when the client disconnects).
+    """
+    connection = get_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    cursor = connection.cursor(dictionary=True, buffered=False)
+    finished = False
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                finished = True
+                return
+            yield from rows
+    finally:
+        if finished:
+            cursor.close()
+            connection.close()
+        else:
+            # Unread rows are still on the wire; drop the connection rather than drain them
+            getattr(connection, 'discard', connection.close)()
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return value
+
+
+def csv_chunks(fields, rows, chunk_size=1000):
+    """CSV text in chunks of `chunk_size` rows, header first"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow([_csv_value(row[field]) for field in fields])
+        count += 1
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_chunks(rows, chunk_size=1000):
+    """One JSON object per line, flushed every `chunk_size` rows"""
+    buffer = []
+    for row in rows:
+        buffer.append(dumps_bytes(row))
+        if len(buffer) >= chunk_size:
+            yield b'\n'.join(buffer) + b'\n'
+            buffer = []
+    if buffer:
+        yield b'\n'.join(buffer) + b'\n'
+
+
+def export_response(list_query, args, get_connection, name, chunk_size=1000):
+    """Streamed download of every row of `list_query` matching the request filters"""
+    export_format = args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    query, params, fields = list_query.export_query(args)
+    rows = stream_rows(get_connection, query, params, chunk_size)
+
+    if export_format == 'json':
+        response = stream_json_array(rows, chunk_size=chunk_size)
+    elif export_format == 'ndjson':
+        response = Response(stream_with_context(ndjson_chunks(rows, chunk_size)), mimetype='application/x-ndjson')
+    else:
+        response = Response(stream_with_context(csv_chunks(fields, rows, chunk_size)), mimetype='text/csv')
+
+    filename = f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{export_format}"
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+# Every application to a job with the applicant's most recent resume (NULLs when they have none)
+APPLICANT_RESUMES = """
+    SELECT ja.id AS application_id, u.id AS user_id, u.username, u.email, ja.status, ja.applied_at,
+           r.id AS resume_id, r.resume_name, r.resume_data
+    FROM job_applications ja
+    JOIN users u ON u.id = ja.user_id
+    LEFT JOIN user_resumes r ON r.id = (
+        SELECT latest.id FROM user_resumes latest
+        WHERE latest.user_id = ja.user_id
+        ORDER BY latest.created_at DESC, latest.id DESC
+        LIMIT 1
+    )
+    WHERE ja.job_id = %s
+    ORDER BY ja.applied_at, ja.id
+"""
+
+MANIFEST_FIELDS = ['username', 'email', 'status', 'applied_at', 'file', 'note']
+
+
+class _ZipSink:
+    """Write-only, unseekable file object that hands back what the zip writer produced"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def zip_chunks(files):
+    """ZIP archive of (name, bytes) pairs, yielded member by member"""
+    sink = _ZipSink()
+    # PDFs are already compressed; storing them keeps the archive cheap to build
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED) as archive:
+        for name, data in files:
+            archive.writestr(name, data)
+            yield sink.take()
+    yield sink.take()
+
+
+def applicant_resume_files(rows, renderer):
+    """(name, PDF bytes) per applicant as renders finish, then an applicants.csv manifest"""
+    manifest = []
+
+    def resumes():
+        for row in rows:
+            entry = {field: row.get(field) for field in MANIFEST_FIELDS}
+            manifest.append(entry)
+            if row['resume_id'] is None:
+                entry['note'] = 'no resume'
+                continue
+            entry['file'] = secure_filename(f"{row['username']}-{row['resume_id']}.pdf")
+            yield entry, parse_resume_data(row['resume_data'])
+
+    for entry, result in renderer.render_many(resumes()):
+        if isinstance(result, Exception):
+            print(f"Error rendering resume {entry['file']}: {result}")
+            entry['note'] = f'render failed: {result}'
+            entry['file'] = None
+        else:
+            yield entry['file'], result
+
+    yield 'applicants.csv', ''.join(csv_chunks(MANIFEST_FIELDS, manifest)).encode('utf-8')
+
+
+def resume_archive_response(job_id, get_connection, renderer, chunk_size=1000):
+    """Streamed ZIP of every applicant's latest resume for a job; None if the job does not exist"""
+    connection = get_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT id FROM jobs WHERE id = %s", (job_id,))
+        found = cursor.fetchone()
+        cursor.close()
+    finally:
+        connection.close()
+    if not found:
+        return None
+
+    rows = stream_rows(get_connection, APPLICANT_RESUMES, (job_id,), chunk_size)
+    response = Response(stream_with_context(zip_chunks(applicant_resume_files(rows, renderer))),
+                        mimetype='application/zip')
+    filename = f"job-{job_id}-resumes-{datetime.now().strftime('%Y%m%d-%H%M%S')}.zip"
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,136 @@
+"""
+Admin List Queries
+Column, sort and filter whitelists for the paginated admin list endpoints
+"""
+
+from pagination import ListQuery, contains
+from skill_index import normalize_skill
+
+# Rows linked to one skill through its indexed join table
+HAS_SKILL = "{column} IN (SELECT link.{owner} FROM {table} link JOIN skills s ON s.id = link.skill_id WHERE s.name = %s)"
+
+USERS = ListQuery(
+    from_clause="users u",
+    columns={
+        'id': 'u.id',
+        'username': 'u.username',
+        'email': 'u.email',
+        'role': 'u.role',
+        'created_at': 'u.created_at',
+    },
+    sorts={'created_at': 'u.created_at', 'id': 'u.id', 'username': 'u.username'},
+    filters={
+        'role': ("u.role = %s", str),
+        'q': ("(u.username LIKE %s OR u.email LIKE %s)", contains),
+        'created_after': ("u.created_at >= %s", str),
+        'created_before': ("u.created_at < %s", str),
+        'skill': (HAS_SKILL.format(column='u.id', owner='user_id', table='user_skill'), normalize_skill),
+    },
+    default_sort='-created_at',
+    id_column='u.id'
+)
+
+JOBS = ListQuery(
+    from_clause="jobs j",
+    columns={
+        'id': 'j.id',
+        'title': 'j.title',
+        'company': 'j.company',
+        'location': 'j.location',
+        'job_type': 'j.job_type',
+        'experience_required': 'j.experience_required',
+        'salary_min': 'j.salary_min',
+        'salary_max': 'j.salary_max',
+        'description': 'j.description',
+        'requirements': 'j.requirements',
+        'skills_required': 'j.skills_required',
+        'benefits': 'j.benefits',
+        'application_deadline': 'j.application_deadline',
+        'status': 'j.status',
+        'created_by': 'j.created_by',
+        'created_at': 'j.created_at',
+        'updated_at': 'j.updated_at',
+    },
+    sorts={'created_at': 'j.created_at', 'id': 'j.id', 'title': 'j.title'},
+    filters={
+        'status': ("j.status = %s", str),
+        'job_type': ("j.job_type = %s", str),
+        'company': ("j.company LIKE %s", contains),
+        'location': ("j.location LIKE %s", contains),
+        'q': ("(j.title LIKE %s OR j.company LIKE %s OR j.skills_required LIKE %s)", contains),
+        'skill': (HAS_SKILL.format(column='j.id', owner='job_id', table='job_skill'), normalize_skill),
+    },
+    default_sort='-created_at',
+    id_column='j.id'
+)
+
+APPLICATIONS = ListQuery(
+    from_clause="job_applications ja JOIN users u ON ja.user_id = u.id JOIN jobs j ON ja.job_id = j.id",
+    columns={
+        'id': 'ja.id',
+        'user_id': 'ja.user_id',
+        'job_id': 'ja.job_id',
+        'status': 'ja.status',
+        'applied_at': 'ja.applied_at',
+        'username': 'u.username',
+        'email': 'u.email',
+        'job_title': 'j.title',
+        'company': 'j.company',
+    },
+    sorts={'applied_at': 'ja.applied_at', 'id': 'ja.id'},
+    filters={
+        'status': ("ja.status = %s", str),
+        'job_id': ("ja.job_id = %s", int),
+        'user_id': ("ja.user_id = %s", int),
+        'applied_after': ("ja.applied_at >= %s", str),
+        'applied_before': ("ja.applied_at < %s", str),
+        'q': ("(u.username LIKE %s OR u.email LIKE %s OR j.title LIKE %s OR j.company LIKE %s)", contains),
+    },
+    default_sort='-applied_at',
+    id_column='ja.id'
+)
+
+COURSES = ListQuery(
+    from_clause="courses c",
+    columns={
+        'id': 'c.id',
+        'title': 'c.title',
+        'description': 'c.description',
+        'provider': 'c.provider',
+        'duration_weeks': 'c.duration_weeks',
+        'difficulty_level': 'c.difficulty_level',
+        'skills_covered': 'c.skills_covered',
+        'course_url': 'c.course_url',
+        'price': 'c.price',
+        'rating': 'c.rating',
+        'created_at': 'c.created_at',
+    },
+    sorts={'created_at': 'c.created_at', 'id': 'c.id', 'title': 'c.title'},
+    filters={
+        'difficulty_level': ("c.difficulty_level = %s", str),
+        'provider': ("c.provider LIKE %s", contains),
+        'q': ("(c.title LIKE %s OR c.provider LIKE %s OR c.skills_covered LIKE %s)", contains),
+        'skill': (HAS_SKILL.format(column='c.id', owner='course_id', table='course_skill'), normalize_skill),
+    },
+    default_sort='-created_at',
+    id_column='c.id'
+)
+
+
+def add_enrollment_stats(cursor, courses):
+    """Attach enrolled_students and avg_progress to one page of courses"""
+    if not courses:
+        return courses
+    placeholders = ', '.join(['%s'] * len(courses))
+    cursor.execute(f"""
+        SELECT course_id, COUNT(user_id) as enrolled_students, AVG(progress_percentage) as avg_progress
+        FROM user_course_progress
+        WHERE course_id IN ({placeholders})
+        GROUP BY course_id
+    """, [course['id'] for course in courses])
+    stats = {row['course_id']: row for row in cursor.fetchall()}
+    for course in courses:
+        row = stats.get(course['id'], {})
+        course['enrolled_students'] = row.get('enrolled_students', 0)
+        course['avg_progress'] = row.get('avg_progress')
+    return courses
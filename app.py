@@ -1,1285 +1,1433 @@
-from flask import Flask, request, jsonify, session, render_template
-from flask_cors import CORS
-from flask_session import Session
-import mysql.connector
-from mysql.connector import Error
-import bcrypt
-import os
-from dotenv import load_dotenv
-import json
-from datetime import datetime
-# Note: pandas, numpy, and scikit-learn removed for Windows compatibility
-# Simple recommendation logic will be used instead
-import uuid
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-import io
-import base64
-
-# Load environment variables
-load_dotenv()
-
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
-app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SESSION_PERMANENT'] = False
-app.config['SESSION_USE_SIGNER'] = True
-app.config['SESSION_KEY_PREFIX'] = 'career_platform:'
-
-# Initialize extensions
-CORS(app, supports_credentials=True)
-Session(app)
-
-# Database configuration
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'database': os.getenv('DB_NAME', 'career_platform'),
-    'user': os.getenv('DB_USER', 'root'),
-    'password': os.getenv('DB_PASSWORD', 'Divya@2004'),
-    'port': int(os.getenv('DB_PORT', 3306))
-}
-
-# Admin credentials
-ADMIN_USERNAME = 'admin'
-ADMIN_PASSWORD = 'admin123'
-
-def get_db_connection():
-    """Create and return database connection"""
-    try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        return connection
-    except Error as e:
-        print(f"Error connecting to MySQL: {e}")
-        return None
-
-def init_database():
-    """Initialize database tables"""
-    connection = get_db_connection()
-    if not connection:
-        return False
-    
-    try:
-        cursor = connection.cursor()
-        
-        # Create users table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                username VARCHAR(50) UNIQUE NOT NULL,
-                email VARCHAR(100) UNIQUE NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                role ENUM('user', 'admin') DEFAULT 'user',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create user_profiles table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_profiles (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                first_name VARCHAR(50),
-                last_name VARCHAR(50),
-                phone VARCHAR(20),
-                date_of_birth DATE,
-                gender ENUM('Male', 'Female', 'Other'),
-                address TEXT,
-                city VARCHAR(50),
-                state VARCHAR(50),
-                country VARCHAR(50),
-                pincode VARCHAR(10),
-                
-                -- Academic Information
-                highest_qualification VARCHAR(100),
-                university VARCHAR(100),
-                graduation_year INT,
-                cgpa DECIMAL(3,2),
-                field_of_study VARCHAR(100),
-                
-                -- Skills and Ratings
-                technical_skills TEXT,
-                soft_skills TEXT,
-                programming_languages TEXT,
-                frameworks TEXT,
-                database_skills TEXT,
-                tools TEXT,
-                
-                -- Experience
-                total_experience INT DEFAULT 0,
-                internships TEXT,
-                projects TEXT,
-                certifications TEXT,
-                
-                -- Interests and Preferences
-                career_interests TEXT,
-                preferred_locations TEXT,
-                salary_expectation INT,
-                work_mode ENUM('Remote', 'On-site', 'Hybrid'),
-                
-                -- Tech Stack
-                tech_stack TEXT,
-                batch_semester VARCHAR(20),
-                
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(200) NOT NULL,
-                company VARCHAR(100) NOT NULL,
-                location VARCHAR(100),
-                job_type ENUM('Full-time', 'Part-time', 'Contract', 'Internship') DEFAULT 'Full-time',
-                experience_required INT DEFAULT 0,
-                salary_min INT,
-                salary_max INT,
-                description TEXT,
-                requirements TEXT,
-                skills_required TEXT,
-                benefits TEXT,
-                application_deadline DATE,
-                status ENUM('Active', 'Closed', 'Draft') DEFAULT 'Active',
-                created_by INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
-            )
-        """)
-        
-        # Create job_applications table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS job_applications (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                job_id INT NOT NULL,
-                resume_path VARCHAR(255),
-                cover_letter TEXT,
-                status ENUM('Applied', 'Under Review', 'Shortlisted', 'Rejected', 'Accepted') DEFAULT 'Applied',
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                UNIQUE KEY unique_application (user_id, job_id)
-            )
-        """)
-        
-        # Create courses table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(200) NOT NULL,
-                description TEXT,
-                provider VARCHAR(100),
-                duration_weeks INT,
-                difficulty_level ENUM('Beginner', 'Intermediate', 'Advanced'),
-                skills_covered TEXT,
-                course_url VARCHAR(500),
-                price DECIMAL(10,2) DEFAULT 0,
-                rating DECIMAL(3,2),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create user_course_progress table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_course_progress (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                course_id INT NOT NULL,
-                progress_percentage DECIMAL(5,2) DEFAULT 0,
-                completed_modules TEXT,
-                current_module INT DEFAULT 1,
-                status ENUM('Not Started', 'In Progress', 'Completed') DEFAULT 'Not Started',
-                started_at TIMESTAMP NULL,
-                completed_at TIMESTAMP NULL,
-                certificate_path VARCHAR(255),
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
-                UNIQUE KEY unique_progress (user_id, course_id)
-            )
-        """)
-        
-        # Create recommendations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recommendations (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                job_id INT,
-                course_id INT,
-                recommendation_type ENUM('job', 'course') NOT NULL,
-                score DECIMAL(5,4),
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create user_resumes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_resumes (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                resume_name VARCHAR(255) NOT NULL,
-                resume_data JSON NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        connection.commit()
-        print("Database tables created successfully!")
-        
-        # Insert sample data if tables are empty
-        insert_sample_data(connection)
-        
-        return True
-        
-    except Error as e:
-        print(f"Error creating tables: {e}")
-        return False
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
-
-def insert_sample_data(connection):
-    """Insert sample data into the database"""
-    try:
-        cursor = connection.cursor()
-        
-        # Check if users table has any data
-        cursor.execute("SELECT COUNT(*) FROM users")
-        user_count = cursor.fetchone()[0]
-        
-        if user_count == 0:
-            print("Inserting sample users...")
-            # Insert sample users
-            sample_users = [
-                ('john_doe', 'john@example.com', bcrypt.hashpw('password123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'), 'user'),
-                ('jane_smith', 'jane@example.com', bcrypt.hashpw('password123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'), 'user'),
-                ('mike_wilson', 'mike@example.com', bcrypt.hashpw('password123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'), 'user')
-            ]
-            
-            cursor.executemany(
-                "INSERT INTO users (username, email, password_hash, role) VALUES (%s, %s, %s, %s)",
-                sample_users
-            )
-            print("Sample users inserted")
-        
-        # Check if jobs table has any data
-        cursor.execute("SELECT COUNT(*) FROM jobs")
-        job_count = cursor.fetchone()[0]
-        
-        if job_count == 0:
-            print("Inserting sample jobs...")
-            # Insert sample jobs
-            sample_jobs = [
-                ('Software Engineer', 'Tech Corp', 'Bangalore', 'Full-time', 2, 600000, 1200000, 
-                 'We are looking for a skilled software engineer to join our team.', 
-                 'Bachelor degree in Computer Science or related field', 
-                 'Python, JavaScript, React, Node.js', 'Health insurance, flexible hours', '2024-12-31'),
-                ('Data Scientist', 'Data Analytics Inc', 'Mumbai', 'Full-time', 3, 800000, 1500000, 
-                 'Join our data science team to work on exciting ML projects.', 
-                 'Master degree in Data Science or related field', 
-                 'Python, Machine Learning, SQL, Statistics', 'Remote work, learning budget', '2024-12-31'),
-                ('Frontend Developer', 'Web Solutions', 'Delhi', 'Full-time', 1, 400000, 800000, 
-                 'Create amazing user interfaces for our web applications.', 
-                 'Bachelor degree in Computer Science', 
-                 'HTML, CSS, JavaScript, React, Vue.js', 'Team events, gym membership', '2024-12-31')
-            ]
-            
-            cursor.executemany(
-                """INSERT INTO jobs (title, company, location, job_type, experience_required, 
-                                   salary_min, salary_max, description, requirements, skills_required, 
-                                   benefits, application_deadline) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-                sample_jobs
-            )
-            print("Sample jobs inserted")
-        
-        connection.commit()
-        print("Sample data insertion completed")
-        
-    except Error as e:
-        print(f"Error inserting sample data: {e}")
-    finally:
-        if connection.is_connected():
-            cursor.close()
-
-# Initialize database on startup
-init_database()
-
-# Authentication routes
-@app.route('/api/register', methods=['POST'])
-def register():
-    """User registration endpoint"""
-    try:
-        data = request.get_json()
-        username = data.get('username')
-        email = data.get('email')
-        password = data.get('password')
-        
-        print(f"Registration attempt: username={username}, email={email}")
-        
-        if not all([username, email, password]):
-            return jsonify({'error': 'All fields are required'}), 400
-        
-        # Hash password
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-        
-        connection = get_db_connection()
-        if not connection:
-            return jsonify({'error': 'Database connection failed'}), 500
-        
-        cursor = connection.cursor()
-        
-        # Check if user already exists
-        cursor.execute("SELECT id FROM users WHERE username = %s OR email = %s", (username, email))
-        if cursor.fetchone():
-            return jsonify({'error': 'Username or email already exists'}), 400
-        
-        # Insert new user
-        cursor.execute(
-            "INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
-            (username, email, password_hash)
-        )
-        connection.commit()
-        
-        return jsonify({'message': 'User registered successfully'}), 201
-        
-    except Error as e:
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Registration failed: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/login', methods=['POST'])
-def login():
-    """User login endpoint"""
-    try:
-        data = request.get_json()
-        username = data.get('username')
-        password = data.get('password')
-        
-        if not all([username, password]):
-            return jsonify({'error': 'Username and password are required'}), 400
-        
-        connection = get_db_connection()
-        if not connection:
-            return jsonify({'error': 'Database connection failed'}), 500
-        
-        cursor = connection.cursor(dictionary=True)
-        
-        # Check admin credentials first
-        print(f"Login attempt: username={username}, password={password}")
-        print(f"Admin check: username=={ADMIN_USERNAME}? {username == ADMIN_USERNAME}, password=={ADMIN_PASSWORD}? {password == ADMIN_PASSWORD}")
-        if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
-            session['user_id'] = 'admin'
-            session['username'] = username
-            session['role'] = 'admin'
-            print("Admin login successful")
-            return jsonify({
-                'message': 'Admin login successful',
-                'user': {'id': 'admin', 'username': username, 'role': 'admin'}
-            }), 200
-        
-        # Check user credentials
-        cursor.execute(
-            "SELECT id, username, email, password_hash, role FROM users WHERE username = %s",
-            (username,)
-        )
-        user = cursor.fetchone()
-        print(f"User found: {user}")
-        
-        if user and bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
-            print("User login successful")
-            session['user_id'] = user['id']
-            session['username'] = user['username']
-            session['role'] = user['role']
-            return jsonify({
-                'message': 'Login successful',
-                'user': {
-                    'id': user['id'],
-                    'username': user['username'],
-                    'email': user['email'],
-                    'role': user['role']
-                }
-            }), 200
-        else:
-            return jsonify({'error': 'Invalid credentials'}), 401
-            
-    except Error as e:
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Login failed: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/logout', methods=['POST'])
-def logout():
-    """User logout endpoint"""
-    session.clear()
-    return jsonify({'message': 'Logged out successfully'}), 200
-
-@app.route('/api/check-auth', methods=['GET'])
-def check_auth():
-    """Check if user is authenticated"""
-    if 'user_id' in session:
-        return jsonify({
-            'authenticated': True,
-            'user': {
-                'id': session['user_id'],
-                'username': session['username'],
-                'role': session['role']
-            }
-        }), 200
-    return jsonify({'authenticated': False}), 401
-
-# Profile management routes
-@app.route('/api/profile', methods=['GET', 'POST', 'PUT'])
-def profile():
-    """Get or update user profile"""
-    if 'user_id' not in session:
-        return jsonify({'error': 'Authentication required'}), 401
-    
-    user_id = session['user_id']
-    print(f"Profile API called by user {user_id}, method: {request.method}")  # Debug log
-    
-    if request.method == 'GET':
-        # Get user profile
-        connection = get_db_connection()
-        if not connection:
-            return jsonify({'error': 'Database connection failed'}), 500
-        
-        try:
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM user_profiles WHERE user_id = %s", (user_id,))
-            profile = cursor.fetchone()
-            
-            if profile:
-                # Convert JSON strings back to lists for skills
-                for skill_field in ['technical_skills', 'soft_skills', 'programming_languages', 
-                                  'frameworks', 'database_skills', 'tools']:
-                    if profile[skill_field]:
-                        try:
-                            profile[skill_field] = json.loads(profile[skill_field])
-                        except:
-                            profile[skill_field] = []
-                    else:
-                        profile[skill_field] = []
-                
-                return jsonify(profile), 200
-            else:
-                return jsonify({'message': 'Profile not found'}), 404
-                
-        except Error as e:
-            return jsonify({'error': f'Database error: {str(e)}'}), 500
-        finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
-    
-    elif request.method in ['POST', 'PUT']:
-        # Create or update user profile
-        data = request.get_json()
-        print(f"Profile update data received: {data}")  # Debug log
-        
-        # Handle empty date values
-        if 'date_of_birth' in data and data['date_of_birth'] == '':
-            data['date_of_birth'] = None
-        
-        # Handle empty numeric values
-        if 'graduation_year' in data and data['graduation_year'] == '':
-            data['graduation_year'] = None
-        
-        if 'salary_expectation' in data and data['salary_expectation'] == '':
-            data['salary_expectation'] = None
-        
-        if 'total_experience' in data and data['total_experience'] == '':
-            data['total_experience'] = 0
-        
-        # Handle work_mode enum validation
-        if 'work_mode' in data and data['work_mode'] not in ['Remote', 'On-site', 'Hybrid']:
-            data['work_mode'] = None
-        
-        # Handle gender enum validation
-        if 'gender' in data and data['gender'] not in ['Male', 'Female', 'Other']:
-            data['gender'] = None
-        
-        # Handle batch_semester length validation
-        if 'batch_semester' in data and data['batch_semester']:
-            if len(str(data['batch_semester'])) > 20:
-                data['batch_semester'] = str(data['batch_semester'])[:20]
-        
-        # Remove any datetime fields that might cause issues
-        datetime_fields = ['created_at', 'updated_at', 'savedAt']
-        for field in datetime_fields:
-            if field in data:
-                del data[field]
-        
-        # Convert skills lists to JSON strings
-        for skill_field in ['technical_skills', 'soft_skills', 'programming_languages', 
-                          'frameworks', 'database_skills', 'tools']:
-            if skill_field in data and isinstance(data[skill_field], list):
-                data[skill_field] = json.dumps(data[skill_field])
-        
-        connection = get_db_connection()
-        if not connection:
-            print("Database connection failed in profile update")  # Debug log
-            return jsonify({'error': 'Database connection failed'}), 500
-        
-        try:
-            cursor = connection.cursor()
-            
-            # Check if table exists
-            cursor.execute("SHOW TABLES LIKE 'user_profiles'")
-            table_exists = cursor.fetchone()
-            if not table_exists:
-                print("user_profiles table does not exist, creating it...")  # Debug log
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS user_profiles (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        user_id INT NOT NULL,
-                        first_name VARCHAR(50),
-                        last_name VARCHAR(50),
-                        phone VARCHAR(20),
-                        date_of_birth DATE,
-                        gender ENUM('Male', 'Female', 'Other'),
-                        address TEXT,
-                        city VARCHAR(50),
-                        state VARCHAR(50),
-                        country VARCHAR(50),
-                        pincode VARCHAR(10),
-                        highest_qualification VARCHAR(100),
-                        university VARCHAR(100),
-                        graduation_year INT,
-                        cgpa DECIMAL(3,2),
-                        field_of_study VARCHAR(100),
-                        technical_skills TEXT,
-                        soft_skills TEXT,
-                        programming_languages TEXT,
-                        frameworks TEXT,
-                        database_skills TEXT,
-                        tools TEXT,
-                        total_experience INT DEFAULT 0,
-                        internships TEXT,
-                        projects TEXT,
-                        certifications TEXT,
-                        career_interests TEXT,
-                        preferred_locations TEXT,
-                        salary_expectation INT,
-                        work_mode ENUM('Remote', 'On-site', 'Hybrid'),
-                        tech_stack TEXT,
-                        batch_semester VARCHAR(20),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                """)
-                connection.commit()
-            
-            # Check if profile exists
-            cursor.execute("SELECT id FROM user_profiles WHERE user_id = %s", (user_id,))
-            existing_profile = cursor.fetchone()
-            
-            if existing_profile:
-                # Update existing profile
-                update_fields = []
-                values = []
-                
-                for key, value in data.items():
-                    if key != 'user_id':  # Don't update user_id
-                        update_fields.append(f"{key} = %s")
-                        values.append(value)
-                
-                if update_fields:
-                    values.append(user_id)
-                    query = f"UPDATE user_profiles SET {', '.join(update_fields)} WHERE user_id = %s"
-                    cursor.execute(query, values)
-            else:
-                # Create new profile
-                data['user_id'] = user_id
-                fields = list(data.keys())
-                placeholders = ['%s'] * len(fields)
-                values = list(data.values())
-                
-                query = f"INSERT INTO user_profiles ({', '.join(fields)}) VALUES ({', '.join(placeholders)})"
-                cursor.execute(query, values)
-            
-            connection.commit()
-            
-            # Generate recommendations after profile update (optional)
-            try:
-                generate_recommendations(user_id)
-            except Exception as e:
-                print(f"Warning: Failed to generate recommendations: {e}")
-                # Don't fail the profile update if recommendations fail
-            
-            print("Profile updated successfully")  # Debug log
-            return jsonify({'message': 'Profile updated successfully'}), 200
-            
-        except Error as e:
-            print(f"Database error in profile update: {str(e)}")  # Debug log
-            return jsonify({'error': f'Database error: {str(e)}'}), 500
-        except Exception as e:
-            print(f"General error in profile update: {str(e)}")  # Debug log
-            return jsonify({'error': f'Error updating profile: {str(e)}'}), 500
-        finally:
-            if connection and connection.is_connected():
-                cursor.close()
-                connection.close()
-
-def generate_recommendations(user_id):
-    """Generate job and course recommendations for user"""
-    try:
-        connection = get_db_connection()
-        if not connection:
-            return
-        
-        cursor = connection.cursor(dictionary=True)
-        
-        # Get user profile
-        cursor.execute("SELECT * FROM user_profiles WHERE user_id = %s", (user_id,))
-        profile = cursor.fetchone()
-        
-        if not profile:
-            return
-        
-        # Get all active jobs
-        cursor.execute("SELECT * FROM jobs WHERE status = 'Active'")
-        jobs = cursor.fetchall()
-        
-        # Get all courses
-        cursor.execute("SELECT * FROM courses")
-        courses = cursor.fetchall()
-        
-        # Clear existing recommendations
-        cursor.execute("DELETE FROM recommendations WHERE user_id = %s", (user_id,))
-        
-        # Simple recommendation logic (can be enhanced with ML)
-        user_skills = []
-        if profile['programming_languages']:
-            user_skills.extend(json.loads(profile['programming_languages']))
-        if profile['frameworks']:
-            user_skills.extend(json.loads(profile['frameworks']))
-        if profile['database_skills']:
-            user_skills.extend(json.loads(profile['database_skills']))
-        if profile['tools']:
-            user_skills.extend(json.loads(profile['tools']))
-        
-        user_skills = [skill.lower() for skill in user_skills]
-        
-        # Job recommendations
-        for job in jobs:
-            if job['skills_required']:
-                job_skills = [skill.strip().lower() for skill in job['skills_required'].split(',')]
-                matching_skills = set(user_skills) & set(job_skills)
-                score = len(matching_skills) / len(job_skills) if job_skills else 0
-                
-                if score > 0.2:  # Only recommend if at least 20% match
-                    reason = f"Matches {len(matching_skills)} out of {len(job_skills)} required skills"
-                    cursor.execute(
-                        "INSERT INTO recommendations (user_id, job_id, recommendation_type, score, reason) VALUES (%s, %s, %s, %s, %s)",
-                        (user_id, job['id'], 'job', score, reason)
-                    )
-        
-        # Course recommendations
-        for course in courses:
-            if course['skills_covered']:
-                course_skills = [skill.strip().lower() for skill in course['skills_covered'].split(',')]
-                matching_skills = set(user_skills) & set(course_skills)
-                score = len(matching_skills) / len(course_skills) if course_skills else 0
-                
-                if score < 0.8:  # Recommend courses that don't fully match (for upskilling)
-                    reason = f"Will help you learn {len(course_skills) - len(matching_skills)} new skills"
-                    cursor.execute(
-                        "INSERT INTO recommendations (user_id, course_id, recommendation_type, score, reason) VALUES (%s, %s, %s, %s, %s)",
-                        (user_id, course['id'], 'course', 1 - score, reason)
-                    )
-        
-        connection.commit()
-        
-    except Error as e:
-        print(f"Error generating recommendations: {e}")
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-# Job recommendations and applications
-@app.route('/api/job-recommendations', methods=['GET'])
-def get_job_recommendations():
-    """Get job recommendations for the authenticated user"""
-    if 'user_id' not in session:
-        return jsonify({'error': 'Authentication required'}), 401
-    
-    user_id = session['user_id']
-    
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Get recommended jobs with recommendation details
-        query = """
-            SELECT j.*, r.score as recommendation_score, r.reason as recommendation_reason,
-                   ja.status as application_status, ja.applied_at
-            FROM jobs j
-            LEFT JOIN recommendations r ON j.id = r.job_id AND r.user_id = %s AND r.recommendation_type = 'job'
-            LEFT JOIN job_applications ja ON j.id = ja.job_id AND ja.user_id = %s
-            WHERE j.status = 'Active'
-            ORDER BY r.score DESC, j.created_at DESC
-        """
-        cursor.execute(query, (user_id, user_id))
-        jobs = cursor.fetchall()
-        
-        # Convert to list and add applied flag
-        jobs_list = []
-        for job in jobs:
-            job_dict = dict(job)
-            job_dict['applied'] = job['application_status'] is not None
-            jobs_list.append(job_dict)
-        
-        return jsonify({'jobs': jobs_list}), 200
-        
-    except Error as e:
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/apply-job', methods=['POST'])
-def apply_job():
-    """Apply for a job"""
-    if 'user_id' not in session:
-        return jsonify({'error': 'Authentication required'}), 401
-    
-    user_id = session['user_id']
-    data = request.get_json()
-    job_id = data.get('job_id')
-    
-    if not job_id:
-        return jsonify({'error': 'Job ID is required'}), 400
-    
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor()
-        
-        # Check if job exists and is active
-        cursor.execute("SELECT id, title, company FROM jobs WHERE id = %s AND status = 'Active'", (job_id,))
-        job = cursor.fetchone()
-        
-        if not job:
-            return jsonify({'error': 'Job not found or not available'}), 404
-        
-        # Check if user already applied
-        cursor.execute("SELECT id FROM job_applications WHERE user_id = %s AND job_id = %s", (user_id, job_id))
-        existing_application = cursor.fetchone()
-        
-        if existing_application:
-            return jsonify({'error': 'You have already applied for this job'}), 400
-        
-        # Create application
-        cursor.execute(
-            "INSERT INTO job_applications (user_id, job_id, status) VALUES (%s, %s, %s)",
-            (user_id, job_id, 'Applied')
-        )
-        connection.commit()
-        
-        # Send notification email (placeholder)
-        send_application_notification(user_id, job_id, job[1], job[2])
-        
-        return jsonify({'message': 'Application submitted successfully'}), 201
-        
-    except Error as e:
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
-
-def send_application_notification(user_id, job_id, job_title, company_name):
-    """Send application notification email"""
-    try:
-        # This is a placeholder for email functionality
-        # In a real application, you would integrate with an email service
-        print(f"Application notification: User {user_id} applied for {job_title} at {company_name}")
-        
-        # You can integrate with services like SendGrid, AWS SES, etc.
-        # For now, we'll just log the application
-        
-    except Exception as e:
-        print(f"Error sending notification: {e}")
-
-# Admin routes
-@app.route('/api/admin/jobs', methods=['GET', 'POST'])
-def admin_jobs():
-    """Admin job management"""
-    if 'user_id' not in session or session.get('role') != 'admin':
-        return jsonify({'error': 'Admin access required'}), 403
-    
-    print(f"Admin jobs API called by user {session['user_id']}, method: {request.method}")  # Debug log
-    
-    connection = get_db_connection()
-    if not connection:
-        print("Database connection failed in admin jobs")  # Debug log
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor(dictionary=True)
-        
-        if request.method == 'GET':
-            # Check if jobs table exists
-            cursor.execute("SHOW TABLES LIKE 'jobs'")
-            table_exists = cursor.fetchone()
-            if not table_exists:
-                print("Jobs table does not exist, creating it...")  # Debug log
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS jobs (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        title VARCHAR(200) NOT NULL,
-                        company VARCHAR(100) NOT NULL,
-                        location VARCHAR(100),
-                        job_type ENUM('Full-time', 'Part-time', 'Contract', 'Internship') DEFAULT 'Full-time',
-                        experience_required INT DEFAULT 0,
-                        salary_min INT,
-                        salary_max INT,
-                        description TEXT,
-                        requirements TEXT,
-                        skills_required TEXT,
-                        benefits TEXT,
-                        application_deadline DATE,
-                        status ENUM('Active', 'Inactive', 'Closed') DEFAULT 'Active',
-                        created_by INT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
-                    )
-                """)
-                connection.commit()
-            
-            # Get all jobs
-            cursor.execute("SELECT * FROM jobs ORDER BY created_at DESC")
-            jobs = cursor.fetchall()
-            print(f"Found {len(jobs)} jobs")  # Debug log
-            return jsonify({'jobs': jobs}), 200
-        
-        elif request.method == 'POST':
-            # Create new job
-            data = request.get_json()
-            print(f"Creating job with data: {data}")  # Debug log
-            
-            required_fields = ['title', 'company', 'description']
-            for field in required_fields:
-                if not data.get(field):
-                    return jsonify({'error': f'{field} is required'}), 400
-            
-            cursor.execute("""
-                INSERT INTO jobs (title, company, location, job_type, experience_required, 
-                                salary_min, salary_max, description, requirements, skills_required, 
-                                benefits, application_deadline, created_by)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                data['title'], data['company'], data.get('location'), 
-                data.get('job_type', 'Full-time'), data.get('experience_required', 0),
-                data.get('salary_min'), data.get('salary_max'), data['description'],
-                data.get('requirements'), data.get('skills_required'), data.get('benefits'),
-                data.get('application_deadline'), session['user_id']
-            ))
-            
-            connection.commit()
-            print("Job created successfully")  # Debug log
-            return jsonify({'message': 'Job created successfully'}), 201
-            
-    except Error as e:
-        print(f"Database error in admin jobs: {str(e)}")  # Debug log
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        print(f"General error in admin jobs: {str(e)}")  # Debug log
-        return jsonify({'error': f'Error in admin jobs: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/admin/users', methods=['GET'])
-def admin_users():
-    """Get all users for admin"""
-    if 'user_id' not in session or session.get('role') != 'admin':
-        return jsonify({'error': 'Admin access required'}), 403
-    
-    print(f"Admin users API called by user {session['user_id']}")  # Debug log
-    
-    try:
-        connection = get_db_connection()
-        if not connection:
-            print("Database connection failed in admin users")  # Debug log
-            return jsonify({'error': 'Database connection failed'}), 500
-            
-        cursor = connection.cursor(dictionary=True)
-        
-        # Check if users table exists
-        cursor.execute("SHOW TABLES LIKE 'users'")
-        table_exists = cursor.fetchone()
-        if not table_exists:
-            print("Users table does not exist")  # Debug log
-            return jsonify({'error': 'Users table does not exist'}), 500
-        
-        cursor.execute("SELECT id, username, email, role, created_at FROM users ORDER BY created_at DESC")
-        users = cursor.fetchall()
-        print(f"Found {len(users)} users")  # Debug log
-        return jsonify({'users': users}), 200
-        
-    except Error as e:
-        print(f"Database error in admin users: {str(e)}")  # Debug log
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        print(f"General error in admin users: {str(e)}")  # Debug log
-        return jsonify({'error': f'Error fetching users: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/admin/applications', methods=['GET'])
-def admin_applications():
-    """Get all job applications for admin"""
-    if 'user_id' not in session or session.get('role') != 'admin':
-        return jsonify({'error': 'Admin access required'}), 403
-    
-    print(f"Admin applications API called by user {session['user_id']}")  # Debug log
-    
-    try:
-        connection = get_db_connection()
-        if not connection:
-            print("Database connection failed in admin applications")  # Debug log
-            return jsonify({'error': 'Database connection failed'}), 500
-            
-        cursor = connection.cursor(dictionary=True)
-        
-        # Check if job_applications table exists
-        cursor.execute("SHOW TABLES LIKE 'job_applications'")
-        table_exists = cursor.fetchone()
-        if not table_exists:
-            print("Job applications table does not exist, creating it...")  # Debug log
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS job_applications (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    job_id INT NOT NULL,
-                    status ENUM('Pending', 'Reviewed', 'Accepted', 'Rejected') DEFAULT 'Pending',
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                    UNIQUE KEY unique_application (user_id, job_id)
-                )
-            """)
-            connection.commit()
-        
-        cursor.execute("""
-            SELECT ja.*, u.username, u.email, j.title as job_title, j.company 
-            FROM job_applications ja
-            JOIN users u ON ja.user_id = u.id
-            JOIN jobs j ON ja.job_id = j.id
-            ORDER BY ja.applied_at DESC
-        """)
-        applications = cursor.fetchall()
-        print(f"Found {len(applications)} applications")  # Debug log
-        return jsonify({'applications': applications}), 200
-        
-    except Error as e:
-        print(f"Database error in admin applications: {str(e)}")  # Debug log
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        print(f"General error in admin applications: {str(e)}")  # Debug log
-        return jsonify({'error': f'Error fetching applications: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-# Resume management routes
-@app.route('/api/resume', methods=['GET', 'POST', 'DELETE'])
-def resume_management():
-    """Resume management endpoints"""
-    if 'user_id' not in session:
-        return jsonify({'error': 'Authentication required'}), 401
-    
-    user_id = session['user_id']
-    print(f"Resume API called by user {user_id}, method: {request.method}")  # Debug log
-    
-    if request.method == 'GET':
-        try:
-            connection = get_db_connection()
-            if not connection:
-                return jsonify({'error': 'Database connection failed'}), 500
-                
-            cursor = connection.cursor(dictionary=True)
-            
-            # Check if table exists, create if not
-            cursor.execute("SHOW TABLES LIKE 'user_resumes'")
-            table_exists = cursor.fetchone()
-            if not table_exists:
-                print("user_resumes table does not exist, creating it...")
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS user_resumes (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        user_id INT NOT NULL,
-                        resume_name VARCHAR(255) NOT NULL,
-                        resume_data JSON NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                """)
-                connection.commit()
-            
-            cursor.execute("SELECT * FROM user_resumes WHERE user_id = %s ORDER BY created_at DESC", (user_id,))
-            resumes = cursor.fetchall()
-            
-            # Parse JSON data for each resume
-            for resume in resumes:
-                if resume['resume_data']:
-                    try:
-                        resume['resume_data'] = json.loads(resume['resume_data'])
-                    except:
-                        resume['resume_data'] = {}
-                        
-            return jsonify(resumes), 200
-            
-        except Error as e:
-            print(f"Database error in resume GET: {str(e)}")
-            return jsonify({'error': f'Database error: {str(e)}'}), 500
-        except Exception as e:
-            print(f"General error in resume GET: {str(e)}")
-            return jsonify({'error': f'Error fetching resumes: {str(e)}'}), 500
-        finally:
-            if connection and connection.is_connected():
-                cursor.close()
-                connection.close()
-    
-    elif request.method == 'POST':
-        try:
-            data = request.get_json()
-            print(f"Resume data received: {data}")  # Debug log
-            
-            connection = get_db_connection()
-            if not connection:
-                print("Database connection failed")  # Debug log
-                return jsonify({'error': 'Database connection failed'}), 500
-                
-            cursor = connection.cursor()
-            
-            # Check if table exists
-            cursor.execute("SHOW TABLES LIKE 'user_resumes'")
-            table_exists = cursor.fetchone()
-            if not table_exists:
-                print("user_resumes table does not exist, creating it...")  # Debug log
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS user_resumes (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        user_id INT NOT NULL,
-                        resume_name VARCHAR(255) NOT NULL,
-                        resume_data JSON NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                """)
-                connection.commit()
-            
-            cursor.execute("""
-                INSERT INTO user_resumes (user_id, resume_name, resume_data)
-                VALUES (%s, %s, %s)
-            """, (user_id, data.get('name', 'Resume'), json.dumps(data)))
-            
-            connection.commit()
-            print("Resume saved successfully")  # Debug log
-            return jsonify({'message': 'Resume saved successfully'}), 201
-            
-        except Error as e:
-            print(f"Database error in resume save: {str(e)}")  # Debug log
-            return jsonify({'error': f'Database error: {str(e)}'}), 500
-        except Exception as e:
-            print(f"General error in resume save: {str(e)}")  # Debug log
-            return jsonify({'error': f'Error saving resume: {str(e)}'}), 500
-        finally:
-            if connection and connection.is_connected():
-                cursor.close()
-                connection.close()
-    
-    elif request.method == 'DELETE':
-        try:
-            resume_id = request.args.get('id')
-            if not resume_id:
-                return jsonify({'error': 'Resume ID required'}), 400
-                
-            connection = get_db_connection()
-            if not connection:
-                return jsonify({'error': 'Database connection failed'}), 500
-                
-            cursor = connection.cursor()
-            
-            cursor.execute("DELETE FROM user_resumes WHERE id = %s AND user_id = %s", (resume_id, user_id))
-            
-            if cursor.rowcount == 0:
-                return jsonify({'error': 'Resume not found'}), 404
-                
-            connection.commit()
-            return jsonify({'message': 'Resume deleted successfully'}), 200
-            
-        except Error as e:
-            return jsonify({'error': f'Database error: {str(e)}'}), 500
-        finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
-
-# Test endpoint to verify backend is working
-@app.route('/api/courses', methods=['GET'])
-def get_courses():
-    """Get all available courses"""
-    try:
-        connection = get_db_connection()
-        if not connection:
-            return jsonify({'error': 'Database connection failed'}), 500
-            
-        cursor = connection.cursor(dictionary=True)
-        
-        # Check if table exists, create if not
-        cursor.execute("SHOW TABLES LIKE 'courses'")
-        table_exists = cursor.fetchone()
-        if not table_exists:
-            print("courses table does not exist, creating it...")
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS courses (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(200) NOT NULL,
-                    description TEXT,
-                    provider VARCHAR(100),
-                    duration_weeks INT,
-                    difficulty_level ENUM('Beginner', 'Intermediate', 'Advanced'),
-                    skills_covered TEXT,
-                    course_url VARCHAR(500),
-                    price DECIMAL(10,2) DEFAULT 0,
-                    rating DECIMAL(3,2),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            connection.commit()
-            
-            # Insert sample courses
-            sample_courses = [
-                ('Complete Python Bootcamp', 'Learn Python from scratch to advanced level', 'Udemy', 12, 'Beginner', 'Python, OOP, Data Structures', 'https://udemy.com/python-bootcamp', 2999, 4.5),
-                ('Machine Learning Fundamentals', 'Introduction to ML algorithms and techniques', 'Coursera', 16, 'Intermediate', 'Python, Scikit-learn, TensorFlow', 'https://coursera.org/ml-fundamentals', 0, 4.7),
-                ('React Development', 'Build modern web applications with React', 'GeeksforGeeks', 8, 'Intermediate', 'React, JavaScript, HTML, CSS', 'https://geeksforgeeks.org/react-course', 1999, 4.3),
-                ('Data Science with Python', 'Complete data science course with Python', 'Udemy', 20, 'Advanced', 'Python, Pandas, NumPy, Matplotlib', 'https://udemy.com/data-science-python', 3999, 4.6),
-                ('AWS Cloud Practitioner', 'Learn AWS cloud services and deployment', 'Coursera', 10, 'Beginner', 'AWS, Cloud Computing, EC2, S3', 'https://coursera.org/aws-practitioner', 0, 4.4),
-                ('Web Development Bootcamp', 'Complete web development curriculum', 'FreeCodeCamp', 24, 'Beginner', 'HTML, CSS, JavaScript, React, Node.js', 'https://freecodecamp.org', 0, 4.7),
-                ('Cybersecurity Fundamentals', 'Learn cybersecurity basics and best practices', 'Coursera', 14, 'Intermediate', 'Security, Networking, Cryptography', 'https://coursera.org/cybersecurity', 0, 4.5),
-                ('DevOps Engineering', 'Master DevOps tools and practices', 'Udemy', 18, 'Advanced', 'Docker, Kubernetes, CI/CD, AWS', 'https://udemy.com/devops', 3999, 4.8)
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO courses (title, description, provider, duration_weeks, difficulty_level, skills_covered, course_url, price, rating) 
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, sample_courses)
-            connection.commit()
-            print("Sample courses inserted successfully")
-        
-        cursor.execute("SELECT * FROM courses ORDER BY rating DESC")
-        courses = cursor.fetchall()
-        
-        # Format courses for frontend
-        formatted_courses = []
-        for course in courses:
-            formatted_course = {
-                'id': course['id'],
-                'title': course['title'],
-                'description': course['description'],
-                'provider': course['provider'],
-                'level': course['difficulty_level'],
-                'duration': f"{course['duration_weeks']} weeks",
-                'rating': float(course['rating']) if course['rating'] else 0,
-                'students': 1000 + (course['id'] * 500),  # Mock student count
-                'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
-                'link': course['course_url'],
-                'price': 'Free' if course['price'] == 0 else f"₹{course['price']}"
-            }
-            formatted_courses.append(formatted_course)
-        
-        return jsonify({'courses': formatted_courses}), 200
-        
-    except Error as e:
-        print(f"Database error in courses API: {str(e)}")
-        return jsonify({'error': f'Database error: {str(e)}'}), 500
-    except Exception as e:
-        print(f"General error in courses API: {str(e)}")
-        return jsonify({'error': f'Error fetching courses: {str(e)}'}), 500
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/test', methods=['GET'])
-def test_endpoint():
-    """Test endpoint to verify backend is working"""
-    try:
-        # Test database connection
-        connection = get_db_connection()
-        if connection:
-            cursor = connection.cursor()
-            cursor.execute("SHOW TABLES")
-            tables = cursor.fetchall()
-            cursor.close()
-            connection.close()
-            
-            return jsonify({
-                'status': 'success',
-                'message': 'Backend and database are working',
-                'timestamp': str(datetime.now()),
-                'tables': [table[0] for table in tables]
-            }), 200
-        else:
-            return jsonify({
-                'status': 'error',
-                'message': 'Database connection failed',
-                'timestamp': str(datetime.now())
-            }), 500
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': f'Backend error: {str(e)}',
-            'timestamp': str(datetime.now())
-        }), 500
-
-if __name__ == '__main__':
-    print("Starting Career Platform Backend...")
-    print("Database initialization status:", init_database())
-    app.run(debug=True, host='0.0.0.0', port=5000)
+from flask import Flask, request, jsonify, session, render_template
+from flask_cors import CORS
+from werkzeug.utils import secure_filename
+from mysql.connector import Error
+import os
+from dotenv import load_dotenv
+import json
+from datetime import datetime
+# Note: pandas, numpy, and scikit-learn removed for Windows compatibility
+# Simple recommendation logic will be used instead (the bulk recompute uses
+# numpy/scipy sparse matrices from skill_matrix.py when they are installed)
+import uuid
+from db_pool import ConnectionPool
+import fast_json
+import session_stores
+from password_hasher import PasswordHasher, HasherBusy
+from rate_limit import LoginThrottle
+from catalog_cache import CatalogCache
+from http_cache import make_etag, not_modified, conditional_json, conditional_bytes
+from schema import migrate
+from job_queue import KeyedJobQueue
+from skill_index import SkillIndex
+import data_versions
+from skill_store import load_active_job_skills, load_course_skills, set_job_skills, set_user_skills, backfill as backfill_skills
+import skill_aliases
+from recommendation_writer import write_user_recommendations
+from recommendation_scoring import fetch_user_skills, score_user, load_profile_skills
+from recommendation_batch import BulkRecompute, refresh_job_recommendations
+from text_ranker import TextRanker
+from pagination import parse_limit, list_response
+import admin_lists
+from admin_export import export_response, resume_archive_response
+from job_import import IMPORT_FORMATS, detect_format, read_records, import_jobs
+from resume_pdf import ResumeRenderer, content_hash, parse_resume_data
+from job_search import parse_job_filters, fetch_recommended_jobs, fetch_ranked_jobs, recommendation_version
+import smtplib
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+import io
+import base64
+
+# Load environment variables
+load_dotenv()
+
+app = Flask(__name__)
+app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
+
+# Initialize extensions
+CORS(app, supports_credentials=True)
+
+# Server-side filesystem sessions by default; memory or mysql, or a signed cookie (requires a real SECRET_KEY)
+session_stores.init_app(
+    app,
+    os.getenv('SESSION_BACKEND', 'filesystem'),
+    get_connection=lambda: get_db_connection(),
+    max_entries=int(os.getenv('SESSION_MEMORY_SIZE', 10000)),
+    sweep_interval=int(os.getenv('SESSION_SWEEP_INTERVAL', 300))
+)
+
+# Fast JSON (orjson when installed) and gzip/brotli for responses above the threshold
+fast_json.init_app(app, threshold=int(os.getenv('COMPRESS_MIN_SIZE', 1024)))
+
+# Database configuration
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'database': os.getenv('DB_NAME', 'career_platform'),
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', 'Divya@2004'),
+    'port': int(os.getenv('DB_PORT', 3306))
+}
+
+# Admin credentials
+ADMIN_USERNAME = 'admin'
+ADMIN_PASSWORD = 'admin123'
+
+# Shared connection pool (size and checkout timeout are configurable)
+db_pool = ConnectionPool(
+    DB_CONFIG,
+    size=int(os.getenv('DB_POOL_SIZE', 10)),
+    timeout=float(os.getenv('DB_POOL_TIMEOUT', 5)),
+    health_check_interval=float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+)
+
+# bcrypt runs on a bounded pool; logins beyond PASSWORD_HASH_MAX_PENDING get 429 instead of queueing
+password_hasher = PasswordHasher(
+    workers=int(os.getenv('PASSWORD_HASH_WORKERS', 2)),
+    max_pending=int(os.getenv('PASSWORD_HASH_MAX_PENDING', 16)),
+    rounds=int(os.getenv('BCRYPT_ROUNDS', 12))
+)
+
+# Login attempts per minute: every attempt counts per IP, failed attempts count per username
+login_throttle = LoginThrottle(
+    ip_rate=float(os.getenv('LOGIN_IP_RATE', 20)),
+    ip_burst=int(os.getenv('LOGIN_IP_BURST', 30)),
+    user_rate=float(os.getenv('LOGIN_USERNAME_RATE', 5)),
+    user_burst=int(os.getenv('LOGIN_USERNAME_BURST', 10))
+)
+
+def get_db_connection():
+    """Check out a connection from the shared pool; close() returns it"""
+    try:
+        connection = db_pool.get_connection()
+        return connection
+    except Error as e:
+        print(f"Error connecting to MySQL: {e}")
+        return None
+
+def init_database():
+    """Initialize database tables"""
+    connection = get_db_connection()
+    if not connection:
+        return False
+    
+    try:
+        # Create or upgrade tables (versioned, runs once per schema version)
+        version = migrate(connection)
+        print(f"Database schema at version {version}")
+        
+        # Insert sample data if tables are empty
+        insert_sample_data(connection)
+        
+        return True
+        
+    except Error as e:
+        print(f"Error creating tables: {e}")
+        return False
+    finally:
+        if connection.is_connected():
+            connection.close()
+
+def insert_sample_data(connection):
+    """Insert sample data into the database"""
+    try:
+        cursor = connection.cursor()
+        
+        # Check if users table has any data
+        cursor.execute("SELECT COUNT(*) FROM users")
+        user_count = cursor.fetchone()[0]
+        
+        if user_count == 0:
+            print("Inserting sample users...")
+            # Insert sample users
+            sample_users = [
+                ('john_doe', 'john@example.com', password_hasher.hash('password123'), 'user'),
+                ('jane_smith', 'jane@example.com', password_hasher.hash('password123'), 'user'),
+                ('mike_wilson', 'mike@example.com', password_hasher.hash('password123'), 'user')
+            ]
+            
+            cursor.executemany(
+                "INSERT INTO users (username, email, password_hash, role) VALUES (%s, %s, %s, %s)",
+                sample_users
+            )
+            print("Sample users inserted")
+        
+        # Check if jobs table has any data
+        cursor.execute("SELECT COUNT(*) FROM jobs")
+        job_count = cursor.fetchone()[0]
+        
+        if job_count == 0:
+            print("Inserting sample jobs...")
+            # Insert sample jobs
+            sample_jobs = [
+                ('Software Engineer', 'Tech Corp', 'Bangalore', 'Full-time', 2, 600000, 1200000, 
+                 'We are looking for a skilled software engineer to join our team.', 
+                 'Bachelor degree in Computer Science or related field', 
+                 'Python, JavaScript, React, Node.js', 'Health insurance, flexible hours', '2024-12-31'),
+                ('Data Scientist', 'Data Analytics Inc', 'Mumbai', 'Full-time', 3, 800000, 1500000, 
+                 'Join our data science team to work on exciting ML projects.', 
+                 'Master degree in Data Science or related field', 
+                 'Python, Machine Learning, SQL, Statistics', 'Remote work, learning budget', '2024-12-31'),
+                ('Frontend Developer', 'Web Solutions', 'Delhi', 'Full-time', 1, 400000, 800000, 
+                 'Create amazing user interfaces for our web applications.', 
+                 'Bachelor degree in Computer Science', 
+                 'HTML, CSS, JavaScript, React, Vue.js', 'Team events, gym membership', '2024-12-31')
+            ]
+            
+            cursor.executemany(
+                """INSERT INTO jobs (title, company, location, job_type, experience_required, 
+                                   salary_min, salary_max, description, requirements, skills_required, 
+                                   benefits, application_deadline) 
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+                sample_jobs
+            )
+            print("Sample jobs inserted")
+        
+        # Check if courses table has any data
+        cursor.execute("SELECT COUNT(*) FROM courses")
+        course_count = cursor.fetchone()[0]
+        
+        if course_count == 0:
+            print("Inserting sample courses...")
+            sample_courses = [
+                ('Complete Python Bootcamp', 'Learn Python from scratch to advanced level', 'Udemy', 12, 'Beginner', 'Python, OOP, Data Structures', 'https://udemy.com/python-bootcamp', 2999, 4.5),
+                ('Machine Learning Fundamentals', 'Introduction to ML algorithms and techniques', 'Coursera', 16, 'Intermediate', 'Python, Scikit-learn, TensorFlow', 'https://coursera.org/ml-fundamentals', 0, 4.7),
+                ('React Development', 'Build modern web applications with React', 'GeeksforGeeks', 8, 'Intermediate', 'React, JavaScript, HTML, CSS', 'https://geeksforgeeks.org/react-course', 1999, 4.3),
+                ('Data Science with Python', 'Complete data science course with Python', 'Udemy', 20, 'Advanced', 'Python, Pandas, NumPy, Matplotlib', 'https://udemy.com/data-science-python', 3999, 4.6),
+                ('AWS Cloud Practitioner', 'Learn AWS cloud services and deployment', 'Coursera', 10, 'Beginner', 'AWS, Cloud Computing, EC2, S3', 'https://coursera.org/aws-practitioner', 0, 4.4),
+                ('Web Development Bootcamp', 'Complete web development curriculum', 'FreeCodeCamp', 24, 'Beginner', 'HTML, CSS, JavaScript, React, Node.js', 'https://freecodecamp.org', 0, 4.7),
+                ('Cybersecurity Fundamentals', 'Learn cybersecurity basics and best practices', 'Coursera', 14, 'Intermediate', 'Security, Networking, Cryptography', 'https://coursera.org/cybersecurity', 0, 4.5),
+                ('DevOps Engineering', 'Master DevOps tools and practices', 'Udemy', 18, 'Advanced', 'Docker, Kubernetes, CI/CD, AWS', 'https://udemy.com/devops', 3999, 4.8)
+            ]
+            
+            cursor.executemany("""
+                INSERT INTO courses (title, description, provider, duration_weeks, difficulty_level, skills_covered, course_url, price, rating) 
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, sample_courses)
+            print("Sample courses inserted")
+        
+        if job_count == 0 or course_count == 0:
+            # Seeded rows were written after the skills migration ran
+            backfill_skills(cursor)
+        
+        connection.commit()
+        print("Sample data insertion completed")
+        
+    except Error as e:
+        print(f"Error inserting sample data: {e}")
+    finally:
+        if connection.is_connected():
+            cursor.close()
+
+# Initialize database on startup
+init_database()
+
+# Authentication routes
+@app.route('/api/register', methods=['POST'])
+def register():
+    """User registration endpoint"""
+    connection = None
+    try:
+        data = request.get_json(silent=True) or {}
+        username = data.get('username')
+        email = data.get('email')
+        password = data.get('password')
+        
+        print(f"Registration attempt: username={username}, email={email}")
+        
+        if not all([username, email, password]):
+            return jsonify({'error': 'All fields are required'}), 400
+        if not all(isinstance(value, str) for value in (username, email, password)):
+            return jsonify({'error': 'Username, email and password must be strings'}), 400
+        
+        # Hash before taking a pooled connection so bcrypt time never holds one
+        password_hash = password_hasher.hash(password)
+        
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = connection.cursor()
+        
+        # Check if user already exists
+        cursor.execute("SELECT id FROM users WHERE username = %s OR email = %s", (username, email))
+        if cursor.fetchone():
+            return jsonify({'error': 'Username or email already exists'}), 400
+        
+        # Insert new user
+        cursor.execute(
+            "INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
+            (username, email, password_hash)
+        )
+        connection.commit()
+        
+        return jsonify({'message': 'User registered successfully'}), 201
+        
+    except HasherBusy as e:
+        return jsonify({'error': str(e)}), 429, {'Retry-After': '1'}
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        return jsonify({'error': f'Registration failed: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/login', methods=['POST'])
+def login():
+    """User login endpoint"""
+    connection = None
+    try:
+        data = request.get_json()
+        username = data.get('username')
+        password = data.get('password')
+        
+        if not all([username, password]):
+            return jsonify({'error': 'Username and password are required'}), 400
+        if not isinstance(username, str) or not isinstance(password, str):
+            return jsonify({'error': 'Username and password must be strings'}), 400
+        
+        # Throttle before any DB or bcrypt work
+        retry_after = login_throttle.check(request.remote_addr, username)
+        if retry_after:
+            return jsonify({'error': 'Too many login attempts, please try again later'}), 429, {'Retry-After': str(retry_after)}
+        
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = connection.cursor(dictionary=True)
+        
+        # Check admin credentials first
+        if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
+            session['user_id'] = 'admin'
+            session['username'] = username
+            session['role'] = 'admin'
+            print("Admin login successful")
+            return jsonify({
+                'message': 'Admin login successful',
+                'user': {'id': 'admin', 'username': username, 'role': 'admin'}
+            }), 200
+        
+        # Check user credentials
+        cursor.execute(
+            "SELECT id, username, email, password_hash, role FROM users WHERE username = %s",
+            (username,)
+        )
+        user = cursor.fetchone()
+        print(f"User found: {user}")
+        
+        if user and password_hasher.verify(password, user['password_hash']):
+            print("User login successful")
+            # Re-hash with the current BCRYPT_ROUNDS while the plain password is at hand
+            new_hash = password_hasher.upgrade(password, user['password_hash'])
+            if new_hash:
+                cursor.execute("UPDATE users SET password_hash = %s WHERE id = %s", (new_hash, user['id']))
+                connection.commit()
+            session['user_id'] = user['id']
+            session['username'] = user['username']
+            session['role'] = user['role']
+            return jsonify({
+                'message': 'Login successful',
+                'user': {
+                    'id': user['id'],
+                    'username': user['username'],
+                    'email': user['email'],
+                    'role': user['role']
+                }
+            }), 200
+        else:
+            login_throttle.failed(username)
+            return jsonify({'error': 'Invalid credentials'}), 401
+            
+    except HasherBusy as e:
+        return jsonify({'error': str(e)}), 429, {'Retry-After': '1'}
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        return jsonify({'error': f'Login failed: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/logout', methods=['POST'])
+def logout():
+    """User logout endpoint"""
+    session.clear()
+    return jsonify({'message': 'Logged out successfully'}), 200
+
+@app.route('/api/check-auth', methods=['GET'])
+def check_auth():
+    """Check if user is authenticated"""
+    if 'user_id' in session:
+        return jsonify({
+            'authenticated': True,
+            'user': {
+                'id': session['user_id'],
+                'username': session['username'],
+                'role': session['role']
+            }
+        }), 200
+    return jsonify({'authenticated': False}), 401
+
+# Profile management routes
+@app.route('/api/profile', methods=['GET', 'POST', 'PUT'])
+def profile():
+    """Get or update user profile"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    user_id = session['user_id']
+    print(f"Profile API called by user {user_id}, method: {request.method}")  # Debug log
+    
+    if request.method == 'GET':
+        # Get user profile
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        try:
+            cursor = connection.cursor(dictionary=True)
+            
+            # Answer 304 from the row version before reading and decoding the profile
+            cursor.execute("SELECT id, row_version FROM user_profiles WHERE user_id = %s", (user_id,))
+            version = cursor.fetchone()
+            if version:
+                etag = make_etag('profile', user_id, version['id'], version['row_version'])
+                response = not_modified(etag)
+                if response:
+                    return response
+            
+            cursor.execute("SELECT * FROM user_profiles WHERE user_id = %s", (user_id,))
+            profile = cursor.fetchone()
+            
+            if profile:
+                # Convert JSON strings back to lists for skills
+                for skill_field in ['technical_skills', 'soft_skills', 'programming_languages', 
+                                  'frameworks', 'database_skills', 'tools']:
+                    if profile[skill_field]:
+                        try:
+                            profile[skill_field] = json.loads(profile[skill_field])
+                        except:
+                            profile[skill_field] = []
+                    else:
+                        profile[skill_field] = []
+                
+                etag = make_etag('profile', user_id, profile['id'], profile['row_version'])
+                return conditional_json(profile, etag)
+            else:
+                return jsonify({'message': 'Profile not found'}), 404
+                
+        except Error as e:
+            return jsonify({'error': f'Database error: {str(e)}'}), 500
+        finally:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+    
+    elif request.method in ['POST', 'PUT']:
+        # Create or update user profile
+        data = request.get_json()
+        print(f"Profile update data received: {data}")  # Debug log
+        
+        # Handle empty date values
+        if 'date_of_birth' in data and data['date_of_birth'] == '':
+            data['date_of_birth'] = None
+        
+        # Handle empty numeric values
+        if 'graduation_year' in data and data['graduation_year'] == '':
+            data['graduation_year'] = None
+        
+        if 'salary_expectation' in data and data['salary_expectation'] == '':
+            data['salary_expectation'] = None
+        
+        if 'total_experience' in data and data['total_experience'] == '':
+            data['total_experience'] = 0
+        
+        # Handle work_mode enum validation
+        if 'work_mode' in data and data['work_mode'] not in ['Remote', 'On-site', 'Hybrid']:
+            data['work_mode'] = None
+        
+        # Handle gender enum validation
+        if 'gender' in data and data['gender'] not in ['Male', 'Female', 'Other']:
+            data['gender'] = None
+        
+        # Handle batch_semester length validation
+        if 'batch_semester' in data and data['batch_semester']:
+            if len(str(data['batch_semester'])) > 20:
+                data['batch_semester'] = str(data['batch_semester'])[:20]
+        
+        # Remove any datetime fields that might cause issues
+        datetime_fields = ['created_at', 'updated_at', 'savedAt']
+        for field in datetime_fields:
+            if field in data:
+                del data[field]
+        data.pop('row_version', None)  # maintained by the server
+        
+        # Convert skills lists to JSON strings
+        for skill_field in ['technical_skills', 'soft_skills', 'programming_languages', 
+                          'frameworks', 'database_skills', 'tools']:
+            if skill_field in data and isinstance(data[skill_field], list):
+                data[skill_field] = json.dumps(data[skill_field])
+        
+        connection = get_db_connection()
+        if not connection:
+            print("Database connection failed in profile update")  # Debug log
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        try:
+            cursor = connection.cursor()
+            
+            # Check if profile exists
+            cursor.execute("SELECT id FROM user_profiles WHERE user_id = %s", (user_id,))
+            existing_profile = cursor.fetchone()
+            
+            if existing_profile:
+                # Update existing profile
+                update_fields = []
+                values = []
+                
+                for key, value in data.items():
+                    if key != 'user_id':  # Don't update user_id
+                        update_fields.append(f"{key} = %s")
+                        values.append(value)
+                
+                if update_fields:
+                    # Bumped on every save so the ETag changes even within the same second
+                    update_fields.append("row_version = row_version + 1")
+                    values.append(user_id)
+                    query = f"UPDATE user_profiles SET {', '.join(update_fields)} WHERE user_id = %s"
+                    cursor.execute(query, values)
+            else:
+                # Create new profile
+                data['user_id'] = user_id
+                fields = list(data.keys())
+                placeholders = ['%s'] * len(fields)
+                values = list(data.values())
+                
+                query = f"INSERT INTO user_profiles ({', '.join(fields)}) VALUES ({', '.join(placeholders)})"
+                cursor.execute(query, values)
+            
+            set_user_skills(cursor, user_id, data)
+            connection.commit()
+            
+            # Rebuild recommendations in the background (optional)
+            try:
+                job_status = recommendation_queue.submit(user_id)
+                recommendations_status = job_status['state']
+            except Exception as e:
+                print(f"Warning: Failed to queue recommendations: {e}")
+                recommendations_status = 'failed'
+                # Don't fail the profile update if recommendations fail
+            
+            print("Profile updated successfully")  # Debug log
+            return jsonify({
+                'message': 'Profile updated successfully',
+                'recommendations_status': recommendations_status
+            }), 200
+            
+        except Error as e:
+            print(f"Database error in profile update: {str(e)}")  # Debug log
+            return jsonify({'error': f'Database error: {str(e)}'}), 500
+        except Exception as e:
+            print(f"General error in profile update: {str(e)}")  # Debug log
+            return jsonify({'error': f'Error updating profile: {str(e)}'}), 500
+        finally:
+            if connection and connection.is_connected():
+                cursor.close()
+                connection.close()
+
+# In-process skill indexes used to find matching jobs and courses
+job_index = SkillIndex(load_active_job_skills, name='jobs')
+course_index = SkillIndex(load_course_skills, name='courses')
+user_index = SkillIndex(load_profile_skills, name='users')
+
+def generate_recommendations(user_id):
+    """Generate job and course recommendations for user"""
+    try:
+        connection = get_db_connection()
+        if not connection:
+            return
+        
+        cursor = connection.cursor()
+        
+        # Get user profile
+        cursor.execute("SELECT id FROM user_profiles WHERE user_id = %s", (user_id,))
+        profile = cursor.fetchone()
+        
+        if not profile:
+            return
+        
+        # Load the skill indexes once per process
+        job_index.ensure_loaded(connection)
+        course_index.ensure_loaded(connection)
+        
+        # Simple recommendation logic (can be enhanced with ML)
+        user_skills = fetch_user_skills(cursor, user_id)
+        user_index.set_item(user_id, user_skills)
+        recommendation_rows = score_user(user_id, user_skills, job_index, course_index)
+        
+        # Persist only the rows that changed, in batched statements
+        write_cursor = connection.cursor()
+        try:
+            write_user_recommendations(write_cursor, user_id, recommendation_rows)
+        finally:
+            write_cursor.close()
+        
+        connection.commit()
+        
+    except Error as e:
+        print(f"Error generating recommendations: {e}")
+        raise
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+# Recommendations are rebuilt by background workers so profile saves return immediately
+recommendation_queue = KeyedJobQueue(
+    generate_recommendations,
+    workers=int(os.getenv('RECOMMENDATION_WORKERS', 2)),
+    name='recommendations'
+)
+
+def refresh_job(job_id):
+    """Recompute one job's (or a tuple of imported jobs') recommendations across all users"""
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    try:
+        job_ids = list(job_id) if isinstance(job_id, tuple) else [job_id]
+        refresh_job_recommendations(connection, job_ids, job_index, user_index)
+    finally:
+        connection.close()
+
+# Single job changes only touch that job's rows, in the background
+job_refresh_queue = KeyedJobQueue(
+    refresh_job,
+    workers=int(os.getenv('JOB_REFRESH_WORKERS', 1)),
+    name='job-recommendations'
+)
+
+# Formatted course catalog, cached in-process for CATALOG_CACHE_TTL seconds
+catalog_cache = CatalogCache(
+    ttl=float(os.getenv('CATALOG_CACHE_TTL', 300)),
+    max_entries=int(os.getenv('CATALOG_CACHE_SIZE', 1000))
+)
+
+# Resume PDFs: rendered in a process pool, cached on disk by content hash
+resume_renderer = ResumeRenderer(
+    os.getenv('RESUME_PDF_CACHE_DIR', 'pdf_cache'),
+    processes=int(os.getenv('RESUME_PDF_PROCESSES', 2)),
+    max_files=int(os.getenv('RESUME_PDF_CACHE_FILES', 1000))
+)
+
+def load_course_catalog():
+    """Query and format every course for the catalog page"""
+    connection = get_db_connection()
+    if not connection:
+        raise Error(msg='Database connection failed')
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM courses ORDER BY rating DESC")
+        courses = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+    
+    # Format courses for frontend
+    formatted_courses = []
+    for course in courses:
+        formatted_course = {
+            'id': course['id'],
+            'title': course['title'],
+            'description': course['description'],
+            'provider': course['provider'],
+            'level': course['difficulty_level'],
+            'duration': f"{course['duration_weeks']} weeks",
+            'rating': float(course['rating']) if course['rating'] else 0,
+            'students': 1000 + (course['id'] * 500),  # Mock student count
+            'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
+            'link': course['course_url'],
+            'price': 'Free' if course['price'] == 0 else f"₹{course['price']}"
+        }
+        formatted_courses.append(formatted_course)
+    return formatted_courses
+
+def update_text_model(action):
+    """Refit ('fit') or incrementally update ('sync') the TF-IDF job model"""
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    try:
+        if action == 'fit':
+            text_ranker.fit(connection)
+        else:
+            text_ranker.sync(connection)
+    finally:
+        connection.close()
+
+# Weight of the text similarity in 'hybrid' ranking (the rest is the skill score)
+TEXT_RANK_WEIGHT = float(os.getenv('TEXT_RANK_WEIGHT', 0.5))
+
+# TF-IDF model of job descriptions, memory-mapped from disk; fits only ever run in the background
+text_ranker = TextRanker(os.getenv('TEXT_MODEL_DIR', 'model_cache'))
+text_model_queue = KeyedJobQueue(update_text_model, workers=1, name='text-model')
+if text_ranker.available:
+    if text_ranker.load():
+        text_model_queue.submit('sync')
+    else:
+        text_model_queue.submit('fit')
+
+# Full recompute for every user (admin-triggered or on a schedule)
+bulk_recompute = BulkRecompute(
+    get_db_connection,
+    job_index,
+    course_index,
+    chunk_size=int(os.getenv('RECOMMENDATION_RECOMPUTE_CHUNK_SIZE', 500)),
+    processes=int(os.getenv('RECOMMENDATION_RECOMPUTE_PROCESSES', os.cpu_count() or 1)),
+    engine=os.getenv('RECOMMENDATION_ENGINE', 'auto'),
+    top_k=int(os.getenv('RECOMMENDATION_TOP_K', 0))
+)
+
+def rebuild_skills(_):
+    """Re-canonicalize the skill join tables from the text columns after an alias reload"""
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    cursor = connection.cursor()
+    try:
+        backfill_skills(cursor)
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+    for index in (job_index, course_index, user_index):
+        index.invalidate()
+    bulk_recompute.start()
+
+skill_rebuild_queue = KeyedJobQueue(rebuild_skills, workers=1, name='skills')
+
+recompute_interval = int(os.getenv('RECOMMENDATION_RECOMPUTE_INTERVAL', 0))
+if recompute_interval > 0:
+    bulk_recompute.schedule(recompute_interval)
+
+@app.route('/api/recommendations/status', methods=['GET'])
+def recommendations_status():
+    """Get the state of the user's background recommendation job"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    status = recommendation_queue.status(session['user_id'])
+    if not status:
+        return jsonify({'state': 'idle'}), 200
+    return jsonify(status), 200
+
+# Job recommendations and applications
+@app.route('/api/job-recommendations', methods=['GET'])
+def get_job_recommendations():
+    """Get job recommendations for the authenticated user"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    user_id = session['user_id']
+    
+    # Ranking mode: skill overlap (default), TF-IDF text similarity, or a blend of both
+    rank = request.args.get('rank', 'skills')
+    if rank not in ('skills', 'text', 'hybrid'):
+        return jsonify({'error': 'rank must be one of skills, text, hybrid'}), 400
+    
+    # Filters and keyset pagination: ?limit=&cursor=&location=&job_type=&salary_min=&salary_max=&experience=&q=
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        filters = parse_job_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    after = request.args.get('cursor')
+    
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'error': 'Database connection failed'}), 500
+    
+    try:
+        cursor = connection.cursor(dictionary=True)
+        
+        # Unchanged data and query: answer 304 before ranking or serializing anything
+        etag = make_etag('job-recommendations', user_id, recommendation_version(cursor, user_id),
+                         request.query_string.decode('utf-8'),
+                         text_ranker.get_stats() if rank != 'skills' else None)
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        if rank != 'skills' and text_ranker.ready:
+            cursor.execute("SELECT * FROM user_profiles WHERE user_id = %s", (user_id,))
+            profile = cursor.fetchone()
+            text_scores = text_ranker.score(profile) if profile else {}
+            
+            def match_score(job_id, skill_score):
+                text_score = text_scores.get(job_id, 0.0)
+                if rank == 'text':
+                    return text_score
+                return TEXT_RANK_WEIGHT * text_score + (1 - TEXT_RANK_WEIGHT) * skill_score
+            
+            jobs_list, next_cursor = fetch_ranked_jobs(cursor, user_id, filters, limit, after, match_score)
+            for job_dict in jobs_list:
+                job_dict['text_score'] = round(text_scores.get(job_dict['id'], 0.0), 4)
+        else:
+            rank = 'skills'
+            jobs_list, next_cursor = fetch_recommended_jobs(cursor, user_id, filters, limit, after)
+        
+        return conditional_json({
+            'jobs': jobs_list,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
+            'rank': rank
+        }, etag)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    finally:
+        if connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/apply-job', methods=['POST'])
+def apply_job():
+    """Apply for a job"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    user_id = session['user_id']
+    data = request.get_json()
+    job_id = data.get('job_id')
+    
+    if not job_id:
+        return jsonify({'error': 'Job ID is required'}), 400
+    
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'error': 'Database connection failed'}), 500
+    
+    try:
+        cursor = connection.cursor()
+        
+        # Check if job exists and is active
+        cursor.execute("SELECT id, title, company FROM jobs WHERE id = %s AND status = 'Active'", (job_id,))
+        job = cursor.fetchone()
+        
+        if not job:
+            return jsonify({'error': 'Job not found or not available'}), 404
+        
+        # Check if user already applied
+        cursor.execute("SELECT id FROM job_applications WHERE user_id = %s AND job_id = %s", (user_id, job_id))
+        existing_application = cursor.fetchone()
+        
+        if existing_application:
+            return jsonify({'error': 'You have already applied for this job'}), 400
+        
+        # Create application
+        cursor.execute(
+            "INSERT INTO job_applications (user_id, job_id, status) VALUES (%s, %s, %s)",
+            (user_id, job_id, 'Applied')
+        )
+        connection.commit()
+        
+        # Send notification email (placeholder)
+        send_application_notification(user_id, job_id, job[1], job[2])
+        
+        return jsonify({'message': 'Application submitted successfully'}), 201
+        
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    finally:
+        if connection.is_connected():
+            cursor.close()
+            connection.close()
+
+def send_application_notification(user_id, job_id, job_title, company_name):
+    """Send application notification email"""
+    try:
+        # This is a placeholder for email functionality
+        # In a real application, you would integrate with an email service
+        print(f"Application notification: User {user_id} applied for {job_title} at {company_name}")
+        
+        # You can integrate with services like SendGrid, AWS SES, etc.
+        # For now, we'll just log the application
+        
+    except Exception as e:
+        print(f"Error sending notification: {e}")
+
+# Admin routes
+@app.route('/api/admin/jobs', methods=['GET', 'POST', 'PUT', 'DELETE'])
+def admin_jobs():
+    """Admin job management"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    print(f"Admin jobs API called by user {session['user_id']}, method: {request.method}")  # Debug log
+    
+    connection = get_db_connection()
+    if not connection:
+        print("Database connection failed in admin jobs")  # Debug log
+        return jsonify({'error': 'Database connection failed'}), 500
+    
+    try:
+        cursor = connection.cursor(dictionary=True)
+        
+        if request.method == 'GET':
+            # One page of jobs (?limit=&cursor=&sort=&fields=&status=&job_type=&company=&location=&q=&count=1)
+            page = admin_lists.JOBS.fetch(cursor, request.args)
+            print(f"Found {len(page['items'])} jobs")  # Debug log
+            return jsonify(list_response('jobs', page)), 200
+        
+        elif request.method == 'POST':
+            # Create new job
+            data = request.get_json()
+            print(f"Creating job with data: {data}")  # Debug log
+            
+            required_fields = ['title', 'company', 'description']
+            for field in required_fields:
+                if not data.get(field):
+                    return jsonify({'error': f'{field} is required'}), 400
+            
+            cursor.execute("""
+                INSERT INTO jobs (title, company, location, job_type, experience_required, 
+                                salary_min, salary_max, description, requirements, skills_required, 
+                                benefits, application_deadline, created_by)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                data['title'], data['company'], data.get('location'), 
+                data.get('job_type', 'Full-time'), data.get('experience_required', 0),
+                data.get('salary_min'), data.get('salary_max'), data['description'],
+                data.get('requirements'), data.get('skills_required'), data.get('benefits'),
+                data.get('application_deadline'), session['user_id']
+            ))
+            
+            job_id = cursor.lastrowid
+            set_job_skills(cursor, [(job_id, data.get('skills_required'))])
+            data_versions.bump(cursor, [data_versions.JOBS])
+            connection.commit()
+            job_index.set_item(job_id, data.get('skills_required'))
+            job_refresh_queue.submit(job_id)
+            text_model_queue.submit('sync')
+            print("Job created successfully")  # Debug log
+            return jsonify({'message': 'Job created successfully'}), 201
+        
+        elif request.method == 'PUT':
+            # Update existing job
+            data = request.get_json()
+            job_id = data.get('id')
+            
+            if not job_id:
+                return jsonify({'error': 'Job ID is required'}), 400
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Job ID must be an integer'}), 400
+            
+            cursor.execute("""
+                UPDATE jobs SET title=%s, company=%s, location=%s, job_type=%s,
+                              experience_required=%s, salary_min=%s, salary_max=%s,
+                              description=%s, requirements=%s, skills_required=%s,
+                              benefits=%s, application_deadline=%s, status=%s
+                WHERE id=%s
+            """, (
+                data['title'], data.get('company', ''), data.get('location', ''),
+                data.get('job_type', 'Full-time'), data.get('experience_required', 0),
+                data.get('salary_min'), data.get('salary_max'), data['description'],
+                data.get('requirements', ''), data.get('skills_required', ''),
+                data.get('benefits', ''), data.get('application_deadline'),
+                data.get('status', 'Active'), job_id
+            ))
+            
+            set_job_skills(cursor, [(job_id, data.get('skills_required', ''))])
+            data_versions.bump(cursor, [data_versions.JOBS])
+            connection.commit()
+            job_index.set_item(job_id, data.get('skills_required', ''),
+                               active=data.get('status', 'Active') == 'Active')
+            job_refresh_queue.submit(job_id)
+            text_model_queue.submit('sync')
+            print(f"Job {job_id} updated successfully")  # Debug log
+            return jsonify({'message': 'Job updated successfully'}), 200
+        
+        elif request.method == 'DELETE':
+            # Delete job (its recommendations go with it)
+            job_id = request.args.get('id')
+            
+            if not job_id:
+                return jsonify({'error': 'Job ID is required'}), 400
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Job ID must be an integer'}), 400
+            
+            cursor.execute("DELETE FROM jobs WHERE id=%s", (job_id,))
+            data_versions.bump(cursor, [data_versions.JOBS])
+            connection.commit()
+            job_index.remove(job_id)
+            job_refresh_queue.submit(job_id)
+            text_model_queue.submit('sync')
+            print(f"Job {job_id} deleted successfully")  # Debug log
+            return jsonify({'message': 'Job deleted successfully'}), 200
+            
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Error as e:
+        print(f"Database error in admin jobs: {str(e)}")  # Debug log
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        print(f"General error in admin jobs: {str(e)}")  # Debug log
+        return jsonify({'error': f'Error in admin jobs: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/admin/recommendations/recompute', methods=['GET', 'POST'])
+def admin_recompute_recommendations():
+    """Start a full recommendation recompute or check its progress"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    if request.method == 'POST':
+        if not bulk_recompute.start():
+            return jsonify({'error': 'A recompute is already running', 'progress': bulk_recompute.progress()}), 409
+        print(f"Bulk recommendation recompute started by {session['user_id']}")  # Debug log
+        return jsonify({'message': 'Recompute started', 'progress': bulk_recompute.progress()}), 202
+    
+    return jsonify({'progress': bulk_recompute.progress()}), 200
+
+@app.route('/api/admin/text-model', methods=['POST'])
+def admin_refit_text_model():
+    """Queue a full refit of the TF-IDF job model"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    if not text_ranker.available:
+        return jsonify({'error': 'scikit-learn is not installed'}), 501
+    
+    status = text_model_queue.submit('fit')
+    return jsonify({'message': 'Text model refit queued', 'status': status}), 202
+
+@app.route('/api/admin/users', methods=['GET'])
+def admin_users():
+    """Get all users for admin"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    print(f"Admin users API called by user {session['user_id']}")  # Debug log
+    
+    try:
+        connection = get_db_connection()
+        if not connection:
+            print("Database connection failed in admin users")  # Debug log
+            return jsonify({'error': 'Database connection failed'}), 500
+            
+        cursor = connection.cursor(dictionary=True)
+        
+        # One page of users (?limit=&cursor=&sort=&fields=&role=&q=&created_after=&created_before=&count=1)
+        page = admin_lists.USERS.fetch(cursor, request.args)
+        print(f"Found {len(page['items'])} users")  # Debug log
+        return jsonify(list_response('users', page)), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Error as e:
+        print(f"Database error in admin users: {str(e)}")  # Debug log
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        print(f"General error in admin users: {str(e)}")  # Debug log
+        return jsonify({'error': f'Error fetching users: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/admin/applications', methods=['GET'])
+def admin_applications():
+    """Get all job applications for admin"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    print(f"Admin applications API called by user {session['user_id']}")  # Debug log
+    
+    try:
+        connection = get_db_connection()
+        if not connection:
+            print("Database connection failed in admin applications")  # Debug log
+            return jsonify({'error': 'Database connection failed'}), 500
+            
+        cursor = connection.cursor(dictionary=True)
+        
+        # One page of applications (?limit=&cursor=&sort=&fields=&status=&job_id=&user_id=&q=&count=1)
+        page = admin_lists.APPLICATIONS.fetch(cursor, request.args)
+        print(f"Found {len(page['items'])} applications")  # Debug log
+        return jsonify(list_response('applications', page)), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Error as e:
+        print(f"Database error in admin applications: {str(e)}")  # Debug log
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        print(f"General error in admin applications: {str(e)}")  # Debug log
+        return jsonify({'error': f'Error fetching applications: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+@app.route('/api/admin/jobs/import', methods=['POST'])
+def admin_import_jobs():
+    """Bulk import jobs from a CSV, JSON or NDJSON upload (multipart `file` or raw body, ?format=)"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    upload = request.files.get('file')
+    feed_format = request.args.get('format') or detect_format(
+        upload.filename if upload else None, upload.content_type if upload else request.content_type)
+    if feed_format not in IMPORT_FORMATS:
+        return jsonify({'error': f"format must be one of {', '.join(IMPORT_FORMATS)}"}), 400
+    
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'error': 'Database connection failed'}), 500
+    try:
+        stream = upload.stream if upload else request.stream
+        # The built-in admin login has no users row ('admin'), so its imports have no creator
+        created_by = session['user_id'] if isinstance(session['user_id'], int) else None
+        result = import_jobs(connection, read_records(stream, feed_format), created_by,
+                             batch_size=int(os.getenv('JOB_IMPORT_BATCH_SIZE', 500)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    finally:
+        connection.close()
+    
+    if result['job_ids']:
+        for job_id in result['job_ids']:
+            job_index.set_item(job_id, result['skills'].get(job_id, ''), active=job_id in result['skills'])
+        # One incremental refresh for the whole import
+        job_refresh_queue.submit(tuple(result['job_ids']))
+        text_model_queue.submit('sync')
+    print(f"Imported {result['inserted']} jobs for admin {session['user_id']}")  # Debug log
+    
+    return jsonify({
+        'inserted': result['inserted'],
+        'failed': result['failed'],
+        'errors': result['errors'],
+        'errors_truncated': result['errors_truncated'],
+        'job_ids': result['job_ids'],
+        'read_error': result['read_error']
+    }), 201 if result['inserted'] else 400
+
+@app.route('/api/admin/skill-aliases', methods=['GET', 'POST'])
+def admin_skill_aliases():
+    """Show the skill alias table, or reload it and re-canonicalize stored skills in the background"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    if request.method == 'POST':
+        try:
+            stats = skill_aliases.reload()
+        except (OSError, ValueError) as e:
+            return jsonify({'error': f'Could not load skill aliases: {e}'}), 400
+        status = skill_rebuild_queue.submit('rebuild')
+        print(f"Skill aliases reloaded by {session['user_id']}")  # Debug log
+        return jsonify({'message': 'Skill aliases reloaded', 'aliases': stats, 'rebuild': status}), 202
+    
+    return jsonify({'aliases': skill_aliases.get_stats(), 'rebuild': skill_rebuild_queue.get_stats()}), 200
+
+@app.route('/api/admin/jobs/<int:job_id>/resumes', methods=['GET'])
+def admin_job_resumes(job_id):
+    """ZIP of every applicant's latest resume as PDF, streamed as the renders finish"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    try:
+        response = resume_archive_response(job_id, get_db_connection, resume_renderer,
+                                           chunk_size=int(os.getenv('EXPORT_CHUNK_SIZE', 1000)))
+    except Exception as e:
+        return jsonify({'error': f'Error building resume archive: {str(e)}'}), 500
+    if response is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return response
+
+@app.route('/api/admin/export/<string:dataset>', methods=['GET'])
+def admin_export(dataset):
+    """Stream users or job applications as CSV, NDJSON or JSON (?format=csv|ndjson|json plus list filters)"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    list_queries = {'users': admin_lists.USERS, 'applications': admin_lists.APPLICATIONS}
+    if dataset not in list_queries:
+        return jsonify({'error': 'dataset must be users or applications'}), 404
+    
+    try:
+        return export_response(list_queries[dataset], request.args, get_db_connection, dataset,
+                               chunk_size=int(os.getenv('EXPORT_CHUNK_SIZE', 1000)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/admin/courses', methods=['GET'])
+def admin_get_courses():
+    """Get courses with enrollment stats for admin"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    try:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+            
+        cursor = connection.cursor(dictionary=True)
+        
+        # One page of courses (?limit=&cursor=&sort=&fields=&difficulty_level=&provider=&q=&count=1)
+        page = admin_lists.COURSES.fetch(cursor, request.args)
+        admin_lists.add_enrollment_stats(cursor, page['items'])
+        return jsonify(list_response('courses', page)), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Error as e:
+        print(f"Database error in admin courses: {str(e)}")  # Debug log
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            cursor.close()
+            connection.close()
+
+# Resume management routes
+@app.route('/api/resume', methods=['GET', 'POST', 'DELETE'])
+def resume_management():
+    """Resume management endpoints"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    user_id = session['user_id']
+    print(f"Resume API called by user {user_id}, method: {request.method}")  # Debug log
+    
+    if request.method == 'GET':
+        try:
+            connection = get_db_connection()
+            if not connection:
+                return jsonify({'error': 'Database connection failed'}), 500
+                
+            cursor = connection.cursor(dictionary=True)
+            
+            # Adds, edits and deletes all change this version
+            cursor.execute("""
+                SELECT COUNT(*) as total, MAX(id) as last_id, MAX(updated_at) as last_updated
+                FROM user_resumes WHERE user_id = %s
+            """, (user_id,))
+            version = cursor.fetchone()
+            etag = make_etag('resumes', user_id, version['total'], version['last_id'], version['last_updated'])
+            response = not_modified(etag)
+            if response:
+                return response
+            
+            cursor.execute("SELECT * FROM user_resumes WHERE user_id = %s ORDER BY created_at DESC", (user_id,))
+            resumes = cursor.fetchall()
+            
+            # Parse JSON data for each resume
+            for resume in resumes:
+                if resume['resume_data']:
+                    try:
+                        resume['resume_data'] = json.loads(resume['resume_data'])
+                    except:
+                        resume['resume_data'] = {}
+                        
+            return conditional_json(resumes, etag)
+            
+        except Error as e:
+            print(f"Database error in resume GET: {str(e)}")
+            return jsonify({'error': f'Database error: {str(e)}'}), 500
+        except Exception as e:
+            print(f"General error in resume GET: {str(e)}")
+            return jsonify({'error': f'Error fetching resumes: {str(e)}'}), 500
+        finally:
+            if connection and connection.is_connected():
+                cursor.close()
+                connection.close()
+    
+    elif request.method == 'POST':
+        try:
+            data = request.get_json()
+            print(f"Resume data received: {data}")  # Debug log
+            
+            connection = get_db_connection()
+            if not connection:
+                print("Database connection failed")  # Debug log
+                return jsonify({'error': 'Database connection failed'}), 500
+                
+            cursor = connection.cursor()
+            
+            cursor.execute("""
+                INSERT INTO user_resumes (user_id, resume_name, resume_data)
+                VALUES (%s, %s, %s)
+            """, (user_id, data.get('name', 'Resume'), json.dumps(data)))
+            
+            connection.commit()
+            print("Resume saved successfully")  # Debug log
+            return jsonify({'message': 'Resume saved successfully'}), 201
+            
+        except Error as e:
+            print(f"Database error in resume save: {str(e)}")  # Debug log
+            return jsonify({'error': f'Database error: {str(e)}'}), 500
+        except Exception as e:
+            print(f"General error in resume save: {str(e)}")  # Debug log
+            return jsonify({'error': f'Error saving resume: {str(e)}'}), 500
+        finally:
+            if connection and connection.is_connected():
+                cursor.close()
+                connection.close()
+    
+    elif request.method == 'DELETE':
+        try:
+            resume_id = request.args.get('id')
+            if not resume_id:
+                return jsonify({'error': 'Resume ID required'}), 400
+                
+            connection = get_db_connection()
+            if not connection:
+                return jsonify({'error': 'Database connection failed'}), 500
+                
+            cursor = connection.cursor()
+            
+            cursor.execute("DELETE FROM user_resumes WHERE id = %s AND user_id = %s", (resume_id, user_id))
+            
+            if cursor.rowcount == 0:
+                return jsonify({'error': 'Resume not found'}), 404
+                
+            connection.commit()
+            return jsonify({'message': 'Resume deleted successfully'}), 200
+            
+        except Error as e:
+            return jsonify({'error': f'Database error: {str(e)}'}), 500
+        finally:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+
+@app.route('/api/resume/<int:resume_id>/pdf', methods=['GET'])
+def resume_pdf(resume_id):
+    """Saved resume rendered as PDF; ?download=1 for an attachment"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    connection = None
+    try:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            "SELECT resume_name, resume_data FROM user_resumes WHERE id = %s AND user_id = %s",
+            (resume_id, session['user_id'])
+        )
+        resume = cursor.fetchone()
+        cursor.close()
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            connection.close()
+    
+    if not resume:
+        return jsonify({'error': 'Resume not found'}), 404
+    
+    # The content hash is the ETag, so an unchanged resume answers 304 without rendering
+    resume_data = parse_resume_data(resume['resume_data'])
+    etag = content_hash(resume_data)
+    response = not_modified(etag)
+    if response:
+        return response
+    
+    try:
+        _, pdf, _ = resume_renderer.render(resume_data)
+    except Exception as e:
+        print(f"Error rendering resume {resume_id}: {e}")
+        return jsonify({'error': f'Error rendering resume: {str(e)}'}), 500
+    
+    response = conditional_bytes(pdf, etag, 'application/pdf')
+    filename = secure_filename(f"{resume['resume_name'] or 'resume'}.pdf") or 'resume.pdf'
+    disposition = 'attachment' if request.args.get('download') else 'inline'
+    response.headers['Content-Disposition'] = f'{disposition}; filename="{filename}"'
+    return response
+
+# Test endpoint to verify backend is working
+@app.route('/api/courses', methods=['GET'])
+def get_courses():
+    """Get all available courses"""
+    try:
+        courses, etag = catalog_cache.get_catalog(load_course_catalog)
+        return not_modified(etag) or conditional_json({'courses': courses}, etag)
+        
+    except Error as e:
+        print(f"Database error in courses API: {str(e)}")
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    except Exception as e:
+        print(f"General error in courses API: {str(e)}")
+        return jsonify({'error': f'Error fetching courses: {str(e)}'}), 500
+
+@app.route('/api/admin/metrics', methods=['GET'])
+def admin_metrics():
+    """Runtime metrics for the admin dashboard"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin access required'}), 403
+    
+    return jsonify({
+        'db_pool': db_pool.get_stats(),
+        'recommendation_queue': recommendation_queue.get_stats(),
+        'job_refresh_queue': job_refresh_queue.get_stats(),
+        'text_model': text_ranker.get_stats(),
+        'recommendation_recompute': bulk_recompute.progress(),
+        'catalog_cache': catalog_cache.get_stats(),
+        'skill_aliases': skill_aliases.get_stats(),
+        'sessions': session_stores.get_stats(app),
+        'password_hasher': password_hasher.get_stats(),
+        'login_throttle': login_throttle.get_stats(),
+        'resume_pdf': resume_renderer.get_stats()
+    }), 200
+
+@app.route('/api/test', methods=['GET'])
+def test_endpoint():
+    """Test endpoint to verify backend is working"""
+    try:
+        # Test database connection
+        connection = get_db_connection()
+        if connection:
+            cursor = connection.cursor()
+            cursor.execute("SHOW TABLES")
+            tables = cursor.fetchall()
+            cursor.close()
+            connection.close()
+            
+            return jsonify({
+                'status': 'success',
+                'message': 'Backend and database are working',
+                'timestamp': str(datetime.now()),
+                'tables': [table[0] for table in tables]
+            }), 200
+        else:
+            return jsonify({
+                'status': 'error',
+                'message': 'Database connection failed',
+                'timestamp': str(datetime.now())
+            }), 500
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Backend error: {str(e)}',
+            'timestamp': str(datetime.now())
+        }), 500
+
+if __name__ == '__main__':
+    print("Starting Career Platform Backend...")
+    print("Database initialization status:", init_database())
+    app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,28 +1,54 @@
 from flask import Flask, request, jsonify, session, render_template
 from flask_cors import CORS
-from flask_session import Session
-import mysql.connector
+from werkzeug.utils import secure_filename
 from mysql.connector import Error
-import bcrypt
 import os
 from dotenv import load_dotenv
 import json
 from datetime import datetime
 import uuid
+from db_pool import ConnectionPool
+import fast_json
+import session_stores
+from password_hasher import PasswordHasher, HasherBusy
+from rate_limit import LoginThrottle
+from catalog_cache import CatalogCache
+from http_cache import make_etag, not_modified, conditional_json, conditional_bytes
+from schema import migrate
+from job_queue import KeyedJobQueue
+from skill_index import SkillIndex
+import data_versions
+from skill_store import PROFILE_SKILL_SOURCES, load_active_job_skills, load_course_skills, set_job_skills, set_course_skills, set_user_skills, backfill as backfill_skills
+import skill_aliases
+from recommendation_scoring import load_profile_skills, refresh_user_skills
+from recommendation_batch import refresh_job_recommendations
+from pagination import parse_limit, list_response
+import admin_lists
+from admin_export import export_response, resume_archive_response
+from job_import import IMPORT_FORMATS, detect_format, read_records, import_jobs
+from resume_pdf import ResumeRenderer, content_hash, parse_resume_data
+from job_search import parse_job_filters, fetch_recommended_jobs, recommendation_version
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
-app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SESSION_PERMANENT'] = False
-app.config['SESSION_USE_SIGNER'] = True
-app.config['SESSION_KEY_PREFIX'] = 'career_platform:'
 
 # Initialize extensions
 CORS(app, supports_credentials=True)
-Session(app)
+
+# Server-side filesystem sessions by default; memory or mysql, or a signed cookie (requires a real SECRET_KEY)
+session_stores.init_app(
+    app,
+    os.getenv('SESSION_BACKEND', 'filesystem'),
+    get_connection=lambda: get_db_connection(),
+    max_entries=int(os.getenv('SESSION_MEMORY_SIZE', 10000)),
+    sweep_interval=int(os.getenv('SESSION_SWEEP_INTERVAL', 300))
+)
+
+# Fast JSON (orjson when installed) and gzip/brotli for responses above the threshold
+fast_json.init_app(app, threshold=int(os.getenv('COMPRESS_MIN_SIZE', 1024)))
 
 # Database configuration
 DB_CONFIG = {
@@ -33,14 +59,42 @@ DB_CONFIG = {
     'port': 3306
 }
 
+# In-process skill indexes, kept current by the admin job/course routes
+job_index = SkillIndex(load_active_job_skills, name='jobs')
+course_index = SkillIndex(load_course_skills, name='courses')
+user_index = SkillIndex(load_profile_skills, name='users')
+
 # Admin credentials
 ADMIN_USERNAME = 'admin'
 ADMIN_PASSWORD = 'admin123'
 
+# Shared connection pool (size and checkout timeout are configurable)
+db_pool = ConnectionPool(
+    DB_CONFIG,
+    size=int(os.getenv('DB_POOL_SIZE', 10)),
+    timeout=float(os.getenv('DB_POOL_TIMEOUT', 5)),
+    health_check_interval=float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+)
+
+# bcrypt runs on a bounded pool; logins beyond PASSWORD_HASH_MAX_PENDING get 429 instead of queueing
+password_hasher = PasswordHasher(
+    workers=int(os.getenv('PASSWORD_HASH_WORKERS', 2)),
+    max_pending=int(os.getenv('PASSWORD_HASH_MAX_PENDING', 16)),
+    rounds=int(os.getenv('BCRYPT_ROUNDS', 12))
+)
+
+# Login attempts per minute: every attempt counts per IP, failed attempts count per username
+login_throttle = LoginThrottle(
+    ip_rate=float(os.getenv('LOGIN_IP_RATE', 20)),
+    ip_burst=int(os.getenv('LOGIN_IP_BURST', 30)),
+    user_rate=float(os.getenv('LOGIN_USERNAME_RATE', 5)),
+    user_burst=int(os.getenv('LOGIN_USERNAME_BURST', 10))
+)
+
 def get_db_connection():
-    """Create and return database connection"""
+    """Check out a connection from the shared pool; close() returns it"""
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        connection = db_pool.get_connection()
         return connection
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
@@ -53,183 +107,9 @@ def init_database():
         return False
     
     try:
-        cursor = connection.cursor()
-        
-        # Create users table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                username VARCHAR(50) UNIQUE NOT NULL,
-                email VARCHAR(100) UNIQUE NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                role ENUM('user', 'admin') DEFAULT 'user',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create user_profiles table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_profiles (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                first_name VARCHAR(50),
-                last_name VARCHAR(50),
-                phone VARCHAR(20),
-                date_of_birth DATE,
-                gender ENUM('Male', 'Female', 'Other'),
-                address TEXT,
-                city VARCHAR(50),
-                state VARCHAR(50),
-                country VARCHAR(50),
-                pincode VARCHAR(10),
-                
-                -- Academic Information
-                highest_qualification VARCHAR(100),
-                university VARCHAR(100),
-                graduation_year INT,
-                cgpa DECIMAL(3,2),
-                field_of_study VARCHAR(100),
-                
-                -- Skills and Ratings
-                technical_skills TEXT,
-                soft_skills TEXT,
-                programming_languages TEXT,
-                frameworks TEXT,
-                database_skills TEXT,
-                tools TEXT,
-                
-                -- Experience
-                total_experience INT DEFAULT 0,
-                internships TEXT,
-                projects TEXT,
-                certifications TEXT,
-                
-                -- Interests and Preferences
-                career_interests TEXT,
-                preferred_locations TEXT,
-                salary_expectation INT,
-                work_mode ENUM('Remote', 'On-site', 'Hybrid'),
-                
-                -- Tech Stack
-                tech_stack TEXT,
-                batch_semester VARCHAR(20),
-                
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(200) NOT NULL,
-                company VARCHAR(100) NOT NULL,
-                location VARCHAR(100),
-                job_type ENUM('Full-time', 'Part-time', 'Contract', 'Internship') DEFAULT 'Full-time',
-                experience_required INT DEFAULT 0,
-                salary_min INT,
-                salary_max INT,
-                description TEXT,
-                requirements TEXT,
-                skills_required TEXT,
-                benefits TEXT,
-                application_deadline DATE,
-                status ENUM('Active', 'Closed', 'Draft') DEFAULT 'Active',
-                created_by INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
-            )
-        """)
-        
-        # Create job_applications table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS job_applications (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                job_id INT NOT NULL,
-                resume_path VARCHAR(255),
-                cover_letter TEXT,
-                status ENUM('Applied', 'Under Review', 'Shortlisted', 'Rejected', 'Accepted') DEFAULT 'Applied',
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                UNIQUE KEY unique_application (user_id, job_id)
-            )
-        """)
-        
-        # Create courses table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(200) NOT NULL,
-                description TEXT,
-                provider VARCHAR(100),
-                duration_weeks INT,
-                difficulty_level ENUM('Beginner', 'Intermediate', 'Advanced'),
-                skills_covered TEXT,
-                course_url VARCHAR(500),
-                price DECIMAL(10,2) DEFAULT 0,
-                rating DECIMAL(3,2),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create user_course_progress table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_course_progress (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                course_id INT NOT NULL,
-                progress_percentage DECIMAL(5,2) DEFAULT 0,
-                completed_modules TEXT,
-                current_module INT DEFAULT 1,
-                status ENUM('Not Started', 'In Progress', 'Completed') DEFAULT 'Not Started',
-                started_at TIMESTAMP NULL,
-                completed_at TIMESTAMP NULL,
-                certificate_path VARCHAR(255),
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
-                UNIQUE KEY unique_progress (user_id, course_id)
-            )
-        """)
-        
-        # Create recommendations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recommendations (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                job_id INT,
-                course_id INT,
-                recommendation_type ENUM('job', 'course') NOT NULL,
-                score DECIMAL(5,4),
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create user_resumes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_resumes (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                resume_name VARCHAR(255) NOT NULL,
-                resume_data JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        connection.commit()
-        print("Database tables created successfully!")
+        # Create or upgrade tables (versioned, runs once per schema version)
+        version = migrate(connection)
+        print(f"Database schema at version {version}")
         return True
         
     except Error as e:
@@ -237,27 +117,150 @@ def init_database():
         return False
     finally:
         if connection.is_connected():
-            cursor.close()
             connection.close()
 
 # Initialize database on startup
 init_database()
 
+def refresh_job(job_id):
+    """Recompute one job's (or a tuple of imported jobs') recommendations across all users"""
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    try:
+        job_ids = list(job_id) if isinstance(job_id, tuple) else [job_id]
+        refresh_job_recommendations(connection, job_ids, job_index, user_index)
+    finally:
+        connection.close()
+
+# Single job changes only touch that job's rows, in the background
+job_refresh_queue = KeyedJobQueue(
+    refresh_job,
+    workers=int(os.getenv('JOB_REFRESH_WORKERS', 1)),
+    name='job-recommendations'
+)
+
+def rebuild_skills(_):
+    """Re-canonicalize the skill join tables from the text columns after an alias reload"""
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    cursor = connection.cursor()
+    try:
+        backfill_skills(cursor)
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+    for index in (job_index, course_index, user_index):
+        index.invalidate()
+
+skill_rebuild_queue = KeyedJobQueue(rebuild_skills, workers=1, name='skills')
+
+# Formatted course catalog, cached in-process and invalidated by the admin course routes
+catalog_cache = CatalogCache(
+    ttl=float(os.getenv('CATALOG_CACHE_TTL', 300)),
+    max_entries=int(os.getenv('CATALOG_CACHE_SIZE', 1000))
+)
+
+# Resume PDFs: rendered in a process pool, cached on disk by content hash
+resume_renderer = ResumeRenderer(
+    os.getenv('RESUME_PDF_CACHE_DIR', 'pdf_cache'),
+    processes=int(os.getenv('RESUME_PDF_PROCESSES', 2)),
+    max_files=int(os.getenv('RESUME_PDF_CACHE_FILES', 1000))
+)
+
+def load_course_catalog():
+    """Query and format every course for the catalog page"""
+    connection = get_db_connection()
+    if not connection:
+        raise Error(msg='Database connection failed')
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM courses ORDER BY rating DESC")
+        courses = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+    
+    # Format courses for frontend
+    formatted_courses = []
+    for course in courses:
+        formatted_course = {
+            'id': course['id'],
+            'title': course['title'],
+            'description': course['description'],
+            'provider': course['provider'],
+            'level': course['difficulty_level'],
+            'duration': f"{course['duration_weeks']} weeks",
+            'rating': float(course['rating']) if course['rating'] else 0,
+            'students': 1000 + (course['id'] * 500),  # Mock student count
+            'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
+            'link': course['course_url'],
+            'price': 'Free' if course['price'] == 0 else f"₹{course['price']}"
+        }
+        formatted_courses.append(formatted_course)
+    return formatted_courses
+
+def load_course_details(course_id):
+    """Query and format one course; None if it does not exist"""
+    connection = get_db_connection()
+    if not connection:
+        raise Error(msg='Database connection failed')
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM courses WHERE id = %s", (course_id,))
+        course = cursor.fetchone()
+        cursor.close()
+    finally:
+        connection.close()
+    
+    if not course:
+        return None
+    
+    # Format course for frontend
+    formatted_course = {
+        'id': course['id'],
+        'title': course['title'],
+        'description': course['description'],
+        'provider': course['provider'],
+        'duration': course['duration_weeks'],
+        'level': course['difficulty_level'],
+        'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
+        'link': course['course_url'],
+        'price': course['price'],
+        'rating': course['rating'],
+        'content': f"""
+        <h2>{course['title']}</h2>
+        <p><strong>Provider:</strong> {course['provider']}</p>
+        <p><strong>Duration:</strong> {course['duration_weeks']} weeks</p>
+        <p><strong>Level:</strong> {course['difficulty_level']}</p>
+        <p><strong>Skills Covered:</strong> {course['skills_covered']}</p>
+        <p><strong>Description:</strong></p>
+        <p>{course['description']}</p>
+        <p><strong>Course Link:</strong> <a href="{course['course_url']}" target="_blank">Start Course</a></p>
+        """
+    }
+    return formatted_course
+
 # Authentication routes
 @app.route('/api/register', methods=['POST'])
 def register():
     """User registration endpoint"""
+    connection = None
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         username = data.get('username')
         email = data.get('email')
         password = data.get('password')
         
         if not all([username, email, password]):
             return jsonify({'error': 'All fields are required'}), 400
+        if not all(isinstance(value, str) for value in (username, email, password)):
+            return jsonify({'error': 'Username, email and password must be strings'}), 400
         
-        # Hash password
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        # Hash before taking a pooled connection so bcrypt time never holds one
+        password_hash = password_hasher.hash(password)
         
         connection = get_db_connection()
         if not connection:
@@ -279,6 +282,8 @@ def register():
         
         return jsonify({'message': 'User registered successfully'}), 201
         
+    except HasherBusy as e:
+        return jsonify({'error': str(e)}), 429, {'Retry-After': '1'}
     except Error as e:
         return jsonify({'error': f'Database error: {str(e)}'}), 500
     except Exception as e:
@@ -291,6 +296,7 @@ def register():
 @app.route('/api/login', methods=['POST'])
 def login():
     """User login endpoint"""
+    connection = None
     try:
         data = request.get_json()
         username = data.get('username')
@@ -298,6 +304,13 @@ def login():
         
         if not all([username, password]):
             return jsonify({'error': 'Username and password are required'}), 400
+        if not isinstance(username, str) or not isinstance(password, str):
+            return jsonify({'error': 'Username and password must be strings'}), 400
+        
+        # Throttle before any DB or bcrypt work
+        retry_after = login_throttle.check(request.remote_addr, username)
+        if retry_after:
+            return jsonify({'error': 'Too many login attempts, please try again later'}), 429, {'Retry-After': str(retry_after)}
         
         connection = get_db_connection()
         if not connection:
@@ -322,7 +335,12 @@ def login():
         )
         user = cursor.fetchone()
         
-        if user and bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+        if user and password_hasher.verify(password, user['password_hash']):
+            # Re-hash with the current BCRYPT_ROUNDS while the plain password is at hand
+            new_hash = password_hasher.upgrade(password, user['password_hash'])
+            if new_hash:
+                cursor.execute("UPDATE users SET password_hash = %s WHERE id = %s", (new_hash, user['id']))
+                connection.commit()
             session['user_id'] = user['id']
             session['username'] = user['username']
             session['role'] = user['role']
@@ -336,8 +354,11 @@ def login():
                 }
             }), 200
         else:
+            login_throttle.failed(username)
             return jsonify({'error': 'Invalid credentials'}), 401
             
+    except HasherBusy as e:
+        return jsonify({'error': str(e)}), 429, {'Retry-After': '1'}
     except Error as e:
         return jsonify({'error': f'Database error: {str(e)}'}), 500
     except Exception as e:
@@ -376,9 +397,11 @@ def admin_users():
     try:
         connection = get_db_connection()
         cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT id, username, email, role, created_at FROM users ORDER BY created_at DESC")
-        users = cursor.fetchall()
-        return jsonify({'users': users}), 200
+        # One page of users (?limit=&cursor=&sort=&fields=&role=&q=&created_after=&created_before=&count=1)
+        page = admin_lists.USERS.fetch(cursor, request.args)
+        return jsonify(list_response('users', page)), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Error as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -403,6 +426,16 @@ def profile():
         
         try:
             cursor = connection.cursor(dictionary=True)
+            
+            # Answer 304 from the row version before reading and decoding the profile
+            cursor.execute("SELECT id, row_version FROM user_profiles WHERE user_id = %s", (user_id,))
+            version = cursor.fetchone()
+            if version:
+                etag = make_etag('profile', user_id, version['id'], version['row_version'])
+                response = not_modified(etag)
+                if response:
+                    return response
+            
             cursor.execute("SELECT * FROM user_profiles WHERE user_id = %s", (user_id,))
             profile = cursor.fetchone()
             
@@ -418,7 +451,8 @@ def profile():
                     else:
                         profile[skill_field] = []
                 
-                return jsonify(profile), 200
+                etag = make_etag('profile', user_id, profile['id'], profile['row_version'])
+                return conditional_json(profile, etag)
             else:
                 return jsonify({'message': 'Profile not found'}), 404
                 
@@ -465,6 +499,7 @@ def profile():
         for field in datetime_fields:
             if field in data:
                 del data[field]
+        data.pop('row_version', None)  # maintained by the server
         
         # Convert skills lists to JSON strings
         for skill_field in ['technical_skills', 'soft_skills', 'programming_languages', 
@@ -490,12 +525,14 @@ def profile():
                 
                 for key, value in data.items():
                     if key != 'user_id':  # Don't update user_id
-                        # Skip None values for optional fields
-                        if value is not None:
+                        # Skip None values for optional fields; an explicit null clears a skill list
+                        if value is not None or key in PROFILE_SKILL_SOURCES:
                             update_fields.append(f"{key} = %s")
                             values.append(value)
                 
                 if update_fields:
+                    # Bumped on every save so the ETag changes even within the same second
+                    update_fields.append("row_version = row_version + 1")
                     values.append(user_id)
                     query = f"UPDATE user_profiles SET {', '.join(update_fields)} WHERE user_id = %s"
                     cursor.execute(query, values)
@@ -511,7 +548,14 @@ def profile():
                 query = f"INSERT INTO user_profiles ({', '.join(fields)}) VALUES ({', '.join(placeholders)})"
                 cursor.execute(query, values)
             
+            set_user_skills(cursor, user_id, data)
             connection.commit()
+            
+            # Keep the user skill index current for incremental job refreshes
+            try:
+                refresh_user_skills(connection, user_id, user_index)
+            except Error as e:
+                print(f"Warning: Failed to refresh user skill index: {e}")
             return jsonify({'message': 'Profile updated successfully'}), 200
             
         except Error as e:
@@ -526,80 +570,22 @@ def profile():
 def get_courses():
     """Get recommended courses"""
     try:
-        connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM courses ORDER BY rating DESC")
-        courses = cursor.fetchall()
-        
-        # Format courses for frontend
-        formatted_courses = []
-        for course in courses:
-            formatted_course = {
-                'id': course['id'],
-                'title': course['title'],
-                'description': course['description'],
-                'provider': course['provider'],
-                'level': course['difficulty_level'],
-                'duration': f"{course['duration_weeks']} weeks",
-                'rating': float(course['rating']) if course['rating'] else 0,
-                'students': 1000 + (course['id'] * 500),  # Mock student count
-                'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
-                'link': course['course_url'],
-                'price': 'Free' if course['price'] == 0 else f"₹{course['price']}"
-            }
-            formatted_courses.append(formatted_course)
-        
-        return jsonify({'courses': formatted_courses}), 200
+        courses, etag = catalog_cache.get_catalog(load_course_catalog)
+        return not_modified(etag) or conditional_json({'courses': courses}, etag)
     except Error as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
 
 @app.route('/api/course/<int:course_id>', methods=['GET'])
 def get_course_details(course_id):
     """Get specific course details"""
     try:
-        connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM courses WHERE id = %s", (course_id,))
-        course = cursor.fetchone()
-        
+        course, etag = catalog_cache.get_course(course_id, lambda: load_course_details(course_id))
         if not course:
             return jsonify({'error': 'Course not found'}), 404
         
-        # Format course for frontend
-        formatted_course = {
-            'id': course['id'],
-            'title': course['title'],
-            'description': course['description'],
-            'provider': course['provider'],
-            'duration': course['duration_weeks'],
-            'level': course['difficulty_level'],
-            'skills': course['skills_covered'].split(', ') if course['skills_covered'] else [],
-            'link': course['course_url'],
-            'price': course['price'],
-            'rating': course['rating'],
-            'content': f"""
-            <h2>{course['title']}</h2>
-            <p><strong>Provider:</strong> {course['provider']}</p>
-            <p><strong>Duration:</strong> {course['duration_weeks']} weeks</p>
-            <p><strong>Level:</strong> {course['difficulty_level']}</p>
-            <p><strong>Skills Covered:</strong> {course['skills_covered']}</p>
-            <p><strong>Description:</strong></p>
-            <p>{course['description']}</p>
-            <p><strong>Course Link:</strong> <a href="{course['course_url']}" target="_blank">Start Course</a></p>
-            """
-        }
-        
-        return jsonify({'course': formatted_course}), 200
+        return not_modified(etag) or conditional_json({'course': course}, etag)
     except Error as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
 
 @app.route('/api/admin/courses', methods=['GET', 'POST'])
 def admin_courses():
@@ -612,9 +598,10 @@ def admin_courses():
         cursor = connection.cursor(dictionary=True)
         
         if request.method == 'GET':
-            cursor.execute("SELECT * FROM courses ORDER BY created_at DESC")
-            courses = cursor.fetchall()
-            return jsonify({'courses': courses}), 200
+            # One page of courses (?limit=&cursor=&sort=&fields=&difficulty_level=&provider=&q=&count=1)
+            page = admin_lists.COURSES.fetch(cursor, request.args)
+            admin_lists.add_enrollment_stats(cursor, page['items'])
+            return jsonify(list_response('courses', page)), 200
         
         elif request.method == 'POST':
             data = request.get_json()
@@ -635,9 +622,15 @@ def admin_courses():
                 data.get('price', 0), data.get('rating', 0)
             ))
             
+            course_id = cursor.lastrowid
+            set_course_skills(cursor, [(course_id, data.get('skills_covered', ''))])
             connection.commit()
+            course_index.set_item(course_id, data.get('skills_covered', ''))
+            catalog_cache.invalidate(course_id)
             return jsonify({'message': 'Course created successfully'}), 201
             
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Error as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -653,6 +646,13 @@ def get_job_recommendations():
     
     user_id = session['user_id']
     
+    # Filters and keyset pagination: ?limit=&cursor=&location=&job_type=&salary_min=&salary_max=&experience=&q=
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        filters = parse_job_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     connection = get_db_connection()
     if not connection:
         return jsonify({'error': 'Database connection failed'}), 500
@@ -660,19 +660,22 @@ def get_job_recommendations():
     try:
         cursor = connection.cursor(dictionary=True)
         
-        # Get all active jobs
-        cursor.execute("SELECT * FROM jobs WHERE status = 'Active' ORDER BY created_at DESC")
-        jobs = cursor.fetchall()
+        # Unchanged data and query: answer 304 before querying the page or serializing anything
+        etag = make_etag('job-recommendations', user_id, recommendation_version(cursor, user_id),
+                         request.query_string.decode('utf-8'))
+        response = not_modified(etag)
+        if response:
+            return response
         
-        # Convert to list and add applied flag
-        jobs_list = []
-        for job in jobs:
-            job_dict = dict(job)
-            job_dict['applied'] = False  # Default to not applied
-            jobs_list.append(job_dict)
+        jobs_list, next_cursor = fetch_recommended_jobs(
+            cursor, user_id, filters, limit, request.args.get('cursor')
+        )
         
-        return jsonify({'jobs': jobs_list}), 200
+        return conditional_json({'jobs': jobs_list, 'next_cursor': next_cursor,
+                                 'has_more': next_cursor is not None}, etag)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Error as e:
         return jsonify({'error': f'Database error: {str(e)}'}), 500
     finally:
@@ -690,6 +693,19 @@ def resume_management():
         try:
             connection = get_db_connection()
             cursor = connection.cursor(dictionary=True)
+            
+            # Adds, edits and deletes all change this version
+            cursor.execute("""
+                SELECT COUNT(*) as total, MAX(id) as last_id, MAX(updated_at) as last_updated
+                FROM user_resumes WHERE user_id = %s
+            """, (session['user_id'],))
+            version = cursor.fetchone()
+            etag = make_etag('resumes', session['user_id'], version['total'], version['last_id'],
+                             version['last_updated'])
+            response = not_modified(etag)
+            if response:
+                return response
+            
             cursor.execute("SELECT * FROM user_resumes WHERE user_id = %s ORDER BY created_at DESC", (session['user_id'],))
             resumes = cursor.fetchall()
             
@@ -701,7 +717,7 @@ def resume_management():
                     except:
                         resume['resume_data'] = {}
                         
-            return jsonify({'resumes': resumes}), 200
+            return conditional_json({'resumes': resumes}, etag)
         except Error as e:
             return jsonify({'error': str(e)}), 500
         finally:
@@ -729,6 +745,53 @@ def resume_management():
                 cursor.close()
                 connection.close()
 
+@app.route('/api/resume/<int:resume_id>/pdf', methods=['GET'])
+def resume_pdf(resume_id):
+    """Saved resume rendered as PDF; ?download=1 for an attachment"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    connection = None
+    try:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            "SELECT resume_name, resume_data FROM user_resumes WHERE id = %s AND user_id = %s",
+            (resume_id, session['user_id'])
+        )
+        resume = cursor.fetchone()
+        cursor.close()
+    except Error as e:
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    finally:
+        if connection and connection.is_connected():
+            connection.close()
+    
+    if not resume:
+        return jsonify({'error': 'Resume not found'}), 404
+    
+    # The content hash is the ETag, so an unchanged resume answers 304 without rendering
+    resume_data = parse_resume_data(resume['resume_data'])
+    etag = content_hash(resume_data)
+    response = not_modified(etag)
+    if response:
+        return response
+    
+    try:
+        _, pdf, _ = resume_renderer.render(resume_data)
+    except Exception as e:
+        print(f"Error rendering resume {resume_id}: {e}")
+        return jsonify({'error': f'Error rendering resume: {str(e)}'}), 500
+    
+    response = conditional_bytes(pdf, etag, 'application/pdf')
+    filename = secure_filename(f"{resume['resume_name'] or 'resume'}.pdf") or 'resume.pdf'
+    disposition = 'attachment' if request.args.get('download') else 'inline'
+    response.headers['Content-Disposition'] = f'{disposition}; filename="{filename}"'
+    return response
+
 @app.route('/api/admin/jobs', methods=['GET', 'POST', 'PUT', 'DELETE'])
 def admin_jobs():
     """Admin job management"""
@@ -740,9 +803,9 @@ def admin_jobs():
         cursor = connection.cursor(dictionary=True)
         
         if request.method == 'GET':
-            cursor.execute("SELECT * FROM jobs ORDER BY created_at DESC")
-            jobs = cursor.fetchall()
-            return jsonify({'jobs': jobs}), 200
+            # One page of jobs (?limit=&cursor=&sort=&fields=&status=&job_type=&company=&location=&q=&count=1)
+            page = admin_lists.JOBS.fetch(cursor, request.args)
+            return jsonify(list_response('jobs', page)), 200
         
         elif request.method == 'POST':
             data = request.get_json()
@@ -766,7 +829,13 @@ def admin_jobs():
                 data.get('status', 'Active'), session['user_id']
             ))
             
+            job_id = cursor.lastrowid
+            set_job_skills(cursor, [(job_id, data.get('skills_required', ''))])
+            data_versions.bump(cursor, [data_versions.JOBS])
             connection.commit()
+            job_index.set_item(job_id, data.get('skills_required', ''),
+                               active=data.get('status', 'Active') == 'Active')
+            job_refresh_queue.submit(job_id)
             return jsonify({'message': 'Job created successfully'}), 201
         
         elif request.method == 'PUT':
@@ -775,6 +844,10 @@ def admin_jobs():
             
             if not job_id:
                 return jsonify({'error': 'Job ID is required'}), 400
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Job ID must be an integer'}), 400
             
             cursor.execute("""
                 UPDATE jobs SET title=%s, company=%s, location=%s, job_type=%s,
@@ -791,7 +864,12 @@ def admin_jobs():
                 data.get('status', 'Active'), job_id
             ))
             
+            set_job_skills(cursor, [(job_id, data.get('skills_required', ''))])
+            data_versions.bump(cursor, [data_versions.JOBS])
             connection.commit()
+            job_index.set_item(job_id, data.get('skills_required', ''),
+                               active=data.get('status', 'Active') == 'Active')
+            job_refresh_queue.submit(job_id)
             return jsonify({'message': 'Job updated successfully'}), 200
         
         elif request.method == 'DELETE':
@@ -799,11 +877,20 @@ def admin_jobs():
             
             if not job_id:
                 return jsonify({'error': 'Job ID is required'}), 400
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Job ID must be an integer'}), 400
             
             cursor.execute("DELETE FROM jobs WHERE id=%s", (job_id,))
+            data_versions.bump(cursor, [data_versions.JOBS])
             connection.commit()
+            job_index.remove(job_id)
+            job_refresh_queue.submit(job_id)
             return jsonify({'message': 'Job deleted successfully'}), 200
             
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Error as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -821,17 +908,12 @@ def admin_applications():
         connection = get_db_connection()
         cursor = connection.cursor(dictionary=True)
         
-        cursor.execute("""
-            SELECT ja.*, u.username, u.email, j.title as job_title, j.company
-            FROM job_applications ja
-            JOIN users u ON ja.user_id = u.id
-            JOIN jobs j ON ja.job_id = j.id
-            ORDER BY ja.applied_at DESC
-        """)
-        applications = cursor.fetchall()
-        
-        return jsonify({'applications': applications}), 200
+        # One page of applications (?limit=&cursor=&sort=&fields=&status=&job_id=&user_id=&q=&count=1)
+        page = admin_lists.APPLICATIONS.fetch(cursor, request.args)
+        return jsonify(list_response('applications', page)), 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Error as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -839,6 +921,96 @@ def admin_applications():
             cursor.close()
             connection.close()
 
+@app.route('/api/admin/jobs/import', methods=['POST'])
+def admin_import_jobs():
+    """Bulk import jobs from a CSV, JSON or NDJSON upload (multipart `file` or raw body, ?format=)"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin authentication required'}), 401
+    
+    upload = request.files.get('file')
+    feed_format = request.args.get('format') or detect_format(
+        upload.filename if upload else None, upload.content_type if upload else request.content_type)
+    if feed_format not in IMPORT_FORMATS:
+        return jsonify({'error': f"format must be one of {', '.join(IMPORT_FORMATS)}"}), 400
+    
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'error': 'Database connection failed'}), 500
+    try:
+        stream = upload.stream if upload else request.stream
+        # The built-in admin login has no users row ('admin'), so its imports have no creator
+        created_by = session['user_id'] if isinstance(session['user_id'], int) else None
+        result = import_jobs(connection, read_records(stream, feed_format), created_by,
+                             batch_size=int(os.getenv('JOB_IMPORT_BATCH_SIZE', 500)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    finally:
+        connection.close()
+    
+    if result['job_ids']:
+        for job_id in result['job_ids']:
+            job_index.set_item(job_id, result['skills'].get(job_id, ''), active=job_id in result['skills'])
+        # One incremental refresh for the whole import
+        job_refresh_queue.submit(tuple(result['job_ids']))
+    print(f"Imported {result['inserted']} jobs for admin {session['user_id']}")  # Debug log
+    
+    return jsonify({
+        'inserted': result['inserted'],
+        'failed': result['failed'],
+        'errors': result['errors'],
+        'errors_truncated': result['errors_truncated'],
+        'job_ids': result['job_ids'],
+        'read_error': result['read_error']
+    }), 201 if result['inserted'] else 400
+
+@app.route('/api/admin/skill-aliases', methods=['GET', 'POST'])
+def admin_skill_aliases():
+    """Show the skill alias table, or reload it and re-canonicalize stored skills in the background"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin authentication required'}), 401
+    
+    if request.method == 'POST':
+        try:
+            stats = skill_aliases.reload()
+        except (OSError, ValueError) as e:
+            return jsonify({'error': f'Could not load skill aliases: {e}'}), 400
+        status = skill_rebuild_queue.submit('rebuild')
+        print(f"Skill aliases reloaded by {session['user_id']}")  # Debug log
+        return jsonify({'message': 'Skill aliases reloaded', 'aliases': stats, 'rebuild': status}), 202
+    
+    return jsonify({'aliases': skill_aliases.get_stats(), 'rebuild': skill_rebuild_queue.get_stats()}), 200
+
+@app.route('/api/admin/jobs/<int:job_id>/resumes', methods=['GET'])
+def admin_job_resumes(job_id):
+    """ZIP of every applicant's latest resume as PDF, streamed as the renders finish"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin authentication required'}), 401
+    
+    try:
+        response = resume_archive_response(job_id, get_db_connection, resume_renderer,
+                                           chunk_size=int(os.getenv('EXPORT_CHUNK_SIZE', 1000)))
+    except Exception as e:
+        return jsonify({'error': f'Error building resume archive: {str(e)}'}), 500
+    if response is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return response
+
+@app.route('/api/admin/export/<string:dataset>', methods=['GET'])
+def admin_export(dataset):
+    """Stream users or job applications as CSV, NDJSON or JSON (?format=csv|ndjson|json plus list filters)"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin authentication required'}), 401
+    
+    list_queries = {'users': admin_lists.USERS, 'applications': admin_lists.APPLICATIONS}
+    if dataset not in list_queries:
+        return jsonify({'error': 'dataset must be users or applications'}), 404
+    
+    try:
+        return export_response(list_queries[dataset], request.args, get_db_connection, dataset,
+                               chunk_size=int(os.getenv('EXPORT_CHUNK_SIZE', 1000)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
 @app.route('/api/admin/user-profile/<int:user_id>', methods=['GET'])
 def admin_user_profile(user_id):
     """Get user profile for admin view"""
@@ -947,6 +1119,23 @@ def my_applications():
             cursor.close()
             connection.close()
 
+@app.route('/api/admin/metrics', methods=['GET'])
+def admin_metrics():
+    """Runtime metrics for the admin dashboard"""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Admin authentication required'}), 401
+    
+    return jsonify({
+        'db_pool': db_pool.get_stats(),
+        'job_refresh_queue': job_refresh_queue.get_stats(),
+        'catalog_cache': catalog_cache.get_stats(),
+        'skill_aliases': skill_aliases.get_stats(),
+        'sessions': session_stores.get_stats(app),
+        'password_hasher': password_hasher.get_stats(),
+        'login_throttle': login_throttle.get_stats(),
+        'resume_pdf': resume_renderer.get_stats()
+    }), 200
+
 @app.route('/api/test', methods=['GET'])
 def test():
     """Test endpoint"""
@@ -982,82 +1171,6 @@ def test_profiles():
             connection.close()
 
 # Course Management Endpoints
-@app.route('/api/admin/courses', methods=['GET'])
-def admin_get_courses():
-    """Get all courses for admin"""
-    if 'user_id' not in session or session.get('role') != 'admin':
-        return jsonify({'error': 'Admin authentication required'}), 401
-    
-    try:
-        connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
-        
-        cursor.execute("""
-            SELECT c.*, 
-                   COUNT(ucp.user_id) as enrolled_students,
-                   AVG(ucp.progress_percentage) as avg_progress
-            FROM courses c
-            LEFT JOIN user_course_progress ucp ON c.id = ucp.course_id
-            GROUP BY c.id
-            ORDER BY c.created_at DESC
-        """)
-        courses = cursor.fetchall()
-        
-        return jsonify(courses), 200
-        
-    except Error as e:
-        return jsonify({'error': str(e)}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
-
-@app.route('/api/admin/courses', methods=['POST'])
-def admin_create_course():
-    """Create a new course"""
-    if 'user_id' not in session or session.get('role') != 'admin':
-        return jsonify({'error': 'Admin authentication required'}), 401
-    
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['title', 'description', 'provider', 'duration_weeks', 'difficulty_level']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'{field} is required'}), 400
-        
-        connection = get_db_connection()
-        cursor = connection.cursor()
-        
-        cursor.execute("""
-            INSERT INTO courses (title, description, provider, duration_weeks, 
-                               difficulty_level, skills_covered, course_url, price, rating)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            data['title'],
-            data['description'],
-            data['provider'],
-            data['duration_weeks'],
-            data['difficulty_level'],
-            data.get('skills_covered', ''),
-            data.get('course_url', ''),
-            data.get('price', 0),
-            data.get('rating', 0)
-        ))
-        
-        connection.commit()
-        course_id = cursor.lastrowid
-        
-        return jsonify({'message': 'Course created successfully', 'course_id': course_id}), 201
-        
-    except Error as e:
-        return jsonify({'error': str(e)}), 500
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
-
 @app.route('/api/admin/courses/<int:course_id>', methods=['PUT'])
 def admin_update_course(course_id):
     """Update a course"""
@@ -1092,7 +1205,10 @@ def admin_update_course(course_id):
         if cursor.rowcount == 0:
             return jsonify({'error': 'Course not found'}), 404
         
+        set_course_skills(cursor, [(course_id, data.get('skills_covered', ''))])
         connection.commit()
+        course_index.set_item(course_id, data.get('skills_covered', ''))
+        catalog_cache.invalidate(course_id)
         return jsonify({'message': 'Course updated successfully'}), 200
         
     except Error as e:
@@ -1118,6 +1234,8 @@ def admin_delete_course(course_id):
             return jsonify({'error': 'Course not found'}), 404
         
         connection.commit()
+        course_index.remove(course_id)
+        catalog_cache.invalidate(course_id)
         return jsonify({'message': 'Course deleted successfully'}), 200
         
     except Error as e:
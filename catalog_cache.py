@@ -0,0 +1,103 @@
+"""
+Catalog Cache
+Read-through in-process cache for the formatted course catalog and course details
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from http_cache import make_etag
+
+
+class CatalogCache:
+    """
+    Caches the full formatted catalog plus an LRU of per-course entries.
+
+    Entries expire after `ttl` seconds; admin writes call invalidate() so
+    changes show up immediately. A load that started before an invalidation
+    is returned to its caller but not stored. Every entry carries an ETag of
+    its content, computed once per load.
+    """
+
+    def __init__(self, ttl=300, max_entries=1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._catalog = None              # (expires_at, value, etag)
+        self._courses = OrderedDict()     # course_id -> (expires_at, value, etag)
+        self._generation = 0
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_catalog(self, loader):
+        """Return (catalog, etag), calling loader() on a miss"""
+        with self._lock:
+            entry = self._catalog
+            if entry and entry[0] > time.monotonic():
+                self._hits += 1
+                return entry[1], entry[2]
+            self._misses += 1
+            generation = self._generation
+
+        value = loader()
+        etag = make_etag('catalog', value)
+        with self._lock:
+            if generation == self._generation:
+                self._catalog = (time.monotonic() + self.ttl, value, etag)
+        return value, etag
+
+    def get_course(self, course_id, loader):
+        """Return (course, etag), calling loader() on a miss (None results are not cached)"""
+        with self._lock:
+            entry = self._courses.get(course_id)
+            if entry and entry[0] > time.monotonic():
+                self._courses.move_to_end(course_id)
+                self._hits += 1
+                return entry[1], entry[2]
+            self._misses += 1
+            generation = self._generation
+
+        value = loader()
+        if value is None:
+            return None, None
+        etag = make_etag('course', course_id, value)
+        with self._lock:
+            if generation == self._generation:
+                self._courses[course_id] = (time.monotonic() + self.ttl, value, etag)
+                self._courses.move_to_end(course_id)
+                while len(self._courses) > self.max_entries:
+                    self._courses.popitem(last=False)
+                    self._evictions += 1
+        return value, etag
+
+    def invalidate(self, course_id=None):
+        """Drop the catalog and one course (or every course when course_id is None)"""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            self._catalog = None
+            if course_id is None:
+                self._courses.clear()
+            else:
+                self._courses.pop(course_id, None)
+
+    def get_stats(self):
+        """Return a snapshot of cache metrics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'ttl_seconds': self.ttl,
+                'max_entries': self.max_entries,
+                'catalog_cached': self._catalog is not None and self._catalog[0] > time.monotonic(),
+                'course_entries': len(self._courses),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+            }
@@ -1,13 +1,13 @@
-import os
-
-class Config:
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-super-secret-key-change-this-in-production'
-    DB_HOST = os.environ.get('DB_HOST') or 'localhost'
-    DB_NAME = os.environ.get('DB_NAME') or 'career_platform'
-    DB_USER = os.environ.get('DB_USER') or 'root'
-    DB_PASSWORD = os.environ.get('DB_PASSWORD') or ''
-    DB_PORT = int(os.environ.get('DB_PORT') or 3306)
-    
-    # Admin credentials
-    ADMIN_USERNAME = 'admin'
-    ADMIN_PASSWORD = 'admin123'
+import os
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-super-secret-key-change-this-in-production'
+    DB_HOST = os.environ.get('DB_HOST') or 'localhost'
+    DB_NAME = os.environ.get('DB_NAME') or 'career_platform'
+    DB_USER = os.environ.get('DB_USER') or 'root'
+    DB_PASSWORD = os.environ.get('DB_PASSWORD') or ''
+    DB_PORT = int(os.environ.get('DB_PORT') or 3306)
+    
+    # Admin credentials
+    ADMIN_USERNAME = 'admin'
+    ADMIN_PASSWORD = 'admin123'
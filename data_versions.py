@@ -0,0 +1,27 @@
+"""
+Data Versions
+Per-scope change counters in the data_versions table, bumped in the same transaction as the writes they cover.
+
+ETags built from them change on every committed write, including deletions
+and several writes within one second, and reading them is a primary-key
+lookup rather than a COUNT/SUM over the data itself.
+"""
+
+from db_batch import bulk_insert
+
+# Any job insert, update or delete
+JOBS = 'jobs'
+
+
+def recommendations_scope(user_id):
+    """Scope covering one user's recommendation rows"""
+    return f'recommendations:{user_id}'
+
+
+def bump(cursor, scopes):
+    """Increment the counters for `scopes` (created at 1 on first use)"""
+    # Sorted so concurrent writers lock the rows in the same order
+    rows = [(scope, 1) for scope in sorted(set(scopes))]
+    if rows:
+        bulk_insert(cursor, 'data_versions', ('scope', 'version'), rows,
+                    suffix=" ON DUPLICATE KEY UPDATE version = version + 1")
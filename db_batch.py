@@ -0,0 +1,44 @@
+"""
+Batched SQL Helpers
+Multi-row INSERT and chunking utilities used by bulk writers
+"""
+
+from itertools import islice
+
+# Rows per multi-row statement; keeps packets well below max_allowed_packet
+DEFAULT_BATCH_SIZE = 500
+
+
+def chunked(iterable, size):
+    """Yield lists of up to `size` items from any iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bulk_insert(cursor, table, columns, rows, batch_size=DEFAULT_BATCH_SIZE, suffix=''):
+    """Insert rows using one multi-row INSERT per batch; returns the number of rows sent"""
+    row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    column_list = ', '.join(columns)
+    total = 0
+
+    for batch in chunked(rows, batch_size):
+        query = (f"INSERT INTO {table} ({column_list}) VALUES "
+                 f"{', '.join([row_placeholders] * len(batch))}{suffix}")
+        cursor.execute(query, [value for row in batch for value in row])
+        total += len(batch)
+
+    return total
+
+
+def delete_by_ids(cursor, table, ids, batch_size=DEFAULT_BATCH_SIZE):
+    """Delete rows by primary key in batches; returns the number of ids sent"""
+    total = 0
+    for batch in chunked(ids, batch_size):
+        placeholders = ', '.join(['%s'] * len(batch))
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", batch)
+        total += len(batch)
+    return total
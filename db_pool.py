@@ -0,0 +1,196 @@
+"""
+Database Connection Pool
+A bounded, thread-safe pool of MySQL connections shared by every request handler
+"""
+
+import queue
+import threading
+import time
+
+import mysql.connector
+from mysql.connector import Error
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled connection becomes free within the checkout timeout"""
+
+
+class PooledConnection:
+    """Wrapper around a pooled connection; close() returns it to the pool"""
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def is_connected(self):
+        if self._released:
+            return False
+        return self._raw.is_connected()
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        self._pool.release(self._raw)
+
+    def discard(self):
+        """Close the underlying connection instead of returning it (e.g. after an abandoned unbuffered read)"""
+        if self._released:
+            return
+        self._released = True
+        self._pool.discard(self._raw)
+
+
+class ConnectionPool:
+    """Fixed-size MySQL connection pool with health checks and usage metrics"""
+
+    def __init__(self, db_config, size=10, timeout=5.0, health_check_interval=30.0):
+        self.db_config = dict(db_config)
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._last_used = {}
+
+        # Metrics
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._reconnects = 0
+        self._total_checkout_time = 0.0
+        self._max_checkout_time = 0.0
+
+    def _connect(self):
+        return mysql.connector.connect(**self.db_config)
+
+    def _discard(self, raw):
+        """Drop a broken connection and free its slot"""
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+            self._last_used.pop(id(raw), None)
+
+    def _is_healthy(self, raw):
+        """Ping connections that have been idle longer than the check interval"""
+        idle_for = time.monotonic() - self._last_used.get(id(raw), 0)
+        if idle_for < self.health_check_interval:
+            return True
+        try:
+            raw.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def get_connection(self):
+        """Check out a connection, waiting up to `timeout` seconds for a free slot"""
+        started = time.monotonic()
+        waited = False
+        raw = None
+
+        while raw is None:
+            try:
+                raw = self._idle.get_nowait()
+            except queue.Empty:
+                create = False
+                with self._lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        create = True
+                if create:
+                    try:
+                        raw = self._connect()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    break
+
+                waited = True
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise PoolTimeoutError(msg=f"Timed out after {self.timeout}s waiting for a database connection")
+                try:
+                    raw = self._idle.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+            if not self._is_healthy(raw):
+                self._discard(raw)
+                with self._lock:
+                    self._reconnects += 1
+                raw = None
+
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._total_checkout_time += elapsed
+            self._max_checkout_time = max(self._max_checkout_time, elapsed)
+
+        return PooledConnection(self, raw)
+
+    def release(self, raw):
+        """Return a connection to the pool, discarding it if it is no longer usable"""
+        with self._lock:
+            self._in_use -= 1
+
+        try:
+            if not raw.is_connected():
+                self._discard(raw)
+                return
+            # Never hand out a connection with a half-finished transaction
+            if raw.in_transaction:
+                raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+
+        self._last_used[id(raw)] = time.monotonic()
+        self._idle.put(raw)
+
+    def discard(self, raw):
+        """Close a checked-out connection and free its slot"""
+        with self._lock:
+            self._in_use -= 1
+        self._discard(raw)
+
+    def close_all(self):
+        """Close every idle connection (used on shutdown)"""
+        while True:
+            try:
+                raw = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(raw)
+
+    def get_stats(self):
+        """Return a snapshot of pool metrics"""
+        with self._lock:
+            checkouts = self._checkouts
+            return {
+                'size': self.size,
+                'open_connections': self._created,
+                'in_use': self._in_use,
+                'idle': self._idle.qsize(),
+                'checkouts': checkouts,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'reconnects': self._reconnects,
+                'avg_checkout_ms': round(self._total_checkout_time / checkouts * 1000, 3) if checkouts else 0,
+                'max_checkout_ms': round(self._max_checkout_time * 1000, 3),
+            }
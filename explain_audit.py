@@ -0,0 +1,174 @@
+"""
+EXPLAIN Audit
+Runs EXPLAIN on every query in app.py, plus the list, job-search and resume-archive queries, and flags full table scans.
+
+    python explain_audit.py [app.py ...] [--user-id 1] [--verbose]
+
+Run it against a database seeded at realistic scale: on near-empty tables
+MySQL prefers full scans even where a usable index exists. Placeholders are
+filled with sample values typed from information_schema. Queries built with
+f-strings are reported as skipped; the dynamic paths that matter are covered
+through the query builders. Exits with status 1 when any plan has a full scan.
+"""
+
+import ast
+import re
+import sys
+from collections import defaultdict
+
+import admin_lists
+from admin_export import APPLICANT_RESUMES
+from job_search import fetch_recommended_jobs, recommendation_version
+
+EXPLAINABLE = ('SELECT', 'UPDATE', 'DELETE')
+
+# Column compared against a placeholder: "j.status = %s", "created_at >= %s", "id IN (%s, %s"
+_PLACEHOLDER_COLUMN = re.compile(
+    r'([\w.]+)\s*(?:=|<>|!=|>=|<=|<|>|<=>|LIKE|IN\s*\((?:\s*%s\s*,)*)\s*$', re.IGNORECASE
+)
+
+INTEGER_TYPES = ('int', 'tinyint', 'smallint', 'mediumint', 'bigint', 'decimal')
+DATE_TYPES = ('date', 'datetime', 'timestamp')
+
+
+def extract_queries(path):
+    """(location, sql) for every execute() call in a module; sql is None for dynamic SQL"""
+    with open(path, encoding='utf-8') as source:
+        tree = ast.parse(source.read(), filename=path)
+    queries = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in ('execute', 'executemany') and node.args):
+            continue
+        location = f"{path}:{node.lineno}"
+        argument = node.args[0]
+        if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+            queries.append((location, ' '.join(argument.value.split())))
+        else:
+            queries.append((location, None))
+    return sorted(queries, key=lambda query: int(query[0].rsplit(':', 1)[1]))
+
+
+class RecordingCursor:
+    """Stands in for a dictionary cursor and records the SQL a query builder runs"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, query, params=()):
+        self.statements.append((' '.join(query.split()), list(params)))
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return defaultdict(int)
+
+
+def builder_queries(user_id):
+    """(location, sql, params) for the SQL generated by the list and job-search builders"""
+    cursor = RecordingCursor()
+    for list_query in (admin_lists.USERS, admin_lists.JOBS, admin_lists.APPLICATIONS, admin_lists.COURSES):
+        list_query.fetch(cursor, {'count': '1'})
+    admin_lists.APPLICATIONS.fetch(cursor, {'status': 'Applied'})
+    admin_lists.JOBS.fetch(cursor, {'status': 'Active', 'skill': 'python'})
+
+    fetch_recommended_jobs(cursor, user_id, {}, 20)
+    fetch_recommended_jobs(cursor, user_id, {'job_type': 'Full-time', 'skills': ['python']}, 20)
+    recommendation_version(cursor, user_id)
+    cursor.execute(APPLICANT_RESUMES, [user_id])
+
+    return [(f"builder #{number}", sql, params) for number, (sql, params) in enumerate(cursor.statements, 1)]
+
+
+def column_types(cursor):
+    """{column_name: data_type} for every column in the current database"""
+    cursor.execute("""
+        SELECT column_name, data_type FROM information_schema.columns
+        WHERE table_schema = DATABASE()
+    """)
+    return {name.lower(): data_type.lower() for name, data_type in cursor.fetchall()}
+
+
+def sample_params(sql, types, user_id):
+    """A plausibly typed value for every %s placeholder in `sql`"""
+    params = []
+    for match in re.finditer(r'%s', sql):
+        column = _PLACEHOLDER_COLUMN.search(sql[:match.start()])
+        data_type = types.get(column.group(1).split('.')[-1].lower()) if column else None
+        if data_type in DATE_TYPES:
+            params.append('2024-01-01')
+        elif data_type is None or data_type in INTEGER_TYPES:
+            params.append(user_id)
+        else:
+            params.append('a')
+    return params
+
+
+def explain(cursor, sql, params):
+    """EXPLAIN rows as dicts"""
+    cursor.execute(f"EXPLAIN {sql}", params)
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def audit(connection, paths, user_id=1, verbose=False):
+    """Print a report; returns the number of queries whose plan has a full table scan"""
+    cursor = connection.cursor()
+    types = column_types(cursor)
+
+    queries = []
+    skipped = []
+    for path in paths:
+        for location, sql in extract_queries(path):
+            if sql is None:
+                skipped.append(location)
+            elif sql.split(' ', 1)[0].upper() in EXPLAINABLE:
+                queries.append((location, sql, sample_params(sql, types, user_id)))
+    queries.extend(builder_queries(user_id))
+
+    flagged = 0
+    for location, sql, params in queries:
+        try:
+            plan = explain(cursor, sql, params)
+        except Exception as e:
+            print(f"ERROR      {location}: {e}\n           {sql[:160]}")
+            continue
+        full_scans = [row for row in plan if row.get('type') == 'ALL']
+        if full_scans:
+            flagged += 1
+        if full_scans or verbose:
+            print(f"{'FULL SCAN' if full_scans else 'ok':<10} {location}: {sql[:160]}")
+            for row in plan:
+                print(f"           table={row.get('table')} type={row.get('type')} key={row.get('key')} "
+                      f"rows={row.get('rows')} extra={row.get('Extra')}")
+
+    cursor.close()
+    print(f"\n{len(queries)} queries explained, {flagged} with full table scans, "
+          f"{len(skipped)} dynamic queries skipped")
+    if skipped and verbose:
+        print("Skipped: " + ', '.join(skipped))
+    return flagged
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import mysql.connector
+
+    from config import Config
+
+    parser = argparse.ArgumentParser(description='EXPLAIN every query and flag full table scans')
+    parser.add_argument('paths', nargs='*', default=['app.py'])
+    parser.add_argument('--user-id', type=int, default=1, help='user id used for placeholder values')
+    parser.add_argument('--verbose', action='store_true', help='print every plan, not only full scans')
+    args = parser.parse_args()
+
+    connection = mysql.connector.connect(
+        host=Config.DB_HOST, database=Config.DB_NAME, user=Config.DB_USER,
+        password=Config.DB_PASSWORD, port=Config.DB_PORT
+    )
+    try:
+        sys.exit(1 if audit(connection, args.paths, args.user_id, args.verbose) else 0)
+    finally:
+        connection.close()
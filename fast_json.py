@@ -0,0 +1,144 @@
+"""
+Fast JSON Responses
+JSON provider and response compression shared by both Flask apps.
+
+Uses orjson when it is installed (stdlib json otherwise) and serializes
+datetime/date as ISO 8601 and Decimal as a number in both cases. Responses
+above a size threshold are compressed with brotli or gzip depending on the
+client's Accept-Encoding; streamed responses are gzip-compressed on the fly.
+"""
+
+import datetime
+import decimal
+import gzip
+import json
+import zlib
+
+from flask import Response, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # optional dependency
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:  # optional dependency
+    brotli = None
+    HAS_BROTLI = False
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/csv', 'text/plain', 'text/html')
+
+
+def _default(value):
+    """Types the encoders do not handle natively"""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        # MySQL TIME columns come back as timedelta
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj):
+    """Serialize to UTF-8 JSON bytes with the fastest available encoder"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by dumps_bytes()"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if HAS_ORJSON:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+
+def stream_json_array(rows, chunk_size=500):
+    """Streamed JSON array response for an iterable of rows, flushed every `chunk_size` rows"""
+    def generate():
+        buffer = [b'[']
+        for i, row in enumerate(rows):
+            if i:
+                buffer.append(b',')
+            buffer.append(dumps_bytes(row))
+            if len(buffer) >= chunk_size * 2:
+                yield b''.join(buffer)
+                buffer = []
+        buffer.append(b']\n')
+        yield b''.join(buffer)
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def _gzip_stream(chunks, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        # Sync flush per chunk so the client receives each chunk as it is produced
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def init_app(app, threshold=1024, gzip_level=6, brotli_quality=4):
+    """Install the JSON provider and the compression hook on a Flask app"""
+    app.json = FastJSONProvider(app)
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code < 200 or response.status_code >= 300 or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        accepted = request.accept_encodings
+        response.vary.add('Accept-Encoding')
+
+        if response.is_streamed:
+            if accepted['gzip']:
+                response.response = _gzip_stream(response.response, gzip_level)
+                response.headers['Content-Encoding'] = 'gzip'
+                response.headers.pop('Content-Length', None)
+            return response
+
+        data = response.get_data()
+        if len(data) < threshold:
+            return response
+        if HAS_BROTLI and accepted['br']:
+            response.set_data(brotli.compress(data, quality=brotli_quality))
+            response.headers['Content-Encoding'] = 'br'
+        elif accepted['gzip']:
+            response.set_data(gzip.compress(data, compresslevel=gzip_level))
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            return response
+
+        # The body bytes now depend on the encoding, so a strong validator becomes weak
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    return app
@@ -0,0 +1,368 @@
+"""
+Synthetic Load Data
+Deterministic generator for load testing: users with profiles and skills, jobs, courses, applications and resumes.
+
+    python generate_load_data.py --users 100000 --jobs 50000 [--courses 2000] [--seed 42]
+
+The same seed and scale always produce the same content. Rows are written with
+explicit ids in multi-row INSERTs (unique and foreign key checks are relaxed
+for the session), so run it while nothing else writes to the database.
+Generated users are named load_user_<n> and share the password
+"password123"; --reset removes everything a previous run created. Run
+recommendation_batch.py afterwards to build the recommendation rows.
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+import bcrypt
+
+import data_versions
+from db_batch import DEFAULT_BATCH_SIZE, bulk_insert
+from skill_store import skill_ids, skill_names
+
+# Every generated row is dated within the year before this anchor
+ANCHOR = datetime(2024, 6, 30)
+
+USERNAME_PREFIX = 'load_user_'
+LOAD_ADMIN = 'load_admin'
+COURSE_URL_PREFIX = 'https://example.com/load-courses/'
+
+# Career tracks: (weight, job titles, languages, frameworks, databases, tools)
+TRACKS = {
+    'backend': (25, ['Backend Developer', 'Software Engineer', 'API Engineer'],
+                ['Python', 'Java', 'Go', 'Node.js', 'C#'], ['Django', 'Flask', 'Spring Boot', 'Express', '.NET'],
+                ['PostgreSQL', 'MySQL', 'Redis', 'MongoDB'], ['Docker', 'Git', 'Linux', 'AWS']),
+    'frontend': (20, ['Frontend Developer', 'UI Engineer', 'Web Developer'],
+                 ['JavaScript', 'TypeScript', 'HTML', 'CSS'], ['React', 'Vue.js', 'Angular', 'Next.js'],
+                 ['Firebase', 'MongoDB'], ['Git', 'Webpack', 'Figma', 'Jest']),
+    'data': (18, ['Data Scientist', 'Data Analyst', 'Machine Learning Engineer'],
+             ['Python', 'R', 'SQL', 'Scala'], ['Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch'],
+             ['PostgreSQL', 'BigQuery', 'Snowflake'], ['Jupyter', 'Tableau', 'Spark', 'Airflow']),
+    'devops': (12, ['DevOps Engineer', 'Site Reliability Engineer', 'Cloud Engineer'],
+               ['Python', 'Go', 'Bash'], ['Terraform', 'Ansible'],
+               ['MySQL', 'Redis'], ['Docker', 'Kubernetes', 'AWS', 'Jenkins', 'Linux', 'Prometheus']),
+    'mobile': (10, ['Android Developer', 'iOS Developer', 'Mobile Developer'],
+               ['Kotlin', 'Swift', 'Java', 'Dart'], ['Flutter', 'React Native', 'Jetpack Compose'],
+               ['SQLite', 'Firebase'], ['Android Studio', 'Xcode', 'Git']),
+    'qa': (8, ['QA Engineer', 'Test Automation Engineer'],
+           ['Python', 'Java', 'JavaScript'], ['Selenium', 'Cypress', 'Pytest', 'JUnit'],
+           ['MySQL'], ['Jira', 'Postman', 'Git', 'Jenkins']),
+    'security': (7, ['Security Engineer', 'Security Analyst'],
+                 ['Python', 'C', 'Bash'], ['Metasploit'],
+                 ['PostgreSQL'], ['Wireshark', 'Burp Suite', 'Linux', 'Nmap']),
+}
+TRACK_NAMES = list(TRACKS)
+TRACK_WEIGHTS = [TRACKS[name][0] for name in TRACK_NAMES]
+
+SOFT_SKILLS = ['Communication', 'Teamwork', 'Problem Solving', 'Leadership', 'Time Management', 'Adaptability']
+
+FIRST_NAMES = ['Aarav', 'Diya', 'Vihaan', 'Ananya', 'Arjun', 'Isha', 'Rohan', 'Priya', 'Kabir', 'Meera',
+               'Aditya', 'Sara', 'Karan', 'Nisha', 'Rahul', 'Pooja', 'Vikram', 'Sneha', 'Amit', 'Neha']
+LAST_NAMES = ['Sharma', 'Verma', 'Patel', 'Reddy', 'Iyer', 'Gupta', 'Singh', 'Nair', 'Das', 'Mehta',
+              'Joshi', 'Kapoor', 'Rao', 'Bose', 'Khan', 'Menon']
+CITIES = [('Bangalore', 'Karnataka'), ('Mumbai', 'Maharashtra'), ('Delhi', 'Delhi'), ('Pune', 'Maharashtra'),
+          ('Hyderabad', 'Telangana'), ('Chennai', 'Tamil Nadu'), ('Kolkata', 'West Bengal'),
+          ('Ahmedabad', 'Gujarat'), ('Noida', 'Uttar Pradesh'), ('Gurgaon', 'Haryana')]
+# Job locations skew towards the big hubs
+CITY_WEIGHTS = [24, 16, 14, 12, 12, 9, 4, 3, 3, 3]
+UNIVERSITIES = ['IIT Bombay', 'IIT Delhi', 'NIT Trichy', 'BITS Pilani', 'VIT Vellore', 'Anna University',
+                'Delhi University', 'Pune University', 'Manipal Institute of Technology', 'IIIT Hyderabad']
+QUALIFICATIONS = [('B.Tech', 55), ('M.Tech', 12), ('BCA', 12), ('MCA', 10), ('B.Sc', 8), ('PhD', 3)]
+FIELDS = ['Computer Science', 'Information Technology', 'Electronics', 'Data Science', 'Mathematics']
+
+COMPANY_PREFIXES = ['Tech', 'Data', 'Cloud', 'Quantum', 'Pixel', 'Blue', 'Bright', 'Nova', 'Apex', 'Infinite',
+                    'Smart', 'Green', 'Rapid', 'Core', 'Next']
+COMPANY_SUFFIXES = ['Corp', 'Labs', 'Systems', 'Solutions', 'Technologies', 'Works', 'Analytics', 'Soft']
+JOB_TYPES = [('Full-time', 70), ('Internship', 12), ('Contract', 10), ('Part-time', 8)]
+JOB_STATUSES = [('Active', 85), ('Closed', 12), ('Draft', 3)]
+LEVELS = [('Junior', 0), ('', 2), ('Senior', 5), ('Lead', 8)]
+
+PROVIDERS = ['Udemy', 'Coursera', 'edX', 'GeeksforGeeks', 'Pluralsight', 'FreeCodeCamp']
+COURSE_LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+COURSE_FORMATS = ['{} Fundamentals', 'Complete {} Bootcamp', 'Advanced {}', '{} for Beginners', 'Mastering {}']
+
+APPLICATION_STATUSES = [('Applied', 50), ('Under Review', 22), ('Shortlisted', 12), ('Rejected', 13), ('Accepted', 3)]
+
+
+def _weighted(rng, pairs):
+    return rng.choices([value for value, _ in pairs], weights=[weight for _, weight in pairs])[0]
+
+
+def _popular(rng, items, count):
+    """Distinct items, earlier entries favoured (Zipf-like popularity)"""
+    count = min(count, len(items))
+    weights = [1 / (rank + 1) for rank in range(len(items))]
+    chosen = []
+    while len(chosen) < count:
+        item = rng.choices(items, weights=weights)[0]
+        if item not in chosen:
+            chosen.append(item)
+    return chosen
+
+
+def _timestamp(rng, days=365):
+    return ANCHOR - timedelta(days=rng.random() * days)
+
+
+class LoadDataGenerator:
+    """Writes one deterministic dataset; ids start after the current maximum of each table"""
+
+    def __init__(self, connection, seed=42, batch_size=DEFAULT_BATCH_SIZE):
+        self.connection = connection
+        self.cursor = connection.cursor()
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.skill_ids = {}
+        self.active_job_ids = []
+        self.password_hash = bcrypt.hashpw(b'password123', bcrypt.gensalt()).decode('utf-8')
+
+    def _next_id(self, table):
+        self.cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+        return self.cursor.fetchone()[0]
+
+    def _write(self, table, columns, rows):
+        if rows:
+            bulk_insert(self.cursor, table, columns, rows, batch_size=self.batch_size)
+
+    def _progress(self, label, done, total, started):
+        elapsed = time.time() - started
+        rate = done / elapsed if elapsed > 0 else 0
+        print(f"{label}: {done}/{total} ({rate:.0f} rows/s)")
+
+    def _skill_rows(self, owner_id, names, source=None):
+        rows = []
+        for name in skill_names(names):
+            row = (owner_id, self.skill_ids[name])
+            rows.append(row + (source,) if source else row)
+        return rows
+
+    def load_skills(self):
+        """Register every skill the generator can emit in the skills dictionary"""
+        names = set(SOFT_SKILLS)
+        for _, _, languages, frameworks, databases, tools in TRACKS.values():
+            names.update(languages + frameworks + databases + tools)
+        self.skill_ids = skill_ids(self.cursor, skill_names(sorted(names)))
+        self.connection.commit()
+
+    def generate_courses(self, count):
+        started = time.time()
+        next_id = self._next_id('courses')
+        for offset in range(0, count, self.batch_size):
+            courses, links = [], []
+            for course_id in range(next_id + offset, next_id + min(offset + self.batch_size, count)):
+                track = TRACKS[self.rng.choices(TRACK_NAMES, weights=TRACK_WEIGHTS)[0]]
+                skills = _popular(self.rng, track[2] + track[3] + track[4] + track[5], self.rng.randint(2, 5))
+                title = self.rng.choice(COURSE_FORMATS).format(skills[0])
+                price = 0 if self.rng.random() < 0.35 else self.rng.choice([499, 999, 1999, 2999, 3999])
+                courses.append((
+                    course_id, title, f"Learn {', '.join(skills)} with hands-on projects.",
+                    self.rng.choice(PROVIDERS), self.rng.randint(2, 24), self.rng.choice(COURSE_LEVELS),
+                    ', '.join(skills), f"{COURSE_URL_PREFIX}{course_id}", price,
+                    round(self.rng.uniform(3.5, 5.0), 1), _timestamp(self.rng, 720)
+                ))
+                links.extend(self._skill_rows(course_id, skills))
+            self._write('courses', ('id', 'title', 'description', 'provider', 'duration_weeks', 'difficulty_level',
+                                    'skills_covered', 'course_url', 'price', 'rating', 'created_at'), courses)
+            self._write('course_skill', ('course_id', 'skill_id'), links)
+            self.connection.commit()
+        self._progress('Courses', count, count, started)
+
+    def generate_jobs(self, count, admin_id):
+        started = time.time()
+        next_id = self._next_id('jobs')
+        columns = ('id', 'title', 'company', 'location', 'job_type', 'experience_required', 'salary_min',
+                   'salary_max', 'description', 'requirements', 'skills_required', 'benefits',
+                   'application_deadline', 'status', 'created_by', 'created_at')
+        for offset in range(0, count, self.batch_size):
+            jobs, links = [], []
+            for job_id in range(next_id + offset, next_id + min(offset + self.batch_size, count)):
+                track_name = self.rng.choices(TRACK_NAMES, weights=TRACK_WEIGHTS)[0]
+                _, titles, languages, frameworks, databases, tools = TRACKS[track_name]
+                level, experience = self.rng.choice(LEVELS)
+                experience += self.rng.randint(0, 2)
+                skills = (_popular(self.rng, languages, self.rng.randint(1, 2))
+                          + _popular(self.rng, frameworks, self.rng.randint(1, 2))
+                          + _popular(self.rng, databases, 1) + _popular(self.rng, tools, self.rng.randint(1, 3)))
+                salary_min = (300000 + experience * 150000 + self.rng.randint(0, 20) * 10000)
+                company = f"{self.rng.choice(COMPANY_PREFIXES)} {self.rng.choice(COMPANY_SUFFIXES)}"
+                created_at = _timestamp(self.rng)
+                status = _weighted(self.rng, JOB_STATUSES)
+                jobs.append((
+                    job_id, f"{level} {self.rng.choice(titles)}".strip(), company,
+                    self.rng.choices(CITIES, weights=CITY_WEIGHTS)[0][0], _weighted(self.rng, JOB_TYPES),
+                    experience, salary_min, int(salary_min * self.rng.uniform(1.3, 2.0)),
+                    f"{company} is hiring to build and scale {track_name} systems using {', '.join(skills[:3])}.",
+                    f"{experience}+ years of experience; degree in {self.rng.choice(FIELDS)} or equivalent",
+                    ', '.join(skills), 'Health insurance, learning budget',
+                    (created_at + timedelta(days=60)).date(), status, admin_id, created_at
+                ))
+                links.extend(self._skill_rows(job_id, skills))
+                if status == 'Active':
+                    self.active_job_ids.append(job_id)
+            self._write('jobs', columns, jobs)
+            self._write('job_skill', ('job_id', 'skill_id'), links)
+            self.connection.commit()
+        self._progress('Jobs', count, count, started)
+
+    def _profile(self, user_id, number, track_name):
+        _, _, languages, frameworks, databases, tools = TRACKS[track_name]
+        rng = self.rng
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        city, state = rng.choices(CITIES, weights=CITY_WEIGHTS)[0]
+        experience = min(int(rng.expovariate(0.35)), 20)
+        skills = {
+            'programming_languages': _popular(rng, languages, rng.randint(1, 3)),
+            'frameworks': _popular(rng, frameworks, rng.randint(1, 3)),
+            'database_skills': _popular(rng, databases, rng.randint(1, 2)),
+            'tools': _popular(rng, tools, rng.randint(1, 3)),
+            'soft_skills': _popular(rng, SOFT_SKILLS, rng.randint(1, 3)),
+        }
+        skills['technical_skills'] = skills['programming_languages'] + skills['frameworks']
+        # A user now and then with skills from a second track
+        if rng.random() < 0.15:
+            other = TRACKS[rng.choice(TRACK_NAMES)]
+            skills['tools'] = list(dict.fromkeys(skills['tools'] + _popular(rng, other[5], 1)))
+        graduation_year = ANCHOR.year - experience - rng.randint(0, 1)
+        profile = (
+            user_id, first, last, f"9{rng.randint(100000000, 999999999)}",
+            (ANCHOR - timedelta(days=365 * (21 + experience) + rng.randint(0, 700))).date(),
+            rng.choice(['Male', 'Female', 'Other']), f"{rng.randint(1, 999)} Main Road", city, state, 'India',
+            str(rng.randint(110001, 700099)), _weighted(rng, QUALIFICATIONS), rng.choice(UNIVERSITIES),
+            graduation_year, round(rng.uniform(6.0, 9.9), 2), rng.choice(FIELDS),
+            json.dumps(skills['technical_skills']), json.dumps(skills['soft_skills']),
+            json.dumps(skills['programming_languages']), json.dumps(skills['frameworks']),
+            json.dumps(skills['database_skills']), json.dumps(skills['tools']),
+            experience, track_name.title() + ' roles', rng.choice(['Remote', 'On-site', 'Hybrid']),
+            300000 + experience * 180000 + rng.randint(0, 30) * 10000
+        )
+        resume = {
+            'personalInfo': {'fullName': f"{first} {last}", 'email': f"{USERNAME_PREFIX}{number}@example.com",
+                             'location': city},
+            'summary': f"{track_name.title()} professional with {experience} years of experience.",
+            'skills': skills['technical_skills'] + skills['tools'],
+            'education': [{'degree': profile[11], 'institution': profile[12], 'year': graduation_year}],
+            'experience': [{'title': TRACKS[track_name][1][0], 'years': experience}] if experience else [],
+        }
+        return profile, skills, resume
+
+    def generate_users(self, count, applications_per_user=3.0, resume_ratio=0.3):
+        started = time.time()
+        next_id = self._next_id('users')
+        profile_columns = (
+            'user_id', 'first_name', 'last_name', 'phone', 'date_of_birth', 'gender', 'address', 'city', 'state',
+            'country', 'pincode', 'highest_qualification', 'university', 'graduation_year', 'cgpa',
+            'field_of_study', 'technical_skills', 'soft_skills', 'programming_languages', 'frameworks',
+            'database_skills', 'tools', 'total_experience', 'career_interests', 'work_mode', 'salary_expectation'
+        )
+        active_jobs = self.active_job_ids
+        applications_total = 0
+        for offset in range(0, count, self.batch_size):
+            users, profiles, links, resumes, applications = [], [], [], [], []
+            for user_id in range(next_id + offset, next_id + min(offset + self.batch_size, count)):
+                number = user_id - next_id + 1
+                track_name = self.rng.choices(TRACK_NAMES, weights=TRACK_WEIGHTS)[0]
+                created_at = _timestamp(self.rng)
+                users.append((user_id, f"{USERNAME_PREFIX}{number}", f"{USERNAME_PREFIX}{number}@example.com",
+                              self.password_hash, 'user', created_at))
+                profile, skills, resume = self._profile(user_id, number, track_name)
+                profiles.append(profile)
+                for source, names in skills.items():
+                    links.extend(self._skill_rows(user_id, names, source))
+                if self.rng.random() < resume_ratio:
+                    resumes.append((user_id, f"{resume['personalInfo']['fullName']} Resume", json.dumps(resume),
+                                    created_at + timedelta(days=self.rng.randint(0, 30))))
+                if active_jobs:
+                    # Exponentially distributed application counts, skewed towards later-listed jobs
+                    wanted = min(int(self.rng.expovariate(1 / applications_per_user)) if applications_per_user else 0,
+                                 len(active_jobs))
+                    applied = set()
+                    while len(applied) < wanted:
+                        index = int(len(active_jobs) * (1 - self.rng.random() ** 1.5))
+                        applied.add(active_jobs[min(index, len(active_jobs) - 1)])
+                    for job_id in sorted(applied):
+                        applications.append((user_id, job_id, _weighted(self.rng, APPLICATION_STATUSES),
+                                             created_at + timedelta(days=self.rng.randint(0, 60))))
+            self._write('users', ('id', 'username', 'email', 'password_hash', 'role', 'created_at'), users)
+            self._write('user_profiles', profile_columns, profiles)
+            self._write('user_skill', ('user_id', 'skill_id', 'source'), links)
+            self._write('user_resumes', ('user_id', 'resume_name', 'resume_data', 'created_at'), resumes)
+            self._write('job_applications', ('user_id', 'job_id', 'status', 'applied_at'), applications)
+            self.connection.commit()
+            applications_total += len(applications)
+            self._progress('Users', min(offset + self.batch_size, count), count, started)
+        print(f"Applications: {applications_total}")
+
+    def load_admin(self):
+        """Id of the user recorded as creator of the generated jobs"""
+        self.cursor.execute("SELECT id FROM users WHERE username = %s", (LOAD_ADMIN,))
+        row = self.cursor.fetchone()
+        if row:
+            return row[0]
+        self.cursor.execute(
+            "INSERT INTO users (username, email, password_hash, role) VALUES (%s, %s, %s, 'admin')",
+            (LOAD_ADMIN, f"{LOAD_ADMIN}@example.com", self.password_hash)
+        )
+        self.connection.commit()
+        return self.cursor.lastrowid
+
+    def reset(self):
+        """Delete every row an earlier run generated"""
+        self.cursor.execute("SELECT id FROM users WHERE username = %s", (LOAD_ADMIN,))
+        row = self.cursor.fetchone()
+        if row:
+            self.cursor.execute("DELETE FROM jobs WHERE created_by = %s", (row[0],))
+        self.cursor.execute("DELETE FROM courses WHERE course_url LIKE %s", (COURSE_URL_PREFIX + '%',))
+        self.cursor.execute("DELETE FROM users WHERE username LIKE %s OR username = %s",
+                            (USERNAME_PREFIX.replace('_', '\\_') + '%', LOAD_ADMIN))
+        data_versions.bump(self.cursor, [data_versions.JOBS])
+        self.connection.commit()
+        print("Removed previously generated load data")
+
+    def run(self, users, jobs, courses, applications_per_user=3.0, resume_ratio=0.3):
+        started = time.time()
+        self.cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+        try:
+            self.load_skills()
+            self.generate_courses(courses)
+            self.generate_jobs(jobs, self.load_admin())
+            self.generate_users(users, applications_per_user, resume_ratio)
+            data_versions.bump(self.cursor, [data_versions.JOBS])
+            self.connection.commit()
+        finally:
+            self.cursor.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+            self.cursor.close()
+        print(f"Load data generated in {time.time() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import mysql.connector
+
+    from config import Config
+
+    parser = argparse.ArgumentParser(description='Generate deterministic synthetic data for load testing')
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--courses', type=int, default=2000)
+    parser.add_argument('--applications-per-user', type=float, default=3.0, help='mean applications per user')
+    parser.add_argument('--resume-ratio', type=float, default=0.3, help='share of users with a saved resume')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=1000, help='rows per multi-row INSERT and commit')
+    parser.add_argument('--reset', action='store_true', help='delete data from an earlier run first')
+    args = parser.parse_args()
+
+    connection = mysql.connector.connect(
+        host=Config.DB_HOST, database=Config.DB_NAME, user=Config.DB_USER,
+        password=Config.DB_PASSWORD, port=Config.DB_PORT
+    )
+    try:
+        generator = LoadDataGenerator(connection, seed=args.seed, batch_size=args.batch_size)
+        if args.reset:
+            generator.reset()
+        generator.run(args.users, args.jobs, args.courses, args.applications_per_user, args.resume_ratio)
+    finally:
+        connection.close()
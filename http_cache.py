@@ -0,0 +1,50 @@
+"""
+Conditional Requests
+ETag / Last-Modified helpers so unchanged resources answer 304 before any JSON is built
+"""
+
+import hashlib
+import json
+
+from flask import request, jsonify, make_response
+
+
+def make_etag(*parts):
+    """ETag value for a resource version (row ids, timestamps, counters, query args)"""
+    raw = json.dumps(parts, default=str, separators=(',', ':'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _set_validators(response, etag, last_modified=None):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Browsers may keep the body but must revalidate before reusing it
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def not_modified(etag, last_modified=None):
+    """Return a 304 response if the client's copy is current, otherwise None"""
+    if request.if_none_match:
+        fresh = request.if_none_match.contains_weak(etag)
+    elif last_modified is not None and request.if_modified_since:
+        # Both sides compared as naive UTC-formatted values, as sent in Last-Modified
+        fresh = last_modified.replace(microsecond=0, tzinfo=None) <= request.if_modified_since.replace(tzinfo=None)
+    else:
+        fresh = False
+    if not fresh:
+        return None
+    return _set_validators(make_response('', 304), etag, last_modified)
+
+
+def conditional_json(body, etag, last_modified=None, status=200):
+    """JSON response carrying the ETag (and Last-Modified) it was built for"""
+    return _set_validators(make_response(jsonify(body), status), etag, last_modified)
+
+
+def conditional_bytes(body, etag, mimetype):
+    """Binary response (PDF, ZIP, ...) carrying the ETag it was built for"""
+    response = make_response(body)
+    response.mimetype = mimetype
+    return _set_validators(response, etag)
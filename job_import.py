@@ -0,0 +1,293 @@
+"""
+Bulk Job Import
+Loads job postings from CSV, JSON or NDJSON feeds with per-row validation, one transaction per chunk.
+
+Used by POST /api/admin/jobs/import and from the command line:
+
+    python job_import.py feed.csv [--format csv|json|ndjson] [--batch-size 500]
+
+Jobs imported from the command line are not in a running server's in-memory
+skill index until it restarts; their recommendation rows are refreshed here.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+
+from mysql.connector import Error
+
+import data_versions
+from db_batch import DEFAULT_BATCH_SIZE, bulk_insert, chunked
+from job_search import JOB_TYPES
+from skill_store import set_job_skills
+
+IMPORT_FORMATS = ('csv', 'json', 'ndjson')
+
+JOB_STATUSES = ('Active', 'Closed', 'Draft')
+
+IMPORT_COLUMNS = (
+    'title', 'company', 'location', 'job_type', 'experience_required', 'salary_min', 'salary_max',
+    'description', 'requirements', 'skills_required', 'benefits', 'application_deadline', 'status',
+    'created_by'
+)
+
+REQUIRED_FIELDS = ('title', 'company', 'description')
+
+# Column limits from the jobs table
+MAX_LENGTHS = {'title': 200, 'company': 100, 'location': 100}
+
+# Cap on the per-row errors returned to the caller
+MAX_REPORTED_ERRORS = 1000
+
+
+def detect_format(filename=None, content_type=None):
+    """Guess the feed format from a file name or Content-Type; None if unknown"""
+    if filename:
+        extension = filename.rsplit('.', 1)[-1].lower()
+        if extension in ('ndjson', 'jsonl'):
+            return 'ndjson'
+        if extension in ('csv', 'json'):
+            return extension
+    if content_type:
+        if 'ndjson' in content_type:
+            return 'ndjson'
+        if 'csv' in content_type:
+            return 'csv'
+        if 'json' in content_type:
+            return 'json'
+    return None
+
+
+def read_records(stream, feed_format):
+    """Yield (row_number, record) pairs from a binary or text stream"""
+    if feed_format not in IMPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(IMPORT_FORMATS)}")
+    if isinstance(stream, (bytes, str)):
+        stream = io.BytesIO(stream.encode('utf-8') if isinstance(stream, str) else stream)
+    if not isinstance(stream, io.TextIOBase):
+        if not hasattr(stream, 'read1'):
+            stream = io.BufferedReader(stream)
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    if feed_format == 'csv':
+        # Row 1 is the header
+        for number, record in enumerate(csv.DictReader(stream), start=2):
+            yield number, record
+    elif feed_format == 'ndjson':
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, ValueError(f"Invalid JSON: {e}")
+    else:
+        data = json.load(stream)
+        if isinstance(data, dict):
+            data = data.get('jobs', [])
+        if not isinstance(data, list):
+            raise ValueError('JSON feed must be a list of jobs or {"jobs": [...]}')
+        for number, record in enumerate(data, start=1):
+            yield number, record
+
+
+def normalize_skills(value):
+    """Trim, drop empties and de-duplicate (case-insensitively) a skills list or comma string"""
+    if not value:
+        return ''
+    items = value.split(',') if isinstance(value, str) else value
+    seen = set()
+    skills = []
+    for item in items:
+        skill = str(item).strip()
+        if skill and skill.lower() not in seen:
+            seen.add(skill.lower())
+            skills.append(skill)
+    return ', '.join(skills)
+
+
+def _optional_int(record, field):
+    value = record.get(field)
+    if value in (None, ''):
+        return None
+    number = int(float(value)) if isinstance(value, str) and '.' in value else int(value)
+    if number < 0:
+        raise ValueError(f"{field} must not be negative")
+    return number
+
+
+def validate_job(record, created_by=None):
+    """Return the INSERT row for one record; raises ValueError describing the first problem"""
+    if isinstance(record, Exception):
+        raise ValueError(str(record))
+    if not isinstance(record, dict):
+        raise ValueError('Row must be an object')
+
+    def text(field):
+        value = record.get(field)
+        return str(value).strip() if value not in (None, '') else None
+
+    for field in REQUIRED_FIELDS:
+        if not text(field):
+            raise ValueError(f"{field} is required")
+    for field, limit in MAX_LENGTHS.items():
+        if text(field) and len(text(field)) > limit:
+            raise ValueError(f"{field} is longer than {limit} characters")
+
+    job_type = text('job_type') or 'Full-time'
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"job_type must be one of {', '.join(JOB_TYPES)}")
+    status = text('status') or 'Active'
+    if status not in JOB_STATUSES:
+        raise ValueError(f"status must be one of {', '.join(JOB_STATUSES)}")
+
+    try:
+        experience = _optional_int(record, 'experience_required') or 0
+        salary_min = _optional_int(record, 'salary_min')
+        salary_max = _optional_int(record, 'salary_max')
+    except (TypeError, ValueError) as e:
+        raise ValueError(str(e) if 'negative' in str(e) else 'experience and salary fields must be integers')
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        raise ValueError('salary_min must not exceed salary_max')
+
+    deadline = text('application_deadline')
+    if deadline:
+        try:
+            deadline = datetime.strptime(deadline[:10], '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError('application_deadline must be YYYY-MM-DD')
+
+    return (
+        text('title'), text('company'), text('location'), job_type, experience, salary_min, salary_max,
+        text('description'), text('requirements'), normalize_skills(record.get('skills_required')),
+        text('benefits'), deadline, status, created_by
+    )
+
+
+def _insert_jobs(cursor, rows):
+    """
+    Bulk insert rows and return their ids in row order.
+
+    A multi-row INSERT reports only its first id, and with interleaved
+    auto-increment locking (innodb_autoinc_lock_mode=2) concurrent inserts can
+    take ids inside that range. Each chunk is therefore tagged with its own
+    import_batch marker and its ids are read back by it; ids within one
+    statement still ascend in row order.
+    """
+    marker = uuid.uuid4().hex
+    bulk_insert(cursor, 'jobs', IMPORT_COLUMNS + ('import_batch',), [row + (marker,) for row in rows],
+                batch_size=len(rows))
+    cursor.execute("SELECT id FROM jobs WHERE import_batch = %s ORDER BY id", (marker,))
+    job_ids = [row[0] for row in cursor.fetchall()]
+    if len(job_ids) != len(rows):
+        raise Error(msg=f'Expected {len(rows)} imported ids, found {len(job_ids)}')
+    return job_ids
+
+
+def import_jobs(connection, records, created_by=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Validate and insert (row_number, record) pairs one chunk per transaction.
+
+    Invalid rows are skipped and reported; a chunk that fails in the database
+    is rolled back and all of its rows are reported. A feed that cannot be
+    read to the end (bad encoding, malformed JSON or CSV) stops the import
+    with `read_error` set; chunks before that point stay committed. Returns a
+    summary dict with the inserted job ids (and their skills) for the caller
+    to index.
+    """
+    summary = {'inserted': 0, 'failed': 0, 'errors': [], 'job_ids': [], 'skills': {}, 'read_error': None}
+
+    def report(number, message):
+        summary['failed'] += 1
+        if len(summary['errors']) < MAX_REPORTED_ERRORS:
+            summary['errors'].append({'row': number, 'error': message})
+
+    def readable(records):
+        try:
+            yield from records
+        except (ValueError, csv.Error) as e:
+            summary['read_error'] = f"Feed could not be read past this point: {e}"
+
+    cursor = connection.cursor()
+    try:
+        for chunk in chunked(readable(records), batch_size):
+            rows = []
+            numbers = []
+            for number, record in chunk:
+                try:
+                    rows.append(validate_job(record, created_by))
+                    numbers.append(number)
+                except ValueError as e:
+                    report(number, str(e))
+            if not rows:
+                continue
+
+            try:
+                job_ids = _insert_jobs(cursor, rows)
+                set_job_skills(cursor, [(job_id, row[9]) for job_id, row in zip(job_ids, rows)])
+                data_versions.bump(cursor, [data_versions.JOBS])
+                connection.commit()
+            except Error as e:
+                connection.rollback()
+                for number in numbers:
+                    report(number, f"Database error: {e}")
+                continue
+
+            summary['inserted'] += len(rows)
+            summary['job_ids'].extend(job_ids)
+            for job_id, row in zip(job_ids, rows):
+                # Only active postings take part in matching
+                if row[12] == 'Active':
+                    summary['skills'][job_id] = row[9]
+    finally:
+        cursor.close()
+
+    summary['errors_truncated'] = summary['failed'] > len(summary['errors'])
+    print(f"Job import finished: {summary['inserted']} inserted, {summary['failed']} failed")
+    if summary['read_error']:
+        print(f"Job import stopped early: {summary['read_error']}")
+    return summary
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import mysql.connector
+
+    from config import Config
+    from recommendation_batch import refresh_job_recommendations
+    from skill_index import SkillIndex
+    from skill_store import load_active_job_skills
+    from recommendation_scoring import load_profile_skills
+
+    parser = argparse.ArgumentParser(description='Bulk import job postings')
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=IMPORT_FORMATS, default=None)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--created-by', type=int, default=None, help='user id recorded as the creator')
+    args = parser.parse_args()
+
+    feed_format = args.format or detect_format(args.path)
+    if not feed_format:
+        parser.error('cannot tell the feed format from the file name; pass --format')
+
+    connection = mysql.connector.connect(
+        host=Config.DB_HOST, database=Config.DB_NAME, user=Config.DB_USER,
+        password=Config.DB_PASSWORD, port=Config.DB_PORT
+    )
+    try:
+        with open(args.path, 'rb') as feed:
+            result = import_jobs(connection, read_records(feed, feed_format), args.created_by, args.batch_size)
+        for error in result['errors']:
+            print(f"Row {error['row']}: {error['error']}")
+        if result['job_ids']:
+            # One incremental refresh covering every imported job
+            refresh_job_recommendations(
+                connection, result['job_ids'],
+                SkillIndex(load_active_job_skills, name='jobs'),
+                SkillIndex(load_profile_skills, name='users')
+            )
+    finally:
+        connection.close()
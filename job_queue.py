@@ -0,0 +1,141 @@
+"""
+Background Job Queue
+A small in-process work queue that runs one job per key at a time with a pool of worker threads
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+
+
+class KeyedJobQueue:
+    """Deduplicating job queue: at most one pending and one running job per key"""
+
+    def __init__(self, handler, workers=2, name='jobs', history_size=10000):
+        self.handler = handler
+        self.workers = workers
+        self.name = name
+        self.history_size = history_size
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._pending = set()     # keys waiting in the queue
+        self._running = set()     # keys currently being processed
+        self._rerun = set()       # keys resubmitted while running
+        self._status = OrderedDict()
+
+        # Metrics
+        self._submitted = 0
+        self._deduplicated = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_run_time = 0.0
+
+    def _ensure_workers(self):
+        """Start worker threads on first use"""
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"{self.name}-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _set_status(self, key, state, **extra):
+        entry = {'state': state, 'updated_at': time.time()}
+        entry.update(extra)
+        self._status[key] = entry
+        self._status.move_to_end(key)
+        if len(self._status) <= self.history_size:
+            return
+        # Evict the oldest finished keys; queued and running keys keep their status
+        overflow = len(self._status) - self.history_size
+        finished = (old for old in self._status if old not in self._pending and old not in self._running)
+        for old in list(islice(finished, overflow)):
+            del self._status[old]
+
+    def submit(self, key):
+        """Queue work for `key`; duplicate submissions are coalesced"""
+        with self._lock:
+            self._ensure_workers()
+            self._submitted += 1
+
+            if key in self._pending:
+                self._deduplicated += 1
+                return self._status[key]
+
+            if key in self._running:
+                # Run once more after the current pass so the latest data is used
+                self._rerun.add(key)
+                self._deduplicated += 1
+                return self._status[key]
+
+            self._pending.add(key)
+            self._set_status(key, 'queued')
+            self._queue.put(key)
+            return self._status[key]
+
+    def status(self, key):
+        """Return the latest known state for `key`, or None"""
+        with self._lock:
+            entry = self._status.get(key)
+            if entry is None:
+                return None
+            result = dict(entry)
+            result['rerun_scheduled'] = key in self._rerun
+            return result
+
+    def _worker(self):
+        while True:
+            key = self._queue.get()
+            with self._lock:
+                self._pending.discard(key)
+                self._running.add(key)
+                self._set_status(key, 'running')
+
+            started = time.monotonic()
+            error = None
+            try:
+                self.handler(key)
+            except Exception as e:
+                error = str(e)
+                print(f"Error in {self.name} job for {key}: {e}")
+            elapsed = time.monotonic() - started
+
+            with self._lock:
+                self._running.discard(key)
+                self._total_run_time += elapsed
+                if error:
+                    self._failed += 1
+                    self._set_status(key, 'failed', error=error, duration_ms=round(elapsed * 1000, 3))
+                else:
+                    self._completed += 1
+                    self._set_status(key, 'completed', duration_ms=round(elapsed * 1000, 3))
+
+                if key in self._rerun:
+                    self._rerun.discard(key)
+                    self._pending.add(key)
+                    self._set_status(key, 'queued')
+                    self._queue.put(key)
+            self._queue.task_done()
+
+    def wait(self):
+        """Block until every queued job has been processed"""
+        self._queue.join()
+
+    def get_stats(self):
+        """Return a snapshot of queue metrics"""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                'workers': self.workers,
+                'queued': len(self._pending),
+                'running': len(self._running),
+                'submitted': self._submitted,
+                'deduplicated': self._deduplicated,
+                'completed': self._completed,
+                'failed': self._failed,
+                'avg_run_ms': round(self._total_run_time / finished * 1000, 3) if finished else 0,
+            }
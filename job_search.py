@@ -0,0 +1,245 @@
+"""
+Job Search
+Server-side filtering and keyset pagination for the job recommendation list
+"""
+
+from decimal import Decimal, InvalidOperation
+
+import data_versions
+from pagination import encode_cursor, decode_cursor, keyset_condition, keyset_params
+from skill_store import skill_filter
+
+JOB_TYPES = ('Full-time', 'Part-time', 'Contract', 'Internship')
+
+# Scored jobs first, best recommendation first, walking idx_rec_user_type_score_job
+SCORED_ORDER = (('r.score', 'DESC'), ('r.job_id', 'DESC'))
+SCORED_QUERY = """
+    SELECT {columns}
+    FROM recommendations r
+    JOIN jobs j ON j.id = r.job_id
+    LEFT JOIN job_applications ja ON j.id = ja.job_id AND ja.user_id = %s
+    WHERE r.user_id = %s AND r.recommendation_type = 'job' AND r.score IS NOT NULL AND {where}
+"""
+
+# Then jobs without a score, newest first, walking idx_jobs_status_created
+UNSCORED_ORDER = (('j.created_at', 'DESC'), ('j.id', 'DESC'))
+UNSCORED_QUERY = """
+    SELECT {columns}
+    FROM jobs j
+    LEFT JOIN job_applications ja ON j.id = ja.job_id AND ja.user_id = %s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM recommendations r
+        WHERE r.user_id = %s AND r.recommendation_type = 'job' AND r.job_id = j.id AND r.score IS NOT NULL
+    ) AND {where}
+"""
+
+# Used by fetch_ranked_jobs, which orders in Python
+BASE_QUERY = """
+    SELECT {columns}
+    FROM jobs j
+    LEFT JOIN recommendations r ON j.id = r.job_id AND r.user_id = %s AND r.recommendation_type = 'job'
+    LEFT JOIN job_applications ja ON j.id = ja.job_id AND ja.user_id = %s
+    WHERE {where}
+"""
+
+JOB_COLUMNS = """j.*, r.score as recommendation_score, r.reason as recommendation_reason,
+           ja.status as application_status, ja.applied_at,
+           COALESCE(r.score, 0) as sort_score"""
+
+UNSCORED_COLUMNS = """j.*, NULL as recommendation_score, NULL as recommendation_reason,
+           ja.status as application_status, ja.applied_at"""
+
+
+def _int_arg(args, name):
+    value = args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+
+
+def parse_job_filters(args):
+    """Read the supported filters from request args; raises ValueError on bad input"""
+    filters = {
+        'location': (args.get('location') or '').strip() or None,
+        'job_type': args.get('job_type') or None,
+        'salary_min': _int_arg(args, 'salary_min'),
+        'salary_max': _int_arg(args, 'salary_max'),
+        'experience': _int_arg(args, 'experience'),
+        'q': (args.get('q') or '').strip() or None,
+        'skills': [skill for skill in (args.get('skills') or '').split(',') if skill.strip()] or None,
+    }
+    if filters['job_type'] and filters['job_type'] not in JOB_TYPES:
+        raise ValueError(f"job_type must be one of {', '.join(JOB_TYPES)}")
+    return filters
+
+
+def _where(filters):
+    conditions = ["j.status = 'Active'"]
+    params = []
+    if filters.get('location'):
+        conditions.append("j.location LIKE %s")
+        params.append(f"%{filters['location']}%")
+    if filters.get('job_type'):
+        conditions.append("j.job_type = %s")
+        params.append(filters['job_type'])
+    if filters.get('salary_min') is not None:
+        # Salary ranges that reach the requested minimum
+        conditions.append("(j.salary_max >= %s OR (j.salary_max IS NULL AND j.salary_min >= %s))")
+        params.extend([filters['salary_min'], filters['salary_min']])
+    if filters.get('salary_max') is not None:
+        conditions.append("(j.salary_min <= %s OR j.salary_min IS NULL)")
+        params.append(filters['salary_max'])
+    if filters.get('experience') is not None:
+        # Jobs the candidate has enough experience for
+        conditions.append("j.experience_required <= %s")
+        params.append(filters['experience'])
+    if filters.get('q'):
+        conditions.append("(j.title LIKE %s OR j.company LIKE %s OR j.skills_required LIKE %s)")
+        params.extend([f"%{filters['q']}%"] * 3)
+    if filters.get('skills'):
+        # Jobs requiring any of the skills, through the indexed job_skill join
+        condition, skill_params = skill_filter('j.id', 'job_skill', 'job_id', filters['skills'])
+        conditions.append(condition)
+        params.extend(skill_params)
+    return conditions, params
+
+
+def _cursor_values(token):
+    """(phase, values) from a page cursor; phase 's' is scored jobs, 'u' unscored ones"""
+    values = decode_cursor(token)
+    if values is None:
+        return 's', None
+    try:
+        phase = values[0]
+        if phase == 's' and len(values) == 3:
+            return phase, [Decimal(str(values[1])), int(values[2])]
+        if phase == 'u' and len(values) == 1:
+            return phase, None
+        if phase == 'u' and len(values) == 3:
+            return phase, [str(values[1]), int(values[2])]
+    except (ValueError, TypeError, InvalidOperation, IndexError):
+        pass
+    raise ValueError('Invalid cursor')
+
+
+def _fetch_phase(cursor, query, columns, order, user_id, filters, limit, after):
+    conditions, params = _where(filters)
+    if after:
+        conditions.append(keyset_condition([c for c, _ in order], [d for _, d in order]))
+        params.extend(keyset_params(after))
+    query = query.format(columns=columns, where=' AND '.join(conditions))
+    query += f" ORDER BY {', '.join(f'{c} {d}' for c, d in order)} LIMIT %s"
+    cursor.execute(query, [user_id, user_id] + params + [limit + 1])
+    return cursor.fetchall()
+
+
+def fetch_recommended_jobs(cursor, user_id, filters, limit, after=None):
+    """
+    One page of active jobs; returns (jobs, next_cursor).
+
+    Jobs with a recommendation score come first, ordered by (score, job_id)
+    over the user's recommendation rows, then the rest by (created_at, id).
+    Each phase is a keyset range over an index, so a page costs the same
+    however deep it is; the cursor records which phase it is in.
+    """
+    phase, cursor_values = _cursor_values(after)
+    jobs = []
+    next_cursor = None
+
+    if phase == 's':
+        jobs = _fetch_phase(cursor, SCORED_QUERY, JOB_COLUMNS, SCORED_ORDER,
+                            user_id, filters, limit, cursor_values)
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            last = jobs[-1]
+            next_cursor = encode_cursor(['s', str(last['recommendation_score']), last['id']])
+        cursor_values = None
+
+    remaining = limit - len(jobs)
+    if next_cursor is None:
+        # Scored jobs are exhausted: fill the page from the unscored phase
+        unscored = _fetch_phase(cursor, UNSCORED_QUERY, UNSCORED_COLUMNS, UNSCORED_ORDER,
+                                user_id, filters, remaining, cursor_values)
+        if len(unscored) > remaining:
+            unscored = unscored[:remaining]
+            last = unscored[-1] if unscored else None
+            next_cursor = encode_cursor(['u', str(last['created_at']), last['id']] if last else ['u'])
+        jobs.extend(unscored)
+
+    for job in jobs:
+        job.pop('sort_score', None)
+        job['applied'] = job['application_status'] is not None
+    return jobs, next_cursor
+
+
+def fetch_ranked_jobs(cursor, user_id, filters, limit, after, rank_fn):
+    """
+    One page of active jobs ordered by a score computed in Python.
+
+    Only (id, created_at, skill score) is read for the filtered set; full rows
+    are fetched for the page alone. `rank_fn(job_id, skill_score)` returns the
+    match score. Returns (jobs, next_cursor).
+    """
+    conditions, params = _where(filters)
+    query = BASE_QUERY.format(columns="j.id, j.created_at, COALESCE(r.score, 0) as sort_score",
+                              where=' AND '.join(conditions))
+    cursor.execute(query, [user_id, user_id] + params)
+
+    ranked = sorted(
+        ((rank_fn(row['id'], float(row['sort_score'])), str(row['created_at']), row['id'])
+         for row in cursor.fetchall()),
+        reverse=True
+    )
+
+    cursor_values = decode_cursor(after)
+    if cursor_values:
+        try:
+            last = (float(cursor_values[0]), str(cursor_values[1]), int(cursor_values[2]))
+        except (ValueError, TypeError, IndexError):
+            raise ValueError('Invalid cursor')
+        ranked = [key for key in ranked if key < last]
+
+    page = ranked[:limit + 1]
+    next_cursor = encode_cursor(list(page[limit - 1])) if len(page) > limit else None
+    page = page[:limit]
+    if not page:
+        return [], None
+
+    placeholders = ', '.join(['%s'] * len(page))
+    query = BASE_QUERY.format(columns=JOB_COLUMNS, where=f"j.id IN ({placeholders})")
+    cursor.execute(query, [user_id, user_id] + [job_id for _, _, job_id in page])
+    rows = {row['id']: row for row in cursor.fetchall()}
+
+    jobs = []
+    for match_score, _, job_id in page:
+        job = rows.get(job_id)
+        if job is None:
+            continue
+        job.pop('sort_score', None)
+        job['applied'] = job['application_status'] is not None
+        job['match_score'] = round(match_score, 4)
+        jobs.append(job)
+    return jobs, next_cursor
+
+
+def recommendation_version(cursor, user_id):
+    """
+    Cheap fingerprint of everything the recommendation list depends on.
+
+    Job and recommendation changes (deletions included) are read from their
+    data_versions counters, plus the user's applications and profile version
+    (used by text ranking); every lookup is a primary key or a per-user index range.
+    """
+    cursor.execute("""
+        SELECT
+            (SELECT version FROM data_versions WHERE scope = %s) as jobs_version,
+            (SELECT version FROM data_versions WHERE scope = %s) as recs_version,
+            (SELECT COUNT(*) FROM job_applications WHERE user_id = %s) as applications_total,
+            (SELECT MAX(updated_at) FROM job_applications WHERE user_id = %s) as applications_updated,
+            (SELECT row_version FROM user_profiles WHERE user_id = %s) as profile_version
+    """, (data_versions.JOBS, data_versions.recommendations_scope(user_id), user_id, user_id, user_id))
+    row = cursor.fetchone()
+    return [row[key] for key in sorted(row)]
@@ -0,0 +1,186 @@
+"""
+Pagination Helpers
+Opaque keyset cursors and limit parsing shared by the list endpoints
+"""
+
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(values):
+    """Encode the sort key of the last row as an opaque URL-safe token"""
+    raw = json.dumps(values, default=str, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a token produced by encode_cursor; raises ValueError if it is malformed"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list):
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parse a ?limit= value, clamped to 1..maximum"""
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('limit must be an integer')
+    return max(1, min(limit, maximum))
+
+
+def keyset_condition(columns, directions):
+    """
+    SQL condition selecting rows strictly after a cursor for a multi-column sort.
+
+    `columns` are SQL expressions and `directions` 'ASC'/'DESC' for each; the
+    returned condition takes one parameter list built by keyset_params().
+    """
+    clauses = []
+    for i, (column, direction) in enumerate(zip(columns, directions)):
+        operator = '<' if direction.upper() == 'DESC' else '>'
+        parts = [f"{previous} = %s" for previous in columns[:i]]
+        parts.append(f"{column} {operator} %s")
+        clauses.append('(' + ' AND '.join(parts) + ')')
+    return '(' + ' OR '.join(clauses) + ')'
+
+
+def keyset_params(values):
+    """Parameters matching keyset_condition() for the given cursor values"""
+    params = []
+    for i in range(len(values)):
+        params.extend(values[:i + 1])
+    return params
+
+
+def contains(value):
+    """Filter converter for substring LIKE matches"""
+    return f"%{value}%"
+
+
+class ListQuery:
+    """
+    A paginated, filterable list over one table (or join).
+
+    Supports ?limit=, ?cursor= (keyset on the sort column plus id),
+    ?sort=[-]column, ?fields=a,b,c projection, declared filters and an
+    optional ?count=1 total. Only whitelisted names ever reach the SQL.
+    """
+
+    def __init__(self, from_clause, columns, sorts, filters, default_sort, id_column,
+                 default_fields=None):
+        self.from_clause = from_clause
+        self.columns = columns                  # field name -> SQL expression
+        self.sorts = sorts                      # sort name -> SQL expression (non-null)
+        self.filters = filters                  # arg name -> (SQL condition, converter)
+        self.default_sort = default_sort        # e.g. '-created_at'
+        self.id_column = id_column
+        self.default_fields = default_fields or list(columns)
+
+    def _parse_sort(self, value):
+        value = value or self.default_sort
+        direction = 'DESC' if value.startswith('-') else 'ASC'
+        name = value.lstrip('-')
+        if name not in self.sorts:
+            raise ValueError(f"sort must be one of {', '.join(sorted(self.sorts))}")
+        return name, direction
+
+    def _parse_fields(self, value):
+        if not value:
+            return list(self.default_fields)
+        fields = [field.strip() for field in value.split(',') if field.strip()]
+        unknown = [field for field in fields if field not in self.columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        if 'id' not in fields:
+            fields.insert(0, 'id')
+        return fields
+
+    def _where(self, args):
+        conditions = []
+        params = []
+        for name, (condition, convert) in self.filters.items():
+            value = args.get(name)
+            if value in (None, ''):
+                continue
+            try:
+                value = convert(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {name}")
+            conditions.append(condition)
+            params.extend([value] * condition.count('%s'))
+        return conditions, params
+
+    def fetch(self, cursor, args):
+        """Run the query for request args; returns a dict with items, next_cursor, has_more and total"""
+        limit = parse_limit(args.get('limit'), default=50)
+        sort_name, direction = self._parse_sort(args.get('sort'))
+        fields = self._parse_fields(args.get('fields'))
+        conditions, params = self._where(args)
+        count_params = list(params)
+        count_conditions = list(conditions)
+
+        sort_columns = (self.sorts[sort_name], self.id_column)
+        after = decode_cursor(args.get('cursor'))
+        if after:
+            if len(after) != 3 or after[0] != f"{'-' if direction == 'DESC' else ''}{sort_name}":
+                raise ValueError('Cursor does not match the requested sort')
+            conditions.append(keyset_condition(sort_columns, (direction, direction)))
+            params.extend(keyset_params(after[1:]))
+
+        select = ', '.join(f"{self.columns[field]} AS {field}" for field in fields)
+        query = f"SELECT {select}, {self.sorts[sort_name]} AS _sort_key FROM {self.from_clause}"
+        if conditions:
+            query += " WHERE " + ' AND '.join(conditions)
+        query += f" ORDER BY {sort_columns[0]} {direction}, {sort_columns[1]} {direction} LIMIT %s"
+        cursor.execute(query, params + [limit + 1])
+        items = cursor.fetchall()
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor([f"{'-' if direction == 'DESC' else ''}{sort_name}",
+                                         last['_sort_key'], last['id']])
+        for item in items:
+            item.pop('_sort_key', None)
+
+        result = {'items': items, 'next_cursor': next_cursor, 'has_more': next_cursor is not None}
+        if args.get('count') in ('1', 'true'):
+            count_query = f"SELECT COUNT(*) AS total FROM {self.from_clause}"
+            if count_conditions:
+                count_query += " WHERE " + ' AND '.join(count_conditions)
+            cursor.execute(count_query, count_params)
+            result['total'] = cursor.fetchone()['total']
+        return result
+
+    def export_query(self, args):
+        """(sql, params, fields) selecting every filtered row in id order, for streaming exports"""
+        fields = self._parse_fields(args.get('fields'))
+        conditions, params = self._where(args)
+        select = ', '.join(f"{self.columns[field]} AS {field}" for field in fields)
+        query = f"SELECT {select} FROM {self.from_clause}"
+        if conditions:
+            query += " WHERE " + ' AND '.join(conditions)
+        query += f" ORDER BY {self.id_column}"
+        return query, params, fields
+
+
+def list_response(key, page):
+    """JSON body for a ListQuery page, with the items under `key`"""
+    body = {key: page['items'], 'next_cursor': page['next_cursor'], 'has_more': page['has_more']}
+    if 'total' in page:
+        body['total'] = page['total']
+    return body
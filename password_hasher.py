@@ -0,0 +1,96 @@
+"""
+Password Hasher
+bcrypt hashing and verification on a small dedicated thread pool with admission control.
+
+bcrypt releases the GIL, so a few worker threads hash in parallel while the
+number of hashes in flight stays bounded. When max_pending jobs are already
+running or queued, new requests are rejected with HasherBusy (HTTP 429)
+instead of piling up behind a login burst and starving other endpoints.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import bcrypt
+
+
+class HasherBusy(Exception):
+    """Too many password hashes are already running or queued"""
+
+
+class PasswordHasher:
+    """Bounded bcrypt executor; `rounds` is the cost factor for new hashes"""
+
+    def __init__(self, workers=2, max_pending=16, rounds=12, timeout=10):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._rehashed = 0
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+        self._slots.release()
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HasherBusy('Too many login requests, please retry shortly')
+        with self._lock:
+            self._pending += 1
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HasherBusy('Password check timed out, please retry shortly')
+
+    def hash(self, password):
+        """bcrypt hash of a password at the configured cost"""
+        return self._run(
+            lambda: bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+        )
+
+    def verify(self, password, password_hash):
+        """True if the password matches the stored hash"""
+        return self._run(lambda: bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8')))
+
+    def needs_rehash(self, password_hash):
+        """True if the hash was made with a different cost factor ("$2b$<cost>$...")"""
+        try:
+            return int(password_hash.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    def upgrade(self, password, password_hash):
+        """New hash if the stored one uses another cost factor, else None (also None when the pool is busy)"""
+        if not self.needs_rehash(password_hash):
+            return None
+        try:
+            new_hash = self.hash(password)
+        except HasherBusy:
+            return None  # upgraded on a later login
+        with self._lock:
+            self._rehashed += 1
+        return new_hash
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'rounds': self.rounds,
+                'max_pending': self.max_pending,
+                'pending': self._pending,
+                'completed': self._completed,
+                'rejected': self._rejected,
+                'rehashed': self._rehashed,
+            }
@@ -0,0 +1,119 @@
+"""
+Rate Limit
+In-process token buckets for login throttling.
+
+Each bucket is a (tokens, last_update) tuple in a dict keyed by IP address or
+username. Buckets that have refilled completely are indistinguishable from new
+ones, so they are evicted every sweep_interval seconds; max_keys caps memory
+when many distinct keys arrive between sweeps, evicting the least recently
+used down to 90% of it so a flood of new keys sweeps only once per 10%.
+Limits are per process.
+"""
+
+import heapq
+import threading
+import time
+
+
+class TokenBucketLimiter:
+    """`rate` tokens per second up to `burst`; one token per counted attempt"""
+
+    def __init__(self, rate, burst, max_keys=100000, sweep_interval=60):
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.low_water = int(max_keys * 0.9)
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._allowed = 0
+        self._limited = 0
+        self._evicted = 0
+
+    def _tokens(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return self.burst
+        tokens, updated = bucket
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def _wait(self, tokens):
+        return max(1, int((1 - tokens) / self.rate + 0.999))
+
+    def _sweep(self, now, trim=False):
+        full = [key for key, (tokens, updated) in self._buckets.items()
+                if tokens + (now - updated) * self.rate >= self.burst]
+        for key in full:
+            del self._buckets[key]
+        # Trimming below max_keys leaves room, so the next size-triggered sweep is 10% of max_keys away
+        overflow = len(self._buckets) - self.low_water if trim else 0
+        if overflow > 0:
+            oldest = heapq.nsmallest(overflow, self._buckets.items(), key=lambda item: item[1][1])
+            for key, _ in oldest:
+                del self._buckets[key]
+            full.extend(oldest)
+        self._evicted += len(full)
+        self._next_sweep = now + self.sweep_interval
+
+    def hit(self, key):
+        """Take a token; returns 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep or len(self._buckets) >= self.max_keys:
+                self._sweep(now, trim=len(self._buckets) >= self.max_keys)
+            tokens = self._tokens(key, now)
+            if tokens < 1:
+                self._limited += 1
+                return self._wait(tokens)
+            self._buckets[key] = (tokens - 1, now)
+            self._allowed += 1
+            return 0
+
+    def check(self, key):
+        """Like hit() without taking a token"""
+        with self._lock:
+            tokens = self._tokens(key, time.monotonic())
+            if tokens < 1:
+                self._limited += 1
+                return self._wait(tokens)
+            return 0
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'rate_per_minute': self.rate * 60,
+                'burst': self.burst,
+                'keys': len(self._buckets),
+                'allowed': self._allowed,
+                'limited': self._limited,
+                'evicted': self._evicted,
+            }
+
+
+class LoginThrottle:
+    """Per-IP limit on every attempt, per-username limit on failed attempts"""
+
+    def __init__(self, ip_rate, ip_burst, user_rate, user_burst, max_keys=100000):
+        self.by_ip = TokenBucketLimiter(ip_rate / 60, ip_burst, max_keys)
+        self.by_username = TokenBucketLimiter(user_rate / 60, user_burst, max_keys)
+
+    def check(self, ip, username):
+        """Seconds to wait before this attempt is allowed, 0 if it may proceed"""
+        # Only failures drain the username bucket, so a user's own successful logins never count against
+        # them; anyone who sprays wrong passwords for a name does lock that name out until it refills
+        return self.by_ip.hit(ip or 'unknown') or self.by_username.check(self._key(username))
+
+    def failed(self, username):
+        self.by_username.hit(self._key(username))
+
+    @staticmethod
+    def _key(username):
+        return str(username).lower()
+
+    def get_stats(self):
+        return {'ip': self.by_ip.get_stats(), 'username': self.by_username.get_stats()}
@@ -0,0 +1,311 @@
+"""
+Bulk Recommendation Recompute
+Re-scores every user profile against the current job and course catalog.
+
+Profiles are streamed from the database in keyset-ordered chunks, scored in a
+process pool and written back with the batched diff writer. Can be triggered
+from the admin API, run on a schedule, or run from the command line:
+
+    python recommendation_batch.py [--chunk-size 500] [--processes 4] [--engine auto] [--top-k 0]
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from recommendation_scoring import PROFILE_SKILL_FIELDS, score_user, score_job_for_users
+from recommendation_writer import sync_recommendations
+from skill_index import SkillIndex
+from skill_store import load_user_skills
+from skill_matrix import HAS_SPARSE, SparseSkillScorer
+
+# Scoring engines: 'numpy' (sparse matrices), 'python' (skill index) or 'auto'
+ENGINES = ('auto', 'numpy', 'python')
+
+# Catalog state rebuilt once inside each worker process
+_worker_jobs = None
+_worker_courses = None
+_worker_matrix = None
+_worker_top_k = None
+
+
+def resolve_engine(engine):
+    """Pick the scoring engine, falling back to pure Python without NumPy/SciPy"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown recommendation engine: {engine}")
+    if engine == 'python' or not HAS_SPARSE:
+        return 'python'
+    return 'numpy'
+
+
+def _init_worker(job_items, course_items, engine='python', top_k=None):
+    """Process pool initializer: build the catalog once per worker"""
+    global _worker_jobs, _worker_courses, _worker_matrix, _worker_top_k
+    _worker_top_k = top_k
+    if engine == 'numpy':
+        _worker_matrix = SparseSkillScorer(job_items, course_items)
+    else:
+        _worker_matrix = None
+        _worker_jobs = SkillIndex.from_items(job_items, name='jobs')
+        _worker_courses = SkillIndex.from_items(course_items, name='courses')
+
+
+def _limit_per_user(rows, top_k):
+    """Keep the best `top_k` jobs and courses per user, ties to the lowest id (pure Python engine)"""
+    if not top_k:
+        return rows
+    groups = {}
+    for row in rows:
+        groups.setdefault((row[0], row[3]), []).append(row)
+    limited = []
+    for group in groups.values():
+        # Same order as skill_matrix._top_k, so both engines keep the same rows
+        limited.extend(sorted(group, key=lambda row: (-row[4], row[1] if row[3] == 'job' else row[2]))[:top_k])
+    return limited
+
+
+def score_profiles(profiles):
+    """Score a chunk of profiles inside a worker; returns recommendation rows"""
+    if _worker_matrix is not None:
+        return _worker_matrix.score(
+            [profile['user_id'] for profile in profiles],
+            [profile['skills'] for profile in profiles],
+            top_k=_worker_top_k
+        )
+    rows = []
+    for profile in profiles:
+        rows.extend(score_user(profile['user_id'], profile['skills'], _worker_jobs, _worker_courses))
+    return _limit_per_user(rows, _worker_top_k)
+
+
+def refresh_job_recommendations(connection, job_ids, job_index, user_index):
+    """
+    Recompute the recommendation rows of specific jobs across all users.
+
+    Only users sharing at least one skill with a job are scored. Rows for
+    users who no longer qualify, and for closed or deleted jobs, are removed.
+    """
+    job_index.ensure_loaded(connection)
+    user_index.ensure_loaded(connection)
+
+    totals = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    cursor = connection.cursor()
+    try:
+        for job_id in job_ids:
+            # Inactive, deleted or skill-less jobs are not in the index and get no rows
+            rows = score_job_for_users(job_id, job_index.get(job_id), user_index)
+            stats = sync_recommendations(
+                cursor, "job_id = %s AND recommendation_type = 'job'", (job_id,), rows
+            )
+            for key in totals:
+                totals[key] += stats[key]
+        connection.commit()
+    finally:
+        cursor.close()
+
+    print(f"Refreshed recommendations for jobs {list(job_ids)}: {totals}")
+    return totals
+
+
+class BulkRecompute:
+    """Runs a full recommendation recompute and tracks its progress"""
+
+    def __init__(self, get_connection, job_index, course_index, chunk_size=500, processes=None,
+                 engine='auto', top_k=None):
+        self.get_connection = get_connection
+        self.job_index = job_index
+        self.course_index = course_index
+        self.chunk_size = chunk_size
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.engine = resolve_engine(engine)
+        self.top_k = top_k or None
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._progress = {'state': 'idle'}
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def progress(self):
+        """Snapshot of the current or last run"""
+        with self._lock:
+            return dict(self._progress)
+
+    def _update(self, **values):
+        with self._lock:
+            self._progress.update(values)
+            started = self._progress.get('started_at')
+            if started:
+                elapsed = (self._progress.get('finished_at') or time.time()) - started
+                processed = self._progress.get('users_processed', 0)
+                self._progress['elapsed_seconds'] = round(elapsed, 3)
+                self._progress['users_per_second'] = round(processed / elapsed, 2) if elapsed > 0 else 0
+
+    def start(self):
+        """Run in a background thread; returns False if a run is already in progress"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._thread = threading.Thread(target=self.run, name='recommendation-recompute', daemon=True)
+            self._thread.start()
+            return True
+
+    def schedule(self, interval_seconds):
+        """Start a recompute every `interval_seconds` seconds"""
+        def loop():
+            while True:
+                time.sleep(interval_seconds)
+                if not self.start():
+                    print("Scheduled recommendation recompute skipped: previous run still active")
+
+        thread = threading.Thread(target=loop, name='recommendation-recompute-scheduler', daemon=True)
+        thread.start()
+        return thread
+
+    def _stream_profiles(self, connection):
+        """Yield [{'user_id', 'skills'}] chunks ordered by user_id (keyset pagination)"""
+        last_user_id = 0
+        cursor = connection.cursor()
+        try:
+            while True:
+                cursor.execute(
+                    "SELECT user_id FROM user_profiles WHERE user_id > %s ORDER BY user_id LIMIT %s",
+                    (last_user_id, self.chunk_size)
+                )
+                user_ids = [row[0] for row in cursor.fetchall()]
+                if not user_ids:
+                    return
+                last_user_id = user_ids[-1]
+                # Users without matching skills still get their stale rows removed
+                skills = dict(load_user_skills(cursor, user_ids, PROFILE_SKILL_FIELDS))
+                yield [{'user_id': user_id, 'skills': set(skills.get(user_id, ()))} for user_id in user_ids]
+        finally:
+            cursor.close()
+
+    def _write_chunk(self, connection, profiles, rows):
+        """Persist the rows of one chunk in a single transaction"""
+        user_ids = [profile['user_id'] for profile in profiles]
+        placeholders = ', '.join(['%s'] * len(user_ids))
+        cursor = connection.cursor()
+        try:
+            stats = sync_recommendations(cursor, f"user_id IN ({placeholders})", user_ids, rows)
+            connection.commit()
+        finally:
+            cursor.close()
+        return stats
+
+    def run(self):
+        """Recompute recommendations for every user with a profile"""
+        self._update(state='running', engine=self.engine, started_at=time.time(), finished_at=None, error=None,
+                     users_total=0, users_processed=0, chunks=0,
+                     rows_inserted=0, rows_updated=0, rows_deleted=0)
+        print("Starting bulk recommendation recompute...")
+
+        read_connection = self.get_connection()
+        write_connection = self.get_connection()
+        executor = None
+        try:
+            if not read_connection or not write_connection:
+                raise RuntimeError('Database connection failed')
+
+            self.job_index.ensure_loaded(read_connection)
+            self.course_index.ensure_loaded(read_connection)
+            job_items = self.job_index.items()
+            course_items = self.course_index.items()
+
+            cursor = read_connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM user_profiles")
+            self._update(users_total=cursor.fetchone()[0])
+            cursor.close()
+
+            if self.processes > 0:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    initializer=_init_worker,
+                    initargs=(job_items, course_items, self.engine, self.top_k)
+                )
+            else:
+                _init_worker(job_items, course_items, self.engine, self.top_k)
+
+            # Keep a bounded number of chunks in flight so memory stays flat
+            max_in_flight = max(self.processes, 1) * 2
+            in_flight = []
+
+            def drain(pending):
+                profiles, result = pending
+                rows = result.result() if executor else result
+                stats = self._write_chunk(write_connection, profiles, rows)
+                with self._lock:
+                    progress = self._progress
+                    progress['users_processed'] += len(profiles)
+                    progress['chunks'] += 1
+                    progress['rows_inserted'] += stats['inserted']
+                    progress['rows_updated'] += stats['updated']
+                    progress['rows_deleted'] += stats['deleted']
+                self._update()
+
+            for profiles in self._stream_profiles(read_connection):
+                if executor:
+                    in_flight.append((profiles, executor.submit(score_profiles, profiles)))
+                else:
+                    in_flight.append((profiles, score_profiles(profiles)))
+                if len(in_flight) >= max_in_flight:
+                    drain(in_flight.pop(0))
+
+            while in_flight:
+                drain(in_flight.pop(0))
+
+            self._update(state='completed', finished_at=time.time())
+            progress = self.progress()
+            print(f"Bulk recompute finished: {progress['users_processed']} users "
+                  f"at {progress['users_per_second']} users/s")
+        except Exception as e:
+            print(f"Error in bulk recommendation recompute: {e}")
+            self._update(state='failed', finished_at=time.time(), error=str(e))
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            for connection in (read_connection, write_connection):
+                if connection and connection.is_connected():
+                    connection.close()
+
+        return self.progress()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import mysql.connector
+
+    from config import Config
+    from skill_store import load_active_job_skills, load_course_skills
+
+    parser = argparse.ArgumentParser(description='Recompute recommendations for every user')
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--engine', choices=ENGINES, default='auto')
+    parser.add_argument('--top-k', type=int, default=0, help='keep only the best k jobs/courses per user')
+    args = parser.parse_args()
+
+    db_config = {
+        'host': Config.DB_HOST,
+        'database': Config.DB_NAME,
+        'user': Config.DB_USER,
+        'password': Config.DB_PASSWORD,
+        'port': Config.DB_PORT
+    }
+
+    recompute = BulkRecompute(
+        lambda: mysql.connector.connect(**db_config),
+        SkillIndex(load_active_job_skills, name='jobs'),
+        SkillIndex(load_course_skills, name='courses'),
+        chunk_size=args.chunk_size,
+        processes=args.processes,
+        engine=args.engine,
+        top_k=args.top_k
+    )
+    result = recompute.run()
+    print(result)
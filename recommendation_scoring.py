@@ -0,0 +1,94 @@
+"""
+Recommendation Scoring
+Pure skill-overlap scoring shared by the per-user refresh and the bulk recompute
+"""
+
+from skill_store import load_user_skills
+
+# Profile columns (user_skill sources) that count towards matching
+PROFILE_SKILL_FIELDS = ('programming_languages', 'frameworks', 'database_skills', 'tools')
+
+# Only recommend jobs with more than 20% of the required skills
+JOB_MATCH_THRESHOLD = 0.2
+
+# Recommend courses that don't fully match (for upskilling)
+COURSE_MATCH_CEILING = 0.8
+
+
+def fetch_user_skills(cursor, user_id):
+    """Normalized matching skills of one user, read from user_skill"""
+    rows = load_user_skills(cursor, [user_id], PROFILE_SKILL_FIELDS)
+    return set(rows[0][1]) if rows else set()
+
+
+def job_reason(match_count, skill_count):
+    return f"Matches {match_count} out of {skill_count} required skills"
+
+
+def course_reason(match_count, skill_count):
+    return f"Will help you learn {skill_count - match_count} new skills"
+
+
+def score_jobs(user_id, user_skills, job_index):
+    """Recommendation rows for the jobs that share enough skills with the user"""
+    rows = []
+    for job_id, match_count in job_index.match(user_skills).items():
+        job_skills = job_index.get(job_id)
+        if not job_skills:
+            continue  # removed since the lookup
+        score = match_count / len(job_skills)
+        if score > JOB_MATCH_THRESHOLD:
+            rows.append((user_id, job_id, None, 'job', score, job_reason(match_count, len(job_skills))))
+    return rows
+
+
+def score_courses(user_id, user_skills, course_index):
+    """
+    Recommendation rows for upskilling courses.
+
+    Courses with no overlap are the best picks, so every indexed course is
+    scored, but from pre-parsed skill sets.
+    """
+    rows = []
+    course_matches = course_index.match(user_skills)
+    for course_id, course_skills in course_index.items():
+        match_count = course_matches.get(course_id, 0)
+        score = match_count / len(course_skills)
+        if score < COURSE_MATCH_CEILING:
+            rows.append((user_id, None, course_id, 'course', 1 - score,
+                         course_reason(match_count, len(course_skills))))
+    return rows
+
+
+def score_user(user_id, user_skills, job_index, course_index):
+    """All job and course recommendation rows for one user"""
+    return score_jobs(user_id, user_skills, job_index) + score_courses(user_id, user_skills, course_index)
+
+
+def score_job_for_users(job_id, job_skills, user_index):
+    """Recommendation rows for one job across every user who shares enough skills"""
+    rows = []
+    if not job_skills:
+        return rows
+    for user_id, match_count in user_index.match(job_skills).items():
+        score = match_count / len(job_skills)
+        if score > JOB_MATCH_THRESHOLD:
+            rows.append((user_id, job_id, None, 'job', score, job_reason(match_count, len(job_skills))))
+    return rows
+
+
+def load_profile_skills(cursor):
+    """Loader for the user index: (user_id, skills) for every user with matching skills"""
+    return load_user_skills(cursor, sources=PROFILE_SKILL_FIELDS)
+
+
+def refresh_user_skills(connection, user_id, user_index):
+    """Re-read one user's skills and update the user index"""
+    if not user_index.loaded:
+        return
+    cursor = connection.cursor()
+    try:
+        skills = fetch_user_skills(cursor, user_id)
+    finally:
+        cursor.close()
+    user_index.set_item(user_id, skills)
@@ -0,0 +1,95 @@
+"""
+Recommendation Writer
+Persists recommendation rows by diffing against what is already stored
+"""
+
+from decimal import Decimal
+
+import data_versions
+from db_batch import bulk_insert, delete_by_ids
+
+COLUMNS = ('user_id', 'job_id', 'course_id', 'recommendation_type', 'score', 'reason')
+
+# Matches the DECIMAL(5,4) score column
+SCORE_PLACES = 4
+
+
+def _key(user_id, job_id, course_id, recommendation_type):
+    target_id = job_id if recommendation_type == 'job' else course_id
+    return (int(user_id), recommendation_type, int(target_id))
+
+
+def _normalize_score(score):
+    if score is None:
+        return None
+    return round(float(score) if isinstance(score, Decimal) else score, SCORE_PLACES)
+
+
+def sync_recommendations(cursor, scope, params, rows):
+    """
+    Make the stored rows matching `scope` (an SQL condition) equal to `rows`.
+
+    Rows are (user_id, job_id, course_id, recommendation_type, score, reason)
+    tuples. Unchanged rows are left alone, new and changed rows are written
+    with one upsert on the (user_id, recommendation_type, target_id) unique
+    key, so writers racing on the same row update it instead of duplicating
+    it, and stale rows are deleted.
+    Every user whose rows changed gets their recommendations version bumped.
+    """
+    desired = {}
+    for row in rows:
+        user_id, job_id, course_id, recommendation_type, score, reason = row
+        key = _key(user_id, job_id, course_id, recommendation_type)
+        desired[key] = (user_id, job_id, course_id, recommendation_type, _normalize_score(score), reason)
+
+    cursor.execute(
+        f"SELECT id, user_id, job_id, course_id, recommendation_type, score, reason "
+        f"FROM recommendations WHERE {scope}",
+        params
+    )
+    existing = cursor.fetchall()
+
+    stale_ids = []
+    changed = []
+    seen = set()
+    touched_users = set()
+    for rec_id, user_id, job_id, course_id, recommendation_type, score, reason in existing:
+        if (job_id if recommendation_type == 'job' else course_id) is None:
+            stale_ids.append(rec_id)
+            touched_users.add(user_id)
+            continue
+        key = _key(user_id, job_id, course_id, recommendation_type)
+        if key in seen or key not in desired:
+            # Duplicates left by the old delete-and-insert writer are dropped too
+            stale_ids.append(rec_id)
+            touched_users.add(user_id)
+            continue
+        seen.add(key)
+        new = desired[key]
+        if _normalize_score(score) != new[4] or reason != new[5]:
+            changed.append(new)
+            touched_users.add(user_id)
+
+    new_rows = [row for key, row in desired.items() if key not in seen]
+    touched_users.update(row[0] for row in new_rows)
+
+    deleted = delete_by_ids(cursor, 'recommendations', stale_ids)
+    # Key order, so concurrent writers lock shared rows in the same order
+    upserts = sorted(changed + new_rows, key=lambda row: _key(*row[:4]))
+    bulk_insert(
+        cursor, 'recommendations', COLUMNS, upserts,
+        suffix=" ON DUPLICATE KEY UPDATE score = VALUES(score), reason = VALUES(reason)"
+    )
+    data_versions.bump(cursor, [data_versions.recommendations_scope(int(user_id)) for user_id in touched_users])
+
+    return {
+        'inserted': len(new_rows),
+        'updated': len(changed),
+        'deleted': deleted,
+        'unchanged': len(seen) - len(changed),
+    }
+
+
+def write_user_recommendations(cursor, user_id, rows):
+    """Replace one user's job and course recommendations with `rows`"""
+    return sync_recommendations(cursor, "user_id = %s", (user_id,), rows)
@@ -0,0 +1,333 @@
+"""
+Resume PDF
+Renders saved resumes (user_resumes.resume_data, as built by ResumeBuilder.js) to PDF.
+
+Paragraph styles are built once per process and reused for every document.
+Rendering runs in a process pool, so reportlab's CPU time never holds
+a web worker's GIL, and output is stored on disk under the SHA-256 of the
+resume content: an unchanged resume is served from the cache, and concurrent
+requests for the same content share one render.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import HRFlowable, KeepTogether, Paragraph, SimpleDocTemplate, Spacer
+
+# Bump when the layout changes so cached PDFs are re-rendered
+RENDER_VERSION = 1
+
+ACCENT = colors.HexColor('#2c3e50')
+MUTED = colors.HexColor('#555555')
+
+
+@lru_cache(maxsize=1)
+def styles():
+    """Paragraph styles shared by every document rendered in this process"""
+    base = getSampleStyleSheet()
+    body = ParagraphStyle('ResumeBody', parent=base['Normal'], fontSize=10, leading=13)
+    return {
+        'name': ParagraphStyle('ResumeName', parent=base['Title'], fontSize=20, leading=24,
+                               textColor=ACCENT, spaceAfter=2),
+        'contact': ParagraphStyle('ResumeContact', parent=body, alignment=TA_CENTER, textColor=MUTED,
+                                  spaceAfter=6),
+        'heading': ParagraphStyle('ResumeHeading', parent=base['Heading2'], fontSize=12, leading=15,
+                                  textColor=ACCENT, spaceBefore=10, spaceAfter=2),
+        'entry': ParagraphStyle('ResumeEntry', parent=body, fontName='Helvetica-Bold', spaceBefore=4),
+        'meta': ParagraphStyle('ResumeMeta', parent=body, fontName='Helvetica-Oblique', textColor=MUTED),
+        'body': body,
+    }
+
+
+def _text(value):
+    """Escape user text for Paragraph markup, keeping line breaks"""
+    return escape(str(value).strip()).replace('\n', '<br/>') if value not in (None, '') else ''
+
+
+def _join(*parts, separator=' | '):
+    return separator.join(_text(part) for part in parts if part not in (None, ''))
+
+
+def _entries(value):
+    return [entry for entry in value if isinstance(entry, dict)] if isinstance(value, list) else []
+
+
+def _section(story, title, flowables):
+    if flowables:
+        style = styles()
+        story.append(KeepTogether([
+            Paragraph(escape(title), style['heading']),
+            HRFlowable(width='100%', thickness=0.5, color=ACCENT, spaceAfter=4),
+            flowables[0],
+        ]))
+        story.extend(flowables[1:])
+
+
+def _dates(entry):
+    return _join(entry.get('startDate'), entry.get('endDate'), separator=' - ')
+
+
+def build_story(resume):
+    """reportlab flowables for one resume dict"""
+    style = styles()
+    info = resume.get('personalInfo') or {}
+    story = []
+
+    name = _join(info.get('firstName'), info.get('lastName'), separator=' ') or _text(resume.get('name'))
+    story.append(Paragraph(name or 'Resume', style['name']))
+    place = ', '.join(str(part) for part in (info.get('city'), info.get('state')) if part)
+    if info.get('pincode'):
+        place = f"{place} {info['pincode']}".strip()
+    contact = _join(info.get('email'), info.get('phone'), info.get('address'), place)
+    if contact:
+        story.append(Paragraph(contact, style['contact']))
+
+    if resume.get('summary'):
+        _section(story, 'Professional Summary', [Paragraph(_text(resume['summary']), style['body'])])
+
+    experience = []
+    for entry in _entries(resume.get('experience')):
+        experience.append(Paragraph(_join(entry.get('title'), entry.get('company'), separator=' - '),
+                                    style['entry']))
+        meta = _join(entry.get('location'), _dates(entry))
+        if meta:
+            experience.append(Paragraph(meta, style['meta']))
+        if entry.get('description'):
+            experience.append(Paragraph(_text(entry['description']), style['body']))
+    _section(story, 'Experience', experience)
+
+    education = []
+    for entry in _entries(resume.get('education')):
+        education.append(Paragraph(_join(entry.get('degree'), entry.get('school'), separator=' - '),
+                                   style['entry']))
+        gpa = f"GPA: {entry['gpa']}" if entry.get('gpa') else None
+        meta = _join(entry.get('location'), _dates(entry), gpa)
+        if meta:
+            education.append(Paragraph(meta, style['meta']))
+    _section(story, 'Education', education)
+
+    skills = resume.get('skills') or {}
+    skill_lines = []
+    for label, key in (('Technical', 'technical'), ('Soft skills', 'soft')):
+        values = skills.get(key) if isinstance(skills, dict) else None
+        if values:
+            listed = ', '.join(_text(value) for value in values) if isinstance(values, list) else _text(values)
+            skill_lines.append(Paragraph(f"<b>{label}:</b> {listed}", style['body']))
+    _section(story, 'Skills', skill_lines)
+
+    projects = []
+    for entry in _entries(resume.get('projects')):
+        projects.append(Paragraph(_text(entry.get('title')) or 'Project', style['entry']))
+        if entry.get('technologies'):
+            projects.append(Paragraph(f"Technologies: {_text(entry['technologies'])}", style['meta']))
+        if entry.get('description'):
+            projects.append(Paragraph(_text(entry['description']), style['body']))
+    _section(story, 'Projects', projects)
+
+    certifications = []
+    for entry in _entries(resume.get('certifications')):
+        certifications.append(Paragraph(_join(entry.get('name'), entry.get('issuer'), separator=' - '),
+                                        style['entry']))
+        if entry.get('date'):
+            certifications.append(Paragraph(_text(entry['date']), style['meta']))
+        if entry.get('description'):
+            certifications.append(Paragraph(_text(entry['description']), style['body']))
+    _section(story, 'Certifications', certifications)
+
+    return story
+
+
+def render_pdf(resume):
+    """PDF bytes for one resume dict"""
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(
+        buffer, pagesize=letter, title=resume.get('name') or 'Resume',
+        leftMargin=0.75 * inch, rightMargin=0.75 * inch, topMargin=0.6 * inch, bottomMargin=0.6 * inch
+    )
+    story = build_story(resume) or [Spacer(1, 0)]
+    document.build(story)
+    return buffer.getvalue()
+
+
+def content_hash(resume):
+    """Cache key: SHA-256 of the canonical JSON plus the layout version"""
+    raw = json.dumps([RENDER_VERSION, resume], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def parse_resume_data(value):
+    """resume_data column (JSON text, bytes or already decoded) as a dict"""
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode('utf-8')
+    if isinstance(value, str):
+        try:
+            value = json.loads(value) if value else {}
+        except ValueError:
+            return {}
+    return value if isinstance(value, dict) else {}
+
+
+class PdfCache:
+    """Rendered PDFs on disk as <content hash>.pdf, oldest pruned beyond max_files"""
+
+    def __init__(self, directory, max_files=1000):
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, digest):
+        return os.path.join(self.directory, f"{digest}.pdf")
+
+    def get(self, digest):
+        try:
+            with open(self._path(digest), 'rb') as cached:
+                return cached.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, digest, pdf):
+        # Write then rename so other workers never read a partial file
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(pdf)
+        os.replace(temp_path, self._path(digest))
+        self.prune()
+
+    def files(self):
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pdf')]
+
+    def prune(self):
+        entries = self.files()
+        if len(entries) <= self.max_files:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+class ResumeRenderer:
+    """Cached, pooled PDF rendering; processes=0 renders in the calling thread"""
+
+    def __init__(self, cache_dir='pdf_cache', processes=2, max_files=1000, timeout=60):
+        self.cache = PdfCache(cache_dir, max_files)
+        self.processes = processes
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._executor = None
+        self._in_flight = {}
+        self._hits = 0
+        self._renders = 0
+        self._errors = 0
+
+    def _pool(self):
+        # Created on first use so workers fork from a warmed-up process, not at import time
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes, initializer=styles)
+        return self._executor
+
+    def submit(self, resume):
+        """Future for (digest, pdf bytes, cached); identical content in flight shares one render"""
+        digest = content_hash(resume)
+        pdf = self.cache.get(digest)
+        with self._lock:
+            if pdf is not None:
+                self._hits += 1
+                done = Future()
+                done.set_result((digest, pdf, True))
+                return done
+            pending = self._in_flight.get(digest)
+            if pending is not None:
+                self._hits += 1
+                return pending
+
+            result = Future()
+            self._in_flight[digest] = result
+            if self.processes > 0:
+                render = self._pool().submit(render_pdf, resume)
+
+        if self.processes <= 0:
+            render = Future()
+            try:
+                render.set_result(render_pdf(resume))
+            except Exception as e:
+                render.set_exception(e)
+
+        def finish(render):
+            try:
+                pdf = render.result()
+                self.cache.put(digest, pdf)
+                with self._lock:
+                    self._renders += 1
+                result.set_result((digest, pdf, False))
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                result.set_exception(e)
+            finally:
+                with self._lock:
+                    self._in_flight.pop(digest, None)
+
+        render.add_done_callback(finish)
+        return result
+
+    def render(self, resume):
+        """(digest, pdf bytes, cached) for one resume dict"""
+        return self.submit(resume).result(timeout=self.timeout)
+
+    def render_many(self, items):
+        """
+        Render (key, resume) pairs in parallel, yielding (key, pdf bytes or the exception) as each finishes.
+
+        At most twice as many renders as processes are in flight, so `items`
+        can be a lazy iterator over any number of resumes.
+        """
+        items = iter(items)
+        window = max(self.processes, 1) * 2
+        pending = []
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < window:
+                item = next(items, None)
+                if item is None:
+                    exhausted = True
+                else:
+                    pending.append((self.submit(item[1]), item[0]))
+            if not pending:
+                return
+            done, _ = wait({future for future, _ in pending}, timeout=self.timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError(f'No resume rendered within {self.timeout} seconds')
+            for future, key in [entry for entry in pending if entry[0] in done]:
+                try:
+                    yield key, future.result()[1]
+                except Exception as e:
+                    yield key, e
+            pending = [entry for entry in pending if entry[0] not in done]
+
+    def get_stats(self):
+        with self._lock:
+            stats = {
+                'processes': self.processes,
+                'in_flight': len(self._in_flight),
+                'cache_hits': self._hits,
+                'renders': self._renders,
+                'errors': self._errors,
+            }
+        stats['cached_files'] = len(self.cache.files())
+        stats['max_files'] = self.cache.max_files
+        return stats
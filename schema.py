@@ -0,0 +1,431 @@
+"""
+Schema Migrations
+Versioned DDL applied once at startup; request handlers never run DDL.
+
+The applied version is recorded in the schema_version table. To change the
+schema, append a (version, description, statements) entry to MIGRATIONS.
+"""
+
+from mysql.connector import Error
+
+import skill_store
+
+# Version 1: the tables that init_database() used to create on every start
+BASELINE_TABLES = [
+    # users table
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        username VARCHAR(50) UNIQUE NOT NULL,
+        email VARCHAR(100) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL,
+        role ENUM('user', 'admin') DEFAULT 'user',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+    """,
+
+    # user_profiles table
+    """
+    CREATE TABLE IF NOT EXISTS user_profiles (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT NOT NULL,
+        first_name VARCHAR(50),
+        last_name VARCHAR(50),
+        phone VARCHAR(20),
+        date_of_birth DATE,
+        gender ENUM('Male', 'Female', 'Other'),
+        address TEXT,
+        city VARCHAR(50),
+        state VARCHAR(50),
+        country VARCHAR(50),
+        pincode VARCHAR(10),
+
+        -- Academic Information
+        highest_qualification VARCHAR(100),
+        university VARCHAR(100),
+        graduation_year INT,
+        cgpa DECIMAL(3,2),
+        field_of_study VARCHAR(100),
+
+        -- Skills and Ratings
+        technical_skills TEXT,
+        soft_skills TEXT,
+        programming_languages TEXT,
+        frameworks TEXT,
+        database_skills TEXT,
+        tools TEXT,
+
+        -- Experience
+        total_experience INT DEFAULT 0,
+        internships TEXT,
+        projects TEXT,
+        certifications TEXT,
+
+        -- Interests and Preferences
+        career_interests TEXT,
+        preferred_locations TEXT,
+        salary_expectation INT,
+        work_mode ENUM('Remote', 'On-site', 'Hybrid'),
+
+        -- Tech Stack
+        tech_stack TEXT,
+        batch_semester VARCHAR(20),
+
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    )
+    """,
+
+    # jobs table
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        title VARCHAR(200) NOT NULL,
+        company VARCHAR(100) NOT NULL,
+        location VARCHAR(100),
+        job_type ENUM('Full-time', 'Part-time', 'Contract', 'Internship') DEFAULT 'Full-time',
+        experience_required INT DEFAULT 0,
+        salary_min INT,
+        salary_max INT,
+        description TEXT,
+        requirements TEXT,
+        skills_required TEXT,
+        benefits TEXT,
+        application_deadline DATE,
+        status ENUM('Active', 'Closed', 'Draft') DEFAULT 'Active',
+        created_by INT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
+    )
+    """,
+
+    # job_applications table
+    """
+    CREATE TABLE IF NOT EXISTS job_applications (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT NOT NULL,
+        job_id INT NOT NULL,
+        resume_path VARCHAR(255),
+        cover_letter TEXT,
+        status ENUM('Applied', 'Under Review', 'Shortlisted', 'Rejected', 'Accepted') DEFAULT 'Applied',
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        UNIQUE KEY unique_application (user_id, job_id)
+    )
+    """,
+
+    # courses table
+    """
+    CREATE TABLE IF NOT EXISTS courses (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        title VARCHAR(200) NOT NULL,
+        description TEXT,
+        provider VARCHAR(100),
+        duration_weeks INT,
+        difficulty_level ENUM('Beginner', 'Intermediate', 'Advanced'),
+        skills_covered TEXT,
+        course_url VARCHAR(500),
+        price DECIMAL(10,2) DEFAULT 0,
+        rating DECIMAL(3,2),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+
+    # user_course_progress table
+    """
+    CREATE TABLE IF NOT EXISTS user_course_progress (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT NOT NULL,
+        course_id INT NOT NULL,
+        progress_percentage DECIMAL(5,2) DEFAULT 0,
+        completed_modules TEXT,
+        current_module INT DEFAULT 1,
+        status ENUM('Not Started', 'In Progress', 'Completed') DEFAULT 'Not Started',
+        started_at TIMESTAMP NULL,
+        completed_at TIMESTAMP NULL,
+        certificate_path VARCHAR(255),
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+        UNIQUE KEY unique_progress (user_id, course_id)
+    )
+    """,
+
+    # recommendations table
+    """
+    CREATE TABLE IF NOT EXISTS recommendations (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT NOT NULL,
+        job_id INT,
+        course_id INT,
+        recommendation_type ENUM('job', 'course') NOT NULL,
+        score DECIMAL(5,4),
+        reason TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
+    )
+    """,
+
+    # user_resumes table
+    """
+    CREATE TABLE IF NOT EXISTS user_resumes (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT NOT NULL,
+        resume_name VARCHAR(255) NOT NULL,
+        resume_data JSON NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    )
+    """,
+]
+
+# Version 2: canonical skills dictionary and indexed join tables, backfilled from the text columns
+SKILL_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) COLLATE utf8mb4_bin NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_skill_name (name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_skill (
+        user_id INT NOT NULL,
+        skill_id INT NOT NULL,
+        source VARCHAR(30) NOT NULL,
+        PRIMARY KEY (user_id, source, skill_id),
+        KEY idx_user_skill_skill (skill_id, user_id),
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS job_skill (
+        job_id INT NOT NULL,
+        skill_id INT NOT NULL,
+        PRIMARY KEY (job_id, skill_id),
+        KEY idx_job_skill_skill (skill_id, job_id),
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS course_skill (
+        course_id INT NOT NULL,
+        skill_id INT NOT NULL,
+        PRIMARY KEY (course_id, skill_id),
+        KEY idx_course_skill_skill (skill_id, course_id),
+        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+        FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+    )
+    """,
+    skill_store.backfill,
+]
+
+# Version 3: composite indexes matched to the recommendation, application and admin list queries
+INDEXES = [
+    # Job list join (user, type, job), per-user fingerprints and score ordering
+    ('recommendations', 'idx_rec_user_type_job', 'user_id, recommendation_type, job_id'),
+    ('recommendations', 'idx_rec_user_type_score_job', 'user_id, recommendation_type, score, job_id'),
+    # Incremental per-job refresh
+    ('recommendations', 'idx_rec_job_type', 'job_id, recommendation_type'),
+    # Active job lists ordered by age, and the catalog fingerprint
+    ('jobs', 'idx_jobs_status_created', 'status, created_at'),
+    ('jobs', 'idx_jobs_created', 'created_at'),
+    ('jobs', 'idx_jobs_updated', 'updated_at'),
+    # Admin application lists and filters, per-job listings, per-user fingerprints
+    ('job_applications', 'idx_app_applied', 'applied_at'),
+    ('job_applications', 'idx_app_status_applied', 'status, applied_at'),
+    ('job_applications', 'idx_app_job_applied', 'job_id, applied_at'),
+    ('job_applications', 'idx_app_user_updated', 'user_id, updated_at'),
+    ('users', 'idx_users_created', 'created_at'),
+    ('users', 'idx_users_role_created', 'role, created_at'),
+    ('courses', 'idx_courses_created', 'created_at'),
+    ('user_profiles', 'idx_profiles_user_updated', 'user_id, updated_at'),
+    ('user_resumes', 'idx_resumes_user_created', 'user_id, created_at'),
+]
+
+
+def add_indexes(cursor):
+    """Create every index in INDEXES that the database does not have yet"""
+    for table, name, columns in INDEXES:
+        cursor.execute("""
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+        """, (table, name))
+        if cursor.fetchone():
+            continue
+        cursor.execute(f"ALTER TABLE {table} ADD INDEX {name} ({columns})")
+
+
+# Version 4: server-side sessions for SESSION_BACKEND=mysql
+SESSION_TABLE = [
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id VARCHAR(64) PRIMARY KEY,
+        data TEXT NOT NULL,
+        expires_at DATETIME NOT NULL,
+        KEY idx_sessions_expires (expires_at)
+    )
+    """,
+]
+
+# Version 5: change counters for cheap ETags, and a profile row version finer than updated_at's one second
+def add_profile_row_version(cursor):
+    """Add user_profiles.row_version unless database_schema.sql already created it"""
+    cursor.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'user_profiles' AND column_name = 'row_version'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("ALTER TABLE user_profiles ADD COLUMN row_version INT NOT NULL DEFAULT 0")
+
+
+DATA_VERSIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS data_versions (
+        scope VARCHAR(64) PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0
+    )
+    """,
+    add_profile_row_version,
+]
+
+# Version 6: the score index widened with job_id for keyset pages over recommendations;
+# these indexes are made redundant by wider ones in INDEXES
+SUPERSEDED_INDEXES = [
+    ('recommendations', 'idx_rec_user_type_score'),
+]
+
+
+def drop_superseded_indexes(cursor):
+    """Drop every index in SUPERSEDED_INDEXES that the database still has"""
+    for table, name in SUPERSEDED_INDEXES:
+        cursor.execute("""
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+        """, (table, name))
+        if cursor.fetchone():
+            cursor.execute(f"ALTER TABLE {table} DROP INDEX {name}")
+
+
+# Version 7: one row per (user, type, job or course), so concurrent writers upsert instead of duplicating
+def add_recommendation_target_key(cursor):
+    """Drop duplicate recommendations (newest kept), then add target_id and its unique key"""
+    cursor.execute("""
+        DELETE older FROM recommendations older
+        JOIN recommendations newer
+          ON newer.user_id = older.user_id
+         AND newer.recommendation_type = older.recommendation_type
+         AND newer.job_id <=> older.job_id
+         AND newer.course_id <=> older.course_id
+         AND newer.id > older.id
+    """)
+    cursor.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'recommendations' AND column_name = 'target_id'
+    """)
+    if not cursor.fetchone():
+        # job_id and course_id are NULL for the other type, which a unique key would ignore
+        cursor.execute("""
+            ALTER TABLE recommendations ADD COLUMN target_id INT
+            AS (IF(recommendation_type = 'job', job_id, course_id)) VIRTUAL
+        """)
+    cursor.execute("""
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = 'recommendations' AND index_name = 'uq_rec_user_type_target'
+        LIMIT 1
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            ALTER TABLE recommendations
+            ADD UNIQUE KEY uq_rec_user_type_target (user_id, recommendation_type, target_id)
+        """)
+
+
+# Version 8: per-chunk marker so bulk job imports can read back the ids of their own rows
+def add_job_import_batch(cursor):
+    """Add jobs.import_batch and its index unless database_schema.sql already created them"""
+    cursor.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'jobs' AND column_name = 'import_batch'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            ALTER TABLE jobs ADD COLUMN import_batch CHAR(32) NULL,
+            ADD INDEX idx_jobs_import_batch (import_batch)
+        """)
+
+
+# Entries are SQL strings or callables taking the cursor (for data backfills)
+MIGRATIONS = [
+    (1, 'Baseline tables', BASELINE_TABLES),
+    (2, 'Skills dictionary and join tables', SKILL_TABLES),
+    (3, 'Composite indexes for recommendation, application and list queries', [add_indexes]),
+    (4, 'Server-side sessions', SESSION_TABLE),
+    (5, 'Data version counters and profile row version', DATA_VERSIONS),
+    (6, 'Recommendation keyset index', [add_indexes, drop_superseded_indexes]),
+    (7, 'Unique recommendation per user and target', [add_recommendation_target_key]),
+    (8, 'Job import batch marker', [add_job_import_batch]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Named lock so concurrently starting workers do not migrate twice
+LOCK_NAME = 'career_platform_schema'
+
+
+def current_version(cursor):
+    """Highest applied migration version (0 for a fresh database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            description VARCHAR(255),
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cursor.fetchone()[0]
+
+
+def migrate(connection, lock_timeout=30):
+    """Apply every pending migration in order; returns the resulting schema version"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, lock_timeout))
+        if not cursor.fetchone()[0]:
+            raise Error(msg='Timed out waiting for the schema migration lock')
+        try:
+            version = current_version(cursor)
+            for target, description, statements in MIGRATIONS:
+                if target <= version:
+                    continue
+                print(f"Applying schema migration {target}: {description}")
+                for statement in statements:
+                    if callable(statement):
+                        statement(cursor)
+                    else:
+                        cursor.execute(statement)
+                # MySQL commits DDL implicitly; the version row marks the step as done
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                    (target, description)
+                )
+                connection.commit()
+                version = target
+            return version
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
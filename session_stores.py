@@ -0,0 +1,254 @@
+"""
+Session Stores
+Pluggable session backends selected by SESSION_BACKEND.
+
+- cookie: signed, stateless cookie holding the small user_id/username/role payload (no server I/O).
+  Anyone holding SECRET_KEY can forge any session, so it refuses to start with an unset or placeholder key.
+- memory: server-side LRU with expiry, per process (single worker or sticky sessions)
+- mysql: server-side `sessions` table shared by every worker and host, with batched expiry sweeps
+- filesystem: the Flask-Session file store (default)
+
+The server-side backends keep only a signed random session id in the cookie.
+"""
+
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from flask.sessions import SecureCookieSessionInterface, SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+SESSION_BACKENDS = ('cookie', 'memory', 'mysql', 'filesystem')
+
+# Sample values shipped in the code and README; never accepted for signing cookie sessions
+PLACEHOLDER_SECRET_KEYS = ('your-secret-key-here', 'your-super-secret-key-change-this-in-production')
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session data loaded from a store, tracking whether it changed"""
+
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(session):
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+
+class MemoryStore:
+    """Thread-safe LRU of session data with per-entry expiry"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, sid):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None or entry[1] < time.time():
+                if entry is not None:
+                    del self._entries[sid]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(sid)
+            self._hits += 1
+            return dict(entry[0])
+
+    def set(self, sid, data, lifetime):
+        with self._lock:
+            self._entries[sid] = (dict(data), time.time() + lifetime)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'sessions': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+
+class MySQLStore:
+    """Sessions in the `sessions` table; expired rows are deleted in batches by a sweeper thread"""
+
+    def __init__(self, get_connection, sweep_interval=300, sweep_batch=1000):
+        self.get_connection = get_connection
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self._sweeper = None
+        self._swept = 0
+        self._last_sweep = None
+
+    def _run(self, query, params, fetch=False):
+        connection = self.get_connection()
+        if not connection:
+            raise RuntimeError('Database connection failed')
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, params)
+            if fetch:
+                return cursor.fetchone()
+            connection.commit()
+            return cursor.rowcount
+        finally:
+            cursor.close()
+            connection.close()
+
+    def get(self, sid):
+        row = self._run("SELECT data FROM sessions WHERE id = %s AND expires_at > UTC_TIMESTAMP()",
+                        (sid,), fetch=True)
+        return json.loads(row[0]) if row else None
+
+    def set(self, sid, data, lifetime):
+        self._run("""
+            INSERT INTO sessions (id, data, expires_at)
+            VALUES (%s, %s, UTC_TIMESTAMP() + INTERVAL %s SECOND)
+            ON DUPLICATE KEY UPDATE data = VALUES(data), expires_at = VALUES(expires_at)
+        """, (sid, json.dumps(data), int(lifetime)))
+
+    def delete(self, sid):
+        self._run("DELETE FROM sessions WHERE id = %s", (sid,))
+
+    def sweep(self):
+        """Delete expired sessions, sweep_batch rows per statement to keep locks short"""
+        total = 0
+        while True:
+            deleted = self._run(
+                "DELETE FROM sessions WHERE expires_at <= UTC_TIMESTAMP() LIMIT %s", (self.sweep_batch,)
+            )
+            total += deleted
+            if deleted < self.sweep_batch:
+                break
+        self._swept += total
+        self._last_sweep = time.time()
+        return total
+
+    def start_sweeper(self):
+        def loop():
+            while True:
+                time.sleep(self.sweep_interval)
+                try:
+                    deleted = self.sweep()
+                    if deleted:
+                        print(f"Session sweep removed {deleted} expired sessions")
+                except Exception as e:
+                    print(f"Error sweeping sessions: {e}")
+
+        self._sweeper = threading.Thread(target=loop, name='session-sweeper', daemon=True)
+        self._sweeper.start()
+
+    def get_stats(self):
+        return {
+            'sweep_interval': self.sweep_interval,
+            'swept': self._swept,
+            'last_sweep': self._last_sweep,
+        }
+
+
+class ServerSessionInterface(SessionInterface):
+    """Keeps a signed random session id in the cookie and the data in a store"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt='career-platform-session')
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode('utf-8')
+            except BadSignature:
+                sid = None
+            if sid:
+                data = self.store.get(sid)
+                if data is not None:
+                    return ServerSession(data, sid=sid)
+        return ServerSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                # Logged out: forget the stored data and the cookie
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=self.get_cookie_secure(app),
+                                       httponly=self.get_cookie_httponly(app),
+                                       samesite=self.get_cookie_samesite(app))
+            return
+
+        if not (session.modified or session.new):
+            return
+        self.store.set(session.sid, dict(session), app.permanent_session_lifetime.total_seconds())
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode('utf-8'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+def init_app(app, backend='filesystem', get_connection=None, max_entries=10000, sweep_interval=300):
+    """Install the session backend on the app; returns the store (None for cookie/filesystem)"""
+    if backend not in SESSION_BACKENDS:
+        raise ValueError(f"SESSION_BACKEND must be one of {', '.join(SESSION_BACKENDS)}")
+
+    store = None
+    if backend == 'cookie':
+        secret_key = app.config.get('SECRET_KEY')
+        if not secret_key or secret_key in PLACEHOLDER_SECRET_KEYS:
+            raise RuntimeError('SESSION_BACKEND=cookie requires SECRET_KEY to be set to a private random value')
+        app.session_interface = SecureCookieSessionInterface()
+    elif backend == 'filesystem':
+        from flask_session import Session
+        app.config.setdefault('SESSION_TYPE', 'filesystem')
+        app.config.setdefault('SESSION_PERMANENT', False)
+        app.config.setdefault('SESSION_USE_SIGNER', True)
+        app.config.setdefault('SESSION_KEY_PREFIX', 'career_platform:')
+        Session(app)
+    elif backend == 'memory':
+        store = MemoryStore(max_entries=max_entries)
+        app.session_interface = ServerSessionInterface(store)
+    else:
+        store = MySQLStore(get_connection, sweep_interval=sweep_interval)
+        app.session_interface = ServerSessionInterface(store)
+        store.start_sweeper()
+
+    app.extensions['session_store'] = (backend, store)
+    print(f"Session backend: {backend}")
+    return store
+
+
+def get_stats(app):
+    """Backend name plus store metrics, for the admin metrics endpoint"""
+    backend, store = app.extensions.get('session_store', (None, None))
+    stats = {'backend': backend}
+    if store is not None:
+        stats.update(store.get_stats())
+    return stats
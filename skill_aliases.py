@@ -0,0 +1,150 @@
+"""
+Skill Aliases
+Canonical names for skill synonyms ("JS", "Javascript", "JavaScript " -> "javascript").
+
+The alias dictionary is compiled into two dict lookups: one on the lowercased,
+whitespace-collapsed name and one on a compact form without spaces, dots,
+dashes or underscores, so "Node.js", "NodeJS" and "node js" all resolve to the
+same entry. Skills are canonicalized when profiles, jobs and courses are
+written, so matching only compares skill ids.
+
+Extra aliases can be supplied as a JSON file ({"canonical": ["alias", ...]})
+named by SKILL_ALIASES_FILE and reloaded at runtime with reload().
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+
+DEFAULT_ALIASES = {
+    'javascript': ['js', 'java script', 'ecmascript', 'es6'],
+    'typescript': ['ts'],
+    'node.js': ['node', 'nodejs'],
+    'react': ['reactjs', 'react.js'],
+    'vue.js': ['vue', 'vuejs'],
+    'angular': ['angularjs', 'angular.js'],
+    'next.js': ['nextjs'],
+    'express': ['express.js', 'expressjs'],
+    'python': ['python3', 'py'],
+    'golang': ['go', 'go lang'],
+    'c++': ['cpp'],
+    'c#': ['csharp', 'c sharp'],
+    '.net': ['dotnet', 'dot net'],
+    'postgresql': ['postgres', 'psql'],
+    'mongodb': ['mongo'],
+    'mysql': ['my sql'],
+    'sql server': ['mssql', 'ms sql', 'microsoft sql server'],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure'],
+    'ci/cd': ['cicd', 'ci cd'],
+    'machine learning': ['ml'],
+    'deep learning': ['dl'],
+    'artificial intelligence': ['ai'],
+    'natural language processing': ['nlp'],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'tensorflow': ['tensor flow'],
+    'html': ['html5'],
+    'css': ['css3'],
+}
+
+ALIASES_FILE = os.getenv('SKILL_ALIASES_FILE', 'skill_aliases.json')
+
+# Distinct skills remembered per compiled table
+CACHE_SIZE = 65536
+
+_SPACES = re.compile(r'\s+')
+_SEPARATORS = re.compile(r'[\s._\-]+')
+
+
+def _key(skill):
+    return _SPACES.sub(' ', skill.strip().lower())
+
+
+def _compact(key):
+    return _SEPARATORS.sub('', key)
+
+
+class AliasTable:
+    """Compiled alias lookup; immutable once built"""
+
+    def __init__(self, aliases):
+        exact = {}
+        compact = {}
+        for canonical, names in aliases.items():
+            canonical_key = _key(canonical)
+            for name in [canonical] + list(names):
+                exact[_key(name)] = canonical_key
+                compact.setdefault(_compact(_key(name)), canonical_key)
+        self._exact = exact
+        self._compact = compact
+        self.canonical_count = len(set(exact.values()))
+        self.alias_count = len(exact)
+        self.canonicalize = lru_cache(maxsize=CACHE_SIZE)(self._canonicalize)
+
+    def _canonicalize(self, skill):
+        key = _key(skill)
+        canonical = self._exact.get(key)
+        if canonical is None:
+            canonical = self._compact.get(_compact(key), key)
+        return canonical
+
+
+_lock = threading.Lock()
+_table = AliasTable(DEFAULT_ALIASES)
+_state = {'source': 'defaults', 'loaded_at': time.time()}
+
+
+def load_aliases(path=None):
+    """Built-in aliases merged with the JSON alias file, if it exists"""
+    path = path or ALIASES_FILE
+    aliases = {canonical: list(names) for canonical, names in DEFAULT_ALIASES.items()}
+    if not path or not os.path.exists(path):
+        return aliases, 'defaults'
+    with open(path, encoding='utf-8') as alias_file:
+        extra = json.load(alias_file)
+    if not isinstance(extra, dict) or not all(isinstance(names, list) for names in extra.values()):
+        raise ValueError(f'{path} must map canonical skills to lists of aliases')
+    for canonical, names in extra.items():
+        aliases.setdefault(canonical, []).extend(str(name) for name in names)
+    return aliases, path
+
+
+def reload(path=None):
+    """Recompile the lookup from the defaults and the alias file; returns the stats"""
+    global _table
+    aliases, source = load_aliases(path)
+    table = AliasTable(aliases)
+    with _lock:
+        _table = table
+        _state.update(source=source, loaded_at=time.time())
+    print(f"Skill aliases loaded from {source}: {table.alias_count} names, {table.canonical_count} skills")
+    return get_stats()
+
+
+def canonicalize(skill):
+    """Canonical lowercase name for one skill"""
+    return _table.canonicalize(skill)
+
+
+def get_stats():
+    table = _table
+    cache = table.canonicalize.cache_info()
+    return {
+        'source': _state['source'],
+        'loaded_at': _state['loaded_at'],
+        'canonical_skills': table.canonical_count,
+        'names': table.alias_count,
+        'cache_hits': cache.hits,
+        'cache_misses': cache.misses,
+    }
+
+
+try:
+    reload()
+except (OSError, ValueError) as e:
+    print(f"Error loading skill aliases, using the built-in list: {e}")
@@ -0,0 +1,123 @@
+"""
+Skill Index
+In-process inverted index from normalized skill to the jobs and courses that require it
+"""
+
+import threading
+from collections import defaultdict
+
+from skill_aliases import canonicalize
+
+
+def normalize_skill(skill):
+    """Normalize a single skill name for matching, resolving aliases to the canonical name"""
+    return canonicalize(skill)
+
+
+def parse_skills(value):
+    """Turn a comma-separated string or a list into unique normalized skills"""
+    if not value:
+        return []
+    items = value.split(',') if isinstance(value, str) else value
+    skills = (normalize_skill(item) for item in items if isinstance(item, str))
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+class SkillIndex:
+    """Maps each normalized skill to the ids of the postings that list it"""
+
+    def __init__(self, loader, name='items'):
+        self._loader = loader
+        self.name = name
+        self._lock = threading.RLock()
+        self._postings = defaultdict(set)
+        self._skills = {}
+        self._loaded = False
+
+    @classmethod
+    def from_items(cls, items, name='items'):
+        """Build a ready-to-use index from (item_id, skills) pairs, e.g. inside a worker process"""
+        index = cls(None, name=name)
+        for item_id, skills in items:
+            index._add(item_id, parse_skills(skills))
+        index._loaded = True
+        return index
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    def ensure_loaded(self, connection):
+        """Populate the index from the database on first use"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            cursor = connection.cursor()
+            try:
+                rows = self._loader(cursor)
+            finally:
+                cursor.close()
+            for item_id, skills in rows:
+                self._add(item_id, parse_skills(skills))
+            self._loaded = True
+            print(f"Skill index '{self.name}' loaded with {len(self._skills)} entries")
+
+    def invalidate(self):
+        """Drop everything; the next ensure_loaded() reloads from the database"""
+        with self._lock:
+            self._postings.clear()
+            self._skills.clear()
+            self._loaded = False
+
+    def _add(self, item_id, skills):
+        if not skills:
+            return
+        self._skills[item_id] = frozenset(skills)
+        for skill in skills:
+            self._postings[skill].add(item_id)
+
+    def _remove(self, item_id):
+        for skill in self._skills.pop(item_id, ()):
+            ids = self._postings.get(skill)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._postings[skill]
+
+    def set_item(self, item_id, skills, active=True):
+        """Insert or replace one posting; inactive postings are removed"""
+        with self._lock:
+            if not self._loaded:
+                # Nothing cached yet, the first load will read the new row
+                return
+            self._remove(item_id)
+            if active:
+                self._add(item_id, parse_skills(skills))
+
+    def remove(self, item_id):
+        """Forget a posting that was deleted"""
+        with self._lock:
+            self._remove(item_id)
+
+    def get(self, item_id):
+        """Normalized skills of one posting (empty if unknown)"""
+        return self._skills.get(item_id, frozenset())
+
+    def match(self, skills):
+        """Return {item_id: number of shared skills} for postings sharing at least one skill"""
+        counts = defaultdict(int)
+        with self._lock:
+            for skill in skills:
+                for item_id in self._postings.get(skill, ()):
+                    counts[item_id] += 1
+        return dict(counts)
+
+    def items(self):
+        """Snapshot of (item_id, skills) for every indexed posting"""
+        with self._lock:
+            return list(self._skills.items())
+
+    def __len__(self):
+        return len(self._skills)
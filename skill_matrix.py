@@ -0,0 +1,114 @@
+"""
+Sparse Skill Matrix Scoring
+Vectorized version of the skill-overlap rule for scoring many users at once.
+
+Users, jobs and courses are encoded as sparse binary skill vectors; the number
+of shared skills for every (user, posting) pair is a single sparse matrix
+product. Requires NumPy and SciPy; callers fall back to the pure Python scorer
+in recommendation_scoring when they are not installed.
+"""
+
+try:
+    import numpy as np
+    from scipy import sparse
+    HAS_SPARSE = True
+except ImportError:  # optional dependency
+    np = None
+    sparse = None
+    HAS_SPARSE = False
+
+from recommendation_scoring import (
+    JOB_MATCH_THRESHOLD, COURSE_MATCH_CEILING, job_reason, course_reason
+)
+
+
+def _encode(skill_sets, vocabulary):
+    """Encode skill sets as a CSR matrix with one row per set and a 1 per known skill"""
+    indptr = [0]
+    indices = []
+    for skills in skill_sets:
+        indices.extend(vocabulary[skill] for skill in skills if skill in vocabulary)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(skill_sets), len(vocabulary))
+    )
+
+
+def _top_k(rows, values, ids, k):
+    """Positions of the k highest values within each row id, ties to the lowest id (all positions if k is falsy)"""
+    if not k or len(rows) == 0:
+        return np.arange(len(rows))
+    order = np.lexsort((ids, -values, rows))
+    sorted_rows = rows[order]
+    starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(sorted_rows)]))
+    return order[(np.arange(len(order)) - group_start) < k]
+
+
+class SparseSkillScorer:
+    """Scores batches of users against the whole catalog with sparse matrix products"""
+
+    def __init__(self, job_items, course_items):
+        if not HAS_SPARSE:
+            raise RuntimeError('NumPy and SciPy are required for the sparse scorer')
+
+        job_items = [(job_id, skills) for job_id, skills in job_items if skills]
+        course_items = [(course_id, skills) for course_id, skills in course_items if skills]
+
+        self.vocabulary = {}
+        for _, skills in job_items + course_items:
+            for skill in skills:
+                self.vocabulary.setdefault(skill, len(self.vocabulary))
+
+        self.job_ids = np.asarray([job_id for job_id, _ in job_items], dtype=np.int64)
+        self.course_ids = np.asarray([course_id for course_id, _ in course_items], dtype=np.int64)
+
+        # Transposed once so every batch is a plain (users x skills) @ (skills x postings)
+        job_matrix = _encode([skills for _, skills in job_items], self.vocabulary)
+        course_matrix = _encode([skills for _, skills in course_items], self.vocabulary)
+        self.job_matrix_t = job_matrix.T.tocsc()
+        self.course_matrix_t = course_matrix.T.tocsc()
+        self.job_sizes = np.asarray(job_matrix.sum(axis=1), dtype=np.float64).ravel()
+        self.course_sizes = np.asarray(course_matrix.sum(axis=1), dtype=np.float64).ravel()
+
+    def score(self, user_ids, user_skill_sets, top_k=None):
+        """
+        Recommendation rows for a batch of users.
+
+        Produces the same rows as recommendation_scoring.score_user; `top_k`
+        optionally keeps only the best k jobs and k courses per user.
+        """
+        if not user_ids:
+            return []
+        user_ids = list(user_ids)
+        user_matrix = _encode(user_skill_sets, self.vocabulary)
+        rows = []
+
+        # Jobs: sparse overlap counts, only pairs sharing a skill are materialized
+        if len(self.job_ids):
+            overlap = (user_matrix @ self.job_matrix_t).tocoo()
+            counts = overlap.data.astype(np.float64)
+            scores = counts / self.job_sizes[overlap.col]
+            keep = np.flatnonzero(scores > JOB_MATCH_THRESHOLD)
+            keep = keep[_top_k(overlap.row[keep], scores[keep], self.job_ids[overlap.col[keep]], top_k)]
+            for user_row, job_col, score, count in zip(overlap.row[keep], overlap.col[keep],
+                                                       scores[keep], counts[keep]):
+                rows.append((user_ids[user_row], int(self.job_ids[job_col]), None, 'job', float(score),
+                             job_reason(int(count), int(self.job_sizes[job_col]))))
+
+        # Courses: zero overlap is the best upskilling pick, so the result is dense
+        if len(self.course_ids):
+            overlap = (user_matrix @ self.course_matrix_t).toarray().astype(np.float64)
+            scores = overlap / self.course_sizes
+            user_rows, course_cols = np.nonzero(scores < COURSE_MATCH_CEILING)
+            course_scores = 1 - scores[user_rows, course_cols]
+            keep = _top_k(user_rows, course_scores, self.course_ids[course_cols], top_k)
+            user_rows, course_cols, course_scores = user_rows[keep], course_cols[keep], course_scores[keep]
+            for user_row, course_col, score in zip(user_rows, course_cols, course_scores):
+                match_count = int(overlap[user_row, course_col])
+                rows.append((user_ids[user_row], None, int(self.course_ids[course_col]), 'course', float(score),
+                             course_reason(match_count, int(self.course_sizes[course_col]))))
+
+        return rows
@@ -0,0 +1,212 @@
+"""
+Skill Store
+Canonical skills dictionary with the user_skill, job_skill and course_skill join tables.
+
+The comma-separated and JSON text columns stay as the API representation;
+these tables are their normalized, indexed form. They are written alongside
+the text columns and read by the matchers, so nothing parses strings at
+match time.
+"""
+
+import json
+from collections import defaultdict
+
+from db_batch import DEFAULT_BATCH_SIZE, chunked, bulk_insert
+from skill_index import normalize_skill
+
+# Profile columns (JSON lists) mirrored into user_skill, tagged by column
+PROFILE_SKILL_SOURCES = (
+    'technical_skills', 'soft_skills', 'programming_languages', 'frameworks', 'database_skills', 'tools'
+)
+
+# Longest skill name the dictionary stores; longer values are not skills
+MAX_SKILL_LENGTH = 100
+
+
+def _tuples(rows):
+    """Rows as tuples, whether the caller's cursor returns tuples or dictionaries"""
+    return [tuple(row.values()) if isinstance(row, dict) else row for row in rows]
+
+
+def skill_names(value):
+    """Unique normalized names from a comma string, a JSON list string or a list"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped.startswith('['):
+            try:
+                value = json.loads(stripped)
+            except ValueError:
+                value = stripped.split(',')
+        else:
+            value = stripped.split(',')
+    names = (normalize_skill(item) for item in value if isinstance(item, str))
+    return list(dict.fromkeys(name for name in names if name and len(name) <= MAX_SKILL_LENGTH))
+
+
+def _lookup(cursor, names):
+    ids = {}
+    for batch in chunked(names, DEFAULT_BATCH_SIZE):
+        placeholders = ', '.join(['%s'] * len(batch))
+        cursor.execute(f"SELECT id, name FROM skills WHERE name IN ({placeholders})", batch)
+        ids.update((name, skill_id) for skill_id, name in _tuples(cursor.fetchall()))
+    return ids
+
+
+def skill_ids(cursor, names):
+    """Map normalized names to skill ids, adding names the dictionary does not have yet"""
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    ids = _lookup(cursor, names)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        # Insert only unseen names so known skills don't burn auto-increment ids
+        bulk_insert(cursor, 'skills', ('name',), [(name,) for name in missing],
+                    suffix=' ON DUPLICATE KEY UPDATE name = name')
+        ids.update(_lookup(cursor, missing))
+    return ids
+
+
+def _replace(cursor, table, owner_column, owner_ids, rows, extra_condition='', extra_params=()):
+    """Delete the owners' rows (optionally narrowed) and insert the new ones"""
+    if owner_ids:
+        placeholders = ', '.join(['%s'] * len(owner_ids))
+        cursor.execute(
+            f"DELETE FROM {table} WHERE {owner_column} IN ({placeholders}){extra_condition}",
+            list(owner_ids) + list(extra_params)
+        )
+    if rows:
+        columns = (owner_column, 'skill_id', 'source') if table == 'user_skill' else (owner_column, 'skill_id')
+        bulk_insert(cursor, table, columns, rows)
+
+
+def set_job_skills(cursor, items):
+    """Replace job_skill rows for (job_id, skills_required) pairs"""
+    _set_item_skills(cursor, 'job_skill', 'job_id', items)
+
+
+def set_course_skills(cursor, items):
+    """Replace course_skill rows for (course_id, skills_covered) pairs"""
+    _set_item_skills(cursor, 'course_skill', 'course_id', items)
+
+
+def _set_item_skills(cursor, table, owner_column, items):
+    parsed = [(item_id, skill_names(value)) for item_id, value in items]
+    ids = skill_ids(cursor, [name for _, names in parsed for name in names])
+    rows = [(item_id, ids[name]) for item_id, names in parsed for name in names]
+    _replace(cursor, table, owner_column, [item_id for item_id, _ in parsed], rows)
+
+
+def set_user_skills(cursor, user_id, profile):
+    """Replace the user_skill rows of the profile columns present in `profile`"""
+    sources = [source for source in PROFILE_SKILL_SOURCES if source in profile]
+    if not sources:
+        return
+    parsed = [(source, skill_names(profile[source])) for source in sources]
+    ids = skill_ids(cursor, [name for _, names in parsed for name in names])
+    rows = [(user_id, ids[name], source) for source, names in parsed for name in names]
+    placeholders = ', '.join(['%s'] * len(sources))
+    _replace(cursor, 'user_skill', 'user_id', [user_id], rows,
+             f" AND source IN ({placeholders})", sources)
+
+
+def set_profile_skills(cursor, profiles):
+    """Replace all user_skill rows for (user_id, profile) pairs with one DELETE and bulk INSERT"""
+    parsed = [(user_id, source, skill_names(profile.get(source)))
+              for user_id, profile in profiles for source in PROFILE_SKILL_SOURCES]
+    ids = skill_ids(cursor, [name for _, _, names in parsed for name in names])
+    rows = [(user_id, ids[name], source) for user_id, source, names in parsed for name in names]
+    _replace(cursor, 'user_skill', 'user_id', list(dict.fromkeys(user_id for user_id, _ in profiles)), rows)
+
+
+def _grouped(rows):
+    """[(owner_id, name), ...] ordered by owner -> [(owner_id, [names]), ...]"""
+    groups = defaultdict(list)
+    for owner_id, name in _tuples(rows):
+        groups[owner_id].append(name)
+    return list(groups.items())
+
+
+def load_active_job_skills(cursor):
+    """Loader for the job index: skills of every active job, from job_skill"""
+    cursor.execute("""
+        SELECT js.job_id, s.name
+        FROM job_skill js
+        JOIN jobs j ON j.id = js.job_id
+        JOIN skills s ON s.id = js.skill_id
+        WHERE j.status = 'Active'
+        ORDER BY js.job_id
+    """)
+    return _grouped(cursor.fetchall())
+
+
+def load_course_skills(cursor):
+    """Loader for the course index: skills covered by every course, from course_skill"""
+    cursor.execute("""
+        SELECT cs.course_id, s.name
+        FROM course_skill cs
+        JOIN skills s ON s.id = cs.skill_id
+        ORDER BY cs.course_id
+    """)
+    return _grouped(cursor.fetchall())
+
+
+def load_user_skills(cursor, user_ids=None, sources=None):
+    """(user_id, skills) for the given users (all users if None) from the given profile columns"""
+    conditions = []
+    params = []
+    if user_ids is not None:
+        if not user_ids:
+            return []
+        conditions.append(f"us.user_id IN ({', '.join(['%s'] * len(user_ids))})")
+        params.extend(user_ids)
+    if sources:
+        conditions.append(f"us.source IN ({', '.join(['%s'] * len(sources))})")
+        params.extend(sources)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    cursor.execute(f"""
+        SELECT DISTINCT us.user_id, s.name
+        FROM user_skill us
+        JOIN skills s ON s.id = us.skill_id
+        {where}
+        ORDER BY us.user_id
+    """, params)
+    return _grouped(cursor.fetchall())
+
+
+def skill_filter(column, table, owner_column, names):
+    """SQL condition (and params) keeping rows of `column` linked to any of `names`"""
+    names = [normalize_skill(name) for name in names if name.strip()]
+    placeholders = ', '.join(['%s'] * len(names))
+    condition = (f"{column} IN (SELECT link.{owner_column} FROM {table} link "
+                 f"JOIN skills s ON s.id = link.skill_id WHERE s.name IN ({placeholders}))")
+    return condition, names
+
+
+def backfill(cursor, batch_size=DEFAULT_BATCH_SIZE):
+    """(Re)build the join tables from the text columns; used by the migration and alias reloads"""
+    cursor.execute("SELECT id, skills_required FROM jobs")
+    for batch in chunked(_tuples(cursor.fetchall()), batch_size):
+        set_job_skills(cursor, batch)
+
+    cursor.execute("SELECT id, skills_covered FROM courses")
+    for batch in chunked(_tuples(cursor.fetchall()), batch_size):
+        set_course_skills(cursor, batch)
+
+    cursor.execute(f"SELECT user_id, {', '.join(PROFILE_SKILL_SOURCES)} FROM user_profiles")
+    profiles = [(row[0], dict(zip(PROFILE_SKILL_SOURCES, row[1:]))) for row in _tuples(cursor.fetchall())]
+    for batch in chunked(profiles, batch_size):
+        set_profile_skills(cursor, batch)
+
+    # Names that no longer occur (e.g. after an alias reload) leave the dictionary
+    cursor.execute("""
+        DELETE FROM skills
+        WHERE NOT EXISTS (SELECT 1 FROM user_skill us WHERE us.skill_id = skills.id)
+          AND NOT EXISTS (SELECT 1 FROM job_skill js WHERE js.skill_id = skills.id)
+          AND NOT EXISTS (SELECT 1 FROM course_skill cs WHERE cs.skill_id = skills.id)
+    """)
+
+    cursor.execute("SELECT COUNT(*) AS total FROM skills")
+    print(f"Skills backfilled: {_tuples(cursor.fetchall())[0][0]} distinct skills")
@@ -1,63 +1,63 @@
-import React, { useState, useEffect } from 'react';
-import { Routes, Route, Navigate } from 'react-router-dom';
-import { AuthProvider, useAuth } from './contexts/AuthContext';
-import Login from './components/Auth/Login';
-import Register from './components/Auth/Register';
-import Dashboard from './components/Dashboard/Dashboard';
-import ProfileForm from './components/Profile/ProfileForm';
-import JobRecommendations from './components/Jobs/JobRecommendations';
-import ResumeBuilder from './components/Resume/ResumeBuilder';
-import Courses from './components/Courses/Courses';
-import AdminPanel from './components/Admin/AdminPanel';
-import LoadingSpinner from './components/Common/LoadingSpinner';
-import './App.css';
-
-function AppRoutes() {
-  const { user, loading } = useAuth();
-
-  if (loading) {
-    return <LoadingSpinner />;
-  }
-
-  if (!user) {
-    return (
-      <Routes>
-        <Route path="/login" element={<Login />} />
-        <Route path="/register" element={<Register />} />
-        <Route path="*" element={<Navigate to="/login" replace />} />
-      </Routes>
-    );
-  }
-
-  if (user.role === 'admin') {
-    return (
-      <Routes>
-        <Route path="/admin" element={<AdminPanel />} />
-        <Route path="*" element={<Navigate to="/admin" replace />} />
-      </Routes>
-    );
-  }
-
-  return (
-    <Routes>
-      <Route path="/dashboard" element={<Dashboard />} />
-      <Route path="/profile" element={<ProfileForm />} />
-      <Route path="/jobs" element={<JobRecommendations />} />
-      <Route path="/resume" element={<ResumeBuilder />} />
-      <Route path="/courses" element={<Courses />} />
-      <Route path="*" element={<Navigate to="/dashboard" replace />} />
-    </Routes>
-  );
-}
-
-function App() {
-  return (
-    <AuthProvider>
-      <div className="App">
-        <AppRoutes />
-      </div>
-    </AuthProvider>
-  );
-}
-
-export default App;
+import React, { useState, useEffect } from 'react';
+import { Routes, Route, Navigate } from 'react-router-dom';
+import { AuthProvider, useAuth } from './contexts/AuthContext';
+import Login from './components/Auth/Login';
+import Register from './components/Auth/Register';
+import Dashboard from './components/Dashboard/Dashboard';
+import ProfileForm from './components/Profile/ProfileForm';
+import JobRecommendations from './components/Jobs/JobRecommendations';
+import ResumeBuilder from './components/Resume/ResumeBuilder';
+import Courses from './components/Courses/Courses';
+import AdminPanel from './components/Admin/AdminPanel';
+import LoadingSpinner from './components/Common/LoadingSpinner';
+import './App.css';
+
+function AppRoutes() {
+  const { user, loading } = useAuth();
+
+  if (loading) {
+    return <LoadingSpinner />;
+  }
+
+  if (!user) {
+    return (
+      <Routes>
+        <Route path="/login" element={<Login />} />
+        <Route path="/register" element={<Register />} />
+        <Route path="*" element={<Navigate to="/login" replace />} />
+      </Routes>
+    );
+  }
+
+  if (user.role === 'admin') {
+    return (
+      <Routes>
+        <Route path="/admin" element={<AdminPanel />} />
+        <Route path="*" element={<Navigate to="/admin" replace />} />
+      </Routes>
+    );
+  }
+
+  return (
+    <Routes>
+      <Route path="/dashboard" element={<Dashboard />} />
+      <Route path="/profile" element={<ProfileForm />} />
+      <Route path="/jobs" element={<JobRecommendations />} />
+      <Route path="/resume" element={<ResumeBuilder />} />
+      <Route path="/courses" element={<Courses />} />
+      <Route path="*" element={<Navigate to="/dashboard" replace />} />
+    </Routes>
+  );
+}
+
+function App() {
+  return (
+    <AuthProvider>
+      <div className="App">
+        <AppRoutes />
+      </div>
+    </AuthProvider>
+  );
+}
+
+export default App;
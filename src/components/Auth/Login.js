@@ -1,229 +1,229 @@
-import React, { useState } from 'react';
-import { Link } from 'react-router-dom';
-import { useAuth } from '../../contexts/AuthContext';
-import { toast } from 'react-toastify';
-import styled from 'styled-components';
-import { User, Lock, Eye, EyeOff } from 'lucide-react';
-
-const AuthContainer = styled.div`
-  min-height: 100vh;
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  padding: 20px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-`;
-
-const AuthCard = styled.div`
-  background: white;
-  border-radius: 20px;
-  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-  padding: 40px;
-  width: 100%;
-  max-width: 400px;
-  text-align: center;
-`;
-
-const AuthHeader = styled.div`
-  margin-bottom: 30px;
-`;
-
-const AuthTitle = styled.h1`
-  font-size: 2rem;
-  font-weight: 700;
-  color: #1f2937;
-  margin-bottom: 8px;
-`;
-
-const AuthSubtitle = styled.p`
-  color: #6b7280;
-  font-size: 1rem;
-`;
-
-const AuthForm = styled.form`
-  display: flex;
-  flex-direction: column;
-  gap: 20px;
-`;
-
-const FormGroup = styled.div`
-  position: relative;
-`;
-
-const FormInput = styled.input`
-  width: 100%;
-  padding: 12px 16px 12px 45px;
-  border: 2px solid #e5e7eb;
-  border-radius: 8px;
-  font-size: 16px;
-  transition: border-color 0.3s ease;
-  
-  &:focus {
-    outline: none;
-    border-color: #667eea;
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-  }
-`;
-
-const InputIcon = styled.div`
-  position: absolute;
-  left: 15px;
-  top: 50%;
-  transform: translateY(-50%);
-  color: #9ca3af;
-`;
-
-const PasswordToggle = styled.button`
-  position: absolute;
-  right: 15px;
-  top: 50%;
-  transform: translateY(-50%);
-  background: none;
-  border: none;
-  color: #9ca3af;
-  cursor: pointer;
-  padding: 4px;
-  
-  &:hover {
-    color: #667eea;
-  }
-`;
-
-const SubmitButton = styled.button`
-  width: 100%;
-  padding: 12px 24px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  color: white;
-  border: none;
-  border-radius: 8px;
-  font-weight: 500;
-  cursor: pointer;
-  transition: all 0.3s ease;
-  font-size: 16px;
-  
-  &:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
-  }
-  
-  &:disabled {
-    opacity: 0.6;
-    cursor: not-allowed;
-    transform: none;
-  }
-`;
-
-const AuthLink = styled(Link)`
-  color: #667eea;
-  text-decoration: none;
-  font-weight: 500;
-  margin-top: 20px;
-  display: block;
-  
-  &:hover {
-    text-decoration: underline;
-  }
-`;
-
-const ErrorMessage = styled.div`
-  color: #ef4444;
-  font-size: 14px;
-  margin-top: 8px;
-  text-align: left;
-`;
-
-const Login = () => {
-  const [formData, setFormData] = useState({
-    username: '',
-    password: ''
-  });
-  const [showPassword, setShowPassword] = useState(false);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState('');
-  
-  const { login } = useAuth();
-
-  const handleChange = (e) => {
-    setFormData({
-      ...formData,
-      [e.target.name]: e.target.value
-    });
-    setError('');
-  };
-
-  const handleSubmit = async (e) => {
-    e.preventDefault();
-    setLoading(true);
-    setError('');
-
-    const result = await login(formData.username, formData.password);
-    
-    if (result.success) {
-      toast.success(result.message);
-    } else {
-      setError(result.message);
-      toast.error(result.message);
-    }
-    
-    setLoading(false);
-  };
-
-  return (
-    <AuthContainer>
-      <AuthCard>
-        <AuthHeader>
-          <AuthTitle>Welcome Back</AuthTitle>
-          <AuthSubtitle>Sign in to your account</AuthSubtitle>
-        </AuthHeader>
-        
-        <AuthForm onSubmit={handleSubmit}>
-          <FormGroup>
-            <InputIcon>
-              <User size={20} />
-            </InputIcon>
-            <FormInput
-              type="text"
-              name="username"
-              placeholder="Username"
-              value={formData.username}
-              onChange={handleChange}
-              required
-            />
-          </FormGroup>
-          
-          <FormGroup>
-            <InputIcon>
-              <Lock size={20} />
-            </InputIcon>
-            <FormInput
-              type={showPassword ? 'text' : 'password'}
-              name="password"
-              placeholder="Password"
-              value={formData.password}
-              onChange={handleChange}
-              required
-            />
-            <PasswordToggle
-              type="button"
-              onClick={() => setShowPassword(!showPassword)}
-            >
-              {showPassword ? <EyeOff size={20} /> : <Eye size={20} />}
-            </PasswordToggle>
-          </FormGroup>
-          
-          {error && <ErrorMessage>{error}</ErrorMessage>}
-          
-          <SubmitButton type="submit" disabled={loading}>
-            {loading ? 'Signing In...' : 'Sign In'}
-          </SubmitButton>
-        </AuthForm>
-        
-        <AuthLink to="/register">
-          Don't have an account? Sign up
-        </AuthLink>
-      </AuthCard>
-    </AuthContainer>
-  );
-};
-
-export default Login;
+import React, { useState } from 'react';
+import { Link } from 'react-router-dom';
+import { useAuth } from '../../contexts/AuthContext';
+import { toast } from 'react-toastify';
+import styled from 'styled-components';
+import { User, Lock, Eye, EyeOff } from 'lucide-react';
+
+const AuthContainer = styled.div`
+  min-height: 100vh;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  padding: 20px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+`;
+
+const AuthCard = styled.div`
+  background: white;
+  border-radius: 20px;
+  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
+  padding: 40px;
+  width: 100%;
+  max-width: 400px;
+  text-align: center;
+`;
+
+const AuthHeader = styled.div`
+  margin-bottom: 30px;
+`;
+
+const AuthTitle = styled.h1`
+  font-size: 2rem;
+  font-weight: 700;
+  color: #1f2937;
+  margin-bottom: 8px;
+`;
+
+const AuthSubtitle = styled.p`
+  color: #6b7280;
+  font-size: 1rem;
+`;
+
+const AuthForm = styled.form`
+  display: flex;
+  flex-direction: column;
+  gap: 20px;
+`;
+
+const FormGroup = styled.div`
+  position: relative;
+`;
+
+const FormInput = styled.input`
+  width: 100%;
+  padding: 12px 16px 12px 45px;
+  border: 2px solid #e5e7eb;
+  border-radius: 8px;
+  font-size: 16px;
+  transition: border-color 0.3s ease;
+  
+  &:focus {
+    outline: none;
+    border-color: #667eea;
+    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+  }
+`;
+
+const InputIcon = styled.div`
+  position: absolute;
+  left: 15px;
+  top: 50%;
+  transform: translateY(-50%);
+  color: #9ca3af;
+`;
+
+const PasswordToggle = styled.button`
+  position: absolute;
+  right: 15px;
+  top: 50%;
+  transform: translateY(-50%);
+  background: none;
+  border: none;
+  color: #9ca3af;
+  cursor: pointer;
+  padding: 4px;
+  
+  &:hover {
+    color: #667eea;
+  }
+`;
+
+const SubmitButton = styled.button`
+  width: 100%;
+  padding: 12px 24px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  color: white;
+  border: none;
+  border-radius: 8px;
+  font-weight: 500;
+  cursor: pointer;
+  transition: all 0.3s ease;
+  font-size: 16px;
+  
+  &:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
+  }
+  
+  &:disabled {
+    opacity: 0.6;
+    cursor: not-allowed;
+    transform: none;
+  }
+`;
+
+const AuthLink = styled(Link)`
+  color: #667eea;
+  text-decoration: none;
+  font-weight: 500;
+  margin-top: 20px;
+  display: block;
+  
+  &:hover {
+    text-decoration: underline;
+  }
+`;
+
+const ErrorMessage = styled.div`
+  color: #ef4444;
+  font-size: 14px;
+  margin-top: 8px;
+  text-align: left;
+`;
+
+const Login = () => {
+  const [formData, setFormData] = useState({
+    username: '',
+    password: ''
+  });
+  const [showPassword, setShowPassword] = useState(false);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState('');
+  
+  const { login } = useAuth();
+
+  const handleChange = (e) => {
+    setFormData({
+      ...formData,
+      [e.target.name]: e.target.value
+    });
+    setError('');
+  };
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    setLoading(true);
+    setError('');
+
+    const result = await login(formData.username, formData.password);
+    
+    if (result.success) {
+      toast.success(result.message);
+    } else {
+      setError(result.message);
+      toast.error(result.message);
+    }
+    
+    setLoading(false);
+  };
+
+  return (
+    <AuthContainer>
+      <AuthCard>
+        <AuthHeader>
+          <AuthTitle>Welcome Back</AuthTitle>
+          <AuthSubtitle>Sign in to your account</AuthSubtitle>
+        </AuthHeader>
+        
+        <AuthForm onSubmit={handleSubmit}>
+          <FormGroup>
+            <InputIcon>
+              <User size={20} />
+            </InputIcon>
+            <FormInput
+              type="text"
+              name="username"
+              placeholder="Username"
+              value={formData.username}
+              onChange={handleChange}
+              required
+            />
+          </FormGroup>
+          
+          <FormGroup>
+            <InputIcon>
+              <Lock size={20} />
+            </InputIcon>
+            <FormInput
+              type={showPassword ? 'text' : 'password'}
+              name="password"
+              placeholder="Password"
+              value={formData.password}
+              onChange={handleChange}
+              required
+            />
+            <PasswordToggle
+              type="button"
+              onClick={() => setShowPassword(!showPassword)}
+            >
+              {showPassword ? <EyeOff size={20} /> : <Eye size={20} />}
+            </PasswordToggle>
+          </FormGroup>
+          
+          {error && <ErrorMessage>{error}</ErrorMessage>}
+          
+          <SubmitButton type="submit" disabled={loading}>
+            {loading ? 'Signing In...' : 'Sign In'}
+          </SubmitButton>
+        </AuthForm>
+        
+        <AuthLink to="/register">
+          Don't have an account? Sign up
+        </AuthLink>
+      </AuthCard>
+    </AuthContainer>
+  );
+};
+
+export default Login;
@@ -1,283 +1,283 @@
-import React, { useState } from 'react';
-import { Link } from 'react-router-dom';
-import { useAuth } from '../../contexts/AuthContext';
-import { toast } from 'react-toastify';
-import styled from 'styled-components';
-import { User, Mail, Lock, Eye, EyeOff } from 'lucide-react';
-
-const AuthContainer = styled.div`
-  min-height: 100vh;
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  padding: 20px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-`;
-
-const AuthCard = styled.div`
-  background: white;
-  border-radius: 20px;
-  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-  padding: 40px;
-  width: 100%;
-  max-width: 400px;
-  text-align: center;
-`;
-
-const AuthHeader = styled.div`
-  margin-bottom: 30px;
-`;
-
-const AuthTitle = styled.h1`
-  font-size: 2rem;
-  font-weight: 700;
-  color: #1f2937;
-  margin-bottom: 8px;
-`;
-
-const AuthSubtitle = styled.p`
-  color: #6b7280;
-  font-size: 1rem;
-`;
-
-const AuthForm = styled.form`
-  display: flex;
-  flex-direction: column;
-  gap: 20px;
-`;
-
-const FormGroup = styled.div`
-  position: relative;
-`;
-
-const FormInput = styled.input`
-  width: 100%;
-  padding: 12px 16px 12px 45px;
-  border: 2px solid #e5e7eb;
-  border-radius: 8px;
-  font-size: 16px;
-  transition: border-color 0.3s ease;
-  
-  &:focus {
-    outline: none;
-    border-color: #667eea;
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-  }
-`;
-
-const InputIcon = styled.div`
-  position: absolute;
-  left: 15px;
-  top: 50%;
-  transform: translateY(-50%);
-  color: #9ca3af;
-`;
-
-const PasswordToggle = styled.button`
-  position: absolute;
-  right: 15px;
-  top: 50%;
-  transform: translateY(-50%);
-  background: none;
-  border: none;
-  color: #9ca3af;
-  cursor: pointer;
-  padding: 4px;
-  
-  &:hover {
-    color: #667eea;
-  }
-`;
-
-const SubmitButton = styled.button`
-  width: 100%;
-  padding: 12px 24px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  color: white;
-  border: none;
-  border-radius: 8px;
-  font-weight: 500;
-  cursor: pointer;
-  transition: all 0.3s ease;
-  font-size: 16px;
-  
-  &:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
-  }
-  
-  &:disabled {
-    opacity: 0.6;
-    cursor: not-allowed;
-    transform: none;
-  }
-`;
-
-const AuthLink = styled(Link)`
-  color: #667eea;
-  text-decoration: none;
-  font-weight: 500;
-  margin-top: 20px;
-  display: block;
-  
-  &:hover {
-    text-decoration: underline;
-  }
-`;
-
-const ErrorMessage = styled.div`
-  color: #ef4444;
-  font-size: 14px;
-  margin-top: 8px;
-  text-align: left;
-`;
-
-const Register = () => {
-  const [formData, setFormData] = useState({
-    username: '',
-    email: '',
-    password: '',
-    confirmPassword: ''
-  });
-  const [showPassword, setShowPassword] = useState(false);
-  const [showConfirmPassword, setShowConfirmPassword] = useState(false);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState('');
-  
-  const { register } = useAuth();
-
-  const handleChange = (e) => {
-    setFormData({
-      ...formData,
-      [e.target.name]: e.target.value
-    });
-    setError('');
-  };
-
-  const handleSubmit = async (e) => {
-    e.preventDefault();
-    setLoading(true);
-    setError('');
-
-    // Validation
-    if (formData.password !== formData.confirmPassword) {
-      setError('Passwords do not match');
-      setLoading(false);
-      return;
-    }
-
-    if (formData.password.length < 6) {
-      setError('Password must be at least 6 characters long');
-      setLoading(false);
-      return;
-    }
-
-    const result = await register(formData.username, formData.email, formData.password);
-    
-    if (result.success) {
-      toast.success(result.message);
-      // Redirect to login after successful registration
-      setTimeout(() => {
-        window.location.href = '/login';
-      }, 2000);
-    } else {
-      setError(result.message);
-      toast.error(result.message);
-    }
-    
-    setLoading(false);
-  };
-
-  return (
-    <AuthContainer>
-      <AuthCard>
-        <AuthHeader>
-          <AuthTitle>Create Account</AuthTitle>
-          <AuthSubtitle>Join our career platform</AuthSubtitle>
-        </AuthHeader>
-        
-        <AuthForm onSubmit={handleSubmit}>
-          <FormGroup>
-            <InputIcon>
-              <User size={20} />
-            </InputIcon>
-            <FormInput
-              type="text"
-              name="username"
-              placeholder="Username"
-              value={formData.username}
-              onChange={handleChange}
-              required
-            />
-          </FormGroup>
-          
-          <FormGroup>
-            <InputIcon>
-              <Mail size={20} />
-            </InputIcon>
-            <FormInput
-              type="email"
-              name="email"
-              placeholder="Email"
-              value={formData.email}
-              onChange={handleChange}
-              required
-            />
-          </FormGroup>
-          
-          <FormGroup>
-            <InputIcon>
-              <Lock size={20} />
-            </InputIcon>
-            <FormInput
-              type={showPassword ? 'text' : 'password'}
-              name="password"
-              placeholder="Password"
-              value={formData.password}
-              onChange={handleChange}
-              required
-            />
-            <PasswordToggle
-              type="button"
-              onClick={() => setShowPassword(!showPassword)}
-            >
-              {showPassword ? <EyeOff size={20} /> : <Eye size={20} />}
-            </PasswordToggle>
-          </FormGroup>
-          
-          <FormGroup>
-            <InputIcon>
-              <Lock size={20} />
-            </InputIcon>
-            <FormInput
-              type={showConfirmPassword ? 'text' : 'password'}
-              name="confirmPassword"
-              placeholder="Confirm Password"
-              value={formData.confirmPassword}
-              onChange={handleChange}
-              required
-            />
-            <PasswordToggle
-              type="button"
-              onClick={() => setShowConfirmPassword(!showConfirmPassword)}
-            >
-              {showConfirmPassword ? <EyeOff size={20} /> : <Eye size={20} />}
-            </PasswordToggle>
-          </FormGroup>
-          
-          {error && <ErrorMessage>{error}</ErrorMessage>}
-          
-          <SubmitButton type="submit" disabled={loading}>
-            {loading ? 'Creating Account...' : 'Create Account'}
-          </SubmitButton>
-        </AuthForm>
-        
-        <AuthLink to="/login">
-          Already have an account? Sign in
-        </AuthLink>
-      </AuthCard>
-    </AuthContainer>
-  );
-};
-
-export default Register;
+import React, { useState } from 'react';
+import { Link } from 'react-router-dom';
+import { useAuth } from '../../contexts/AuthContext';
+import { toast } from 'react-toastify';
+import styled from 'styled-components';
+import { User, Mail, Lock, Eye, EyeOff } from 'lucide-react';
+
+const AuthContainer = styled.div`
+  min-height: 100vh;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  padding: 20px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+`;
+
+const AuthCard = styled.div`
+  background: white;
+  border-radius: 20px;
+  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
+  padding: 40px;
+  width: 100%;
+  max-width: 400px;
+  text-align: center;
+`;
+
+const AuthHeader = styled.div`
+  margin-bottom: 30px;
+`;
+
+const AuthTitle = styled.h1`
+  font-size: 2rem;
+  font-weight: 700;
+  color: #1f2937;
+  margin-bottom: 8px;
+`;
+
+const AuthSubtitle = styled.p`
+  color: #6b7280;
+  font-size: 1rem;
+`;
+
+const AuthForm = styled.form`
+  display: flex;
+  flex-direction: column;
+  gap: 20px;
+`;
+
+const FormGroup = styled.div`
+  position: relative;
+`;
+
+const FormInput = styled.input`
+  width: 100%;
+  padding: 12px 16px 12px 45px;
+  border: 2px solid #e5e7eb;
+  border-radius: 8px;
+  font-size: 16px;
+  transition: border-color 0.3s ease;
+  
+  &:focus {
+    outline: none;
+    border-color: #667eea;
+    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+  }
+`;
+
+const InputIcon = styled.div`
+  position: absolute;
+  left: 15px;
+  top: 50%;
+  transform: translateY(-50%);
+  color: #9ca3af;
+`;
+
+const PasswordToggle = styled.button`
+  position: absolute;
+  right: 15px;
+  top: 50%;
+  transform: translateY(-50%);
+  background: none;
+  border: none;
+  color: #9ca3af;
+  cursor: pointer;
+  padding: 4px;
+  
+  &:hover {
+    color: #667eea;
+  }
+`;
+
+const SubmitButton = styled.button`
+  width: 100%;
+  padding: 12px 24px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  color: white;
+  border: none;
+  border-radius: 8px;
+  font-weight: 500;
+  cursor: pointer;
+  transition: all 0.3s ease;
+  font-size: 16px;
+  
+  &:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
+  }
+  
+  &:disabled {
+    opacity: 0.6;
+    cursor: not-allowed;
+    transform: none;
+  }
+`;
+
+const AuthLink = styled(Link)`
+  color: #667eea;
+  text-decoration: none;
+  font-weight: 500;
+  margin-top: 20px;
+  display: block;
+  
+  &:hover {
+    text-decoration: underline;
+  }
+`;
+
+const ErrorMessage = styled.div`
+  color: #ef4444;
+  font-size: 14px;
+  margin-top: 8px;
+  text-align: left;
+`;
+
+const Register = () => {
+  const [formData, setFormData] = useState({
+    username: '',
+    email: '',
+    password: '',
+    confirmPassword: ''
+  });
+  const [showPassword, setShowPassword] = useState(false);
+  const [showConfirmPassword, setShowConfirmPassword] = useState(false);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState('');
+  
+  const { register } = useAuth();
+
+  const handleChange = (e) => {
+    setFormData({
+      ...formData,
+      [e.target.name]: e.target.value
+    });
+    setError('');
+  };
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    setLoading(true);
+    setError('');
+
+    // Validation
+    if (formData.password !== formData.confirmPassword) {
+      setError('Passwords do not match');
+      setLoading(false);
+      return;
+    }
+
+    if (formData.password.length < 6) {
+      setError('Password must be at least 6 characters long');
+      setLoading(false);
+      return;
+    }
+
+    const result = await register(formData.username, formData.email, formData.password);
+    
+    if (result.success) {
+      toast.success(result.message);
+      // Redirect to login after successful registration
+      setTimeout(() => {
+        window.location.href = '/login';
+      }, 2000);
+    } else {
+      setError(result.message);
+      toast.error(result.message);
+    }
+    
+    setLoading(false);
+  };
+
+  return (
+    <AuthContainer>
+      <AuthCard>
+        <AuthHeader>
+          <AuthTitle>Create Account</AuthTitle>
+          <AuthSubtitle>Join our career platform</AuthSubtitle>
+        </AuthHeader>
+        
+        <AuthForm onSubmit={handleSubmit}>
+          <FormGroup>
+            <InputIcon>
+              <User size={20} />
+            </InputIcon>
+            <FormInput
+              type="text"
+              name="username"
+              placeholder="Username"
+              value={formData.username}
+              onChange={handleChange}
+              required
+            />
+          </FormGroup>
+          
+          <FormGroup>
+            <InputIcon>
+              <Mail size={20} />
+            </InputIcon>
+            <FormInput
+              type="email"
+              name="email"
+              placeholder="Email"
+              value={formData.email}
+              onChange={handleChange}
+              required
+            />
+          </FormGroup>
+          
+          <FormGroup>
+            <InputIcon>
+              <Lock size={20} />
+            </InputIcon>
+            <FormInput
+              type={showPassword ? 'text' : 'password'}
+              name="password"
+              placeholder="Password"
+              value={formData.password}
+              onChange={handleChange}
+              required
+            />
+            <PasswordToggle
+              type="button"
+              onClick={() => setShowPassword(!showPassword)}
+            >
+              {showPassword ? <EyeOff size={20} /> : <Eye size={20} />}
+            </PasswordToggle>
+          </FormGroup>
+          
+          <FormGroup>
+            <InputIcon>
+              <Lock size={20} />
+            </InputIcon>
+            <FormInput
+              type={showConfirmPassword ? 'text' : 'password'}
+              name="confirmPassword"
+              placeholder="Confirm Password"
+              value={formData.confirmPassword}
+              onChange={handleChange}
+              required
+            />
+            <PasswordToggle
+              type="button"
+              onClick={() => setShowConfirmPassword(!showConfirmPassword)}
+            >
+              {showConfirmPassword ? <EyeOff size={20} /> : <Eye size={20} />}
+            </PasswordToggle>
+          </FormGroup>
+          
+          {error && <ErrorMessage>{error}</ErrorMessage>}
+          
+          <SubmitButton type="submit" disabled={loading}>
+            {loading ? 'Creating Account...' : 'Create Account'}
+          </SubmitButton>
+        </AuthForm>
+        
+        <AuthLink to="/login">
+          Already have an account? Sign in
+        </AuthLink>
+      </AuthCard>
+    </AuthContainer>
+  );
+};
+
+export default Register;
@@ -1,44 +1,44 @@
-import React from 'react';
-import styled, { keyframes } from 'styled-components';
-
-const spin = keyframes`
-  0% { transform: rotate(0deg); }
-  100% { transform: rotate(360deg); }
-`;
-
-const SpinnerContainer = styled.div`
-  display: flex;
-  justify-content: center;
-  align-items: center;
-  min-height: 100vh;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-`;
-
-const Spinner = styled.div`
-  border: 4px solid rgba(255, 255, 255, 0.3);
-  border-top: 4px solid white;
-  border-radius: 50%;
-  width: 50px;
-  height: 50px;
-  animation: ${spin} 1s linear infinite;
-`;
-
-const LoadingText = styled.p`
-  color: white;
-  font-size: 1.2rem;
-  font-weight: 500;
-  margin-top: 20px;
-`;
-
-const LoadingSpinner = ({ text = "Loading..." }) => {
-  return (
-    <SpinnerContainer>
-      <div style={{ textAlign: 'center' }}>
-        <Spinner />
-        <LoadingText>{text}</LoadingText>
-      </div>
-    </SpinnerContainer>
-  );
-};
-
-export default LoadingSpinner;
+import React from 'react';
+import styled, { keyframes } from 'styled-components';
+
+const spin = keyframes`
+  0% { transform: rotate(0deg); }
+  100% { transform: rotate(360deg); }
+`;
+
+const SpinnerContainer = styled.div`
+  display: flex;
+  justify-content: center;
+  align-items: center;
+  min-height: 100vh;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+`;
+
+const Spinner = styled.div`
+  border: 4px solid rgba(255, 255, 255, 0.3);
+  border-top: 4px solid white;
+  border-radius: 50%;
+  width: 50px;
+  height: 50px;
+  animation: ${spin} 1s linear infinite;
+`;
+
+const LoadingText = styled.p`
+  color: white;
+  font-size: 1.2rem;
+  font-weight: 500;
+  margin-top: 20px;
+`;
+
+const LoadingSpinner = ({ text = "Loading..." }) => {
+  return (
+    <SpinnerContainer>
+      <div style={{ textAlign: 'center' }}>
+        <Spinner />
+        <LoadingText>{text}</LoadingText>
+      </div>
+    </SpinnerContainer>
+  );
+};
+
+export default LoadingSpinner;
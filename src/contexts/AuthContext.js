@@ -1,101 +1,101 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
-import axios from 'axios';
-
-const AuthContext = createContext();
-
-export const useAuth = () => {
-  const context = useContext(AuthContext);
-  if (!context) {
-    throw new Error('useAuth must be used within an AuthProvider');
-  }
-  return context;
-};
-
-export const AuthProvider = ({ children }) => {
-  const [user, setUser] = useState(null);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    checkAuth();
-  }, []);
-
-  const checkAuth = async () => {
-    try {
-      const response = await axios.get('/api/check-auth', {
-        withCredentials: true
-      });
-      
-      if (response.data.authenticated) {
-        setUser(response.data.user);
-      }
-    } catch (error) {
-      console.error('Auth check failed:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const login = async (username, password) => {
-    try {
-      const response = await axios.post('/api/login', {
-        username,
-        password
-      }, {
-        withCredentials: true
-      });
-
-      if (response.data.user) {
-        setUser(response.data.user);
-        return { success: true, message: response.data.message };
-      }
-    } catch (error) {
-      return { 
-        success: false, 
-        message: error.response?.data?.error || 'Login failed' 
-      };
-    }
-  };
-
-  const register = async (username, email, password) => {
-    try {
-      const response = await axios.post('/api/register', {
-        username,
-        email,
-        password
-      });
-
-      return { success: true, message: response.data.message };
-    } catch (error) {
-      return { 
-        success: false, 
-        message: error.response?.data?.error || 'Registration failed' 
-      };
-    }
-  };
-
-  const logout = async () => {
-    try {
-      await axios.post('/api/logout', {}, {
-        withCredentials: true
-      });
-    } catch (error) {
-      console.error('Logout error:', error);
-    } finally {
-      setUser(null);
-    }
-  };
-
-  const value = {
-    user,
-    login,
-    register,
-    logout,
-    loading
-  };
-
-  return (
-    <AuthContext.Provider value={value}>
-      {children}
-    </AuthContext.Provider>
-  );
-};
+import React, { createContext, useContext, useState, useEffect } from 'react';
+import axios from 'axios';
+
+const AuthContext = createContext();
+
+export const useAuth = () => {
+  const context = useContext(AuthContext);
+  if (!context) {
+    throw new Error('useAuth must be used within an AuthProvider');
+  }
+  return context;
+};
+
+export const AuthProvider = ({ children }) => {
+  const [user, setUser] = useState(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    checkAuth();
+  }, []);
+
+  const checkAuth = async () => {
+    try {
+      const response = await axios.get('/api/check-auth', {
+        withCredentials: true
+      });
+      
+      if (response.data.authenticated) {
+        setUser(response.data.user);
+      }
+    } catch (error) {
+      console.error('Auth check failed:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const login = async (username, password) => {
+    try {
+      const response = await axios.post('/api/login', {
+        username,
+        password
+      }, {
+        withCredentials: true
+      });
+
+      if (response.data.user) {
+        setUser(response.data.user);
+        return { success: true, message: response.data.message };
+      }
+    } catch (error) {
+      return { 
+        success: false, 
+        message: error.response?.data?.error || 'Login failed' 
+      };
+    }
+  };
+
+  const register = async (username, email, password) => {
+    try {
+      const response = await axios.post('/api/register', {
+        username,
+        email,
+        password
+      });
+
+      return { success: true, message: response.data.message };
+    } catch (error) {
+      return { 
+        success: false, 
+        message: error.response?.data?.error || 'Registration failed' 
+      };
+    }
+  };
+
+  const logout = async () => {
+    try {
+      await axios.post('/api/logout', {}, {
+        withCredentials: true
+      });
+    } catch (error) {
+      console.error('Logout error:', error);
+    } finally {
+      setUser(null);
+    }
+  };
+
+  const value = {
+    user,
+    login,
+    register,
+    logout,
+    loading
+  };
+
+  return (
+    <AuthContext.Provider value={value}>
+      {children}
+    </AuthContext.Provider>
+  );
+};
@@ -0,0 +1,385 @@
+"""
+Text Ranker
+TF-IDF / cosine-similarity ranking of job postings against profile text.
+
+The fitted vectorizer and the job matrix are persisted under a model
+directory and memory-mapped at startup, so requests never pay for a fit.
+Postings that changed since the last fit are re-vectorized with the existing
+vocabulary and kept in an in-memory overlay until the next compaction; a sync
+reads only rows updated since shortly before the last one seen.
+Requires scikit-learn (and NumPy/SciPy); without it the ranker stays disabled
+and callers keep the skill-overlap score.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+
+from db_batch import chunked
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    HAS_SKLEARN = True
+except ImportError:  # optional dependency
+    np = None
+    sparse = None
+    TfidfVectorizer = None
+    HAS_SKLEARN = False
+
+# Job columns that make up the posting text
+JOB_TEXT_FIELDS = ('title', 'description', 'requirements', 'skills_required')
+
+# Profile columns used as the query text (JSON lists are flattened)
+PROFILE_TEXT_FIELDS = (
+    'field_of_study', 'highest_qualification', 'technical_skills', 'programming_languages',
+    'frameworks', 'database_skills', 'tools', 'career_interests', 'projects', 'internships',
+    'certifications', 'tech_stack'
+)
+
+# Rewrite the snapshot once this many postings live in the overlay
+COMPACT_THRESHOLD = 200
+
+# Seconds before the watermark a sync re-reads, for writes that committed after their updated_at
+SYNC_OVERLAP = 300
+
+
+def job_text(job):
+    """Concatenate the text fields of a job row"""
+    return ' '.join(str(job.get(field) or '') for field in JOB_TEXT_FIELDS)
+
+
+def profile_text(profile):
+    """Concatenate the text fields of a user_profiles row"""
+    parts = []
+    for field in PROFILE_TEXT_FIELDS:
+        value = profile.get(field)
+        if not value:
+            continue
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        else:
+            parts.append(str(value))
+    return ' '.join(parts)
+
+
+def _content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class TextRanker:
+    """Cosine similarity between profile text and active job postings"""
+
+    def __init__(self, model_dir, max_features=50000):
+        self.model_dir = model_dir
+        self.max_features = max_features
+        self._lock = threading.RLock()
+        self._vectorizer = None
+        self._matrix = None          # memory-mapped CSR matrix of the last fit
+        self._job_ids = []
+        self._positions = {}         # job_id -> row in the mmapped matrix
+        self._hashes = {}            # job_id -> content hash of the indexed text
+        self._overlay = {}           # job_id -> re-vectorized row (1 x n_features)
+        self._removed = set()        # job ids whose mmapped row is stale or deleted
+        self._fitted_at = None
+        self._synced_at = None       # highest jobs.updated_at indexed so far
+
+    @property
+    def available(self):
+        return HAS_SKLEARN
+
+    @property
+    def ready(self):
+        return self._vectorizer is not None
+
+    # Persistence
+
+    def _current_dir(self):
+        pointer = os.path.join(self.model_dir, 'CURRENT')
+        if not os.path.exists(pointer):
+            return None
+        with open(pointer) as f:
+            return os.path.join(self.model_dir, f.read().strip())
+
+    def load(self):
+        """Memory-map the latest snapshot; returns False if there is none"""
+        if not HAS_SKLEARN:
+            return False
+        path = self._current_dir()
+        if not path or not os.path.isdir(path):
+            return False
+
+        with open(os.path.join(path, 'vectorizer.pkl'), 'rb') as f:
+            vectorizer = pickle.load(f)
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        data = np.load(os.path.join(path, 'data.npy'), mmap_mode='r')
+        indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode='r')
+        indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode='r')
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=tuple(meta['shape']), copy=False)
+
+        with self._lock:
+            self._vectorizer = vectorizer
+            self._matrix = matrix
+            self._job_ids = meta['job_ids']
+            self._positions = {job_id: i for i, job_id in enumerate(self._job_ids)}
+            self._hashes = {int(job_id): value for job_id, value in meta['hashes'].items()}
+            self._overlay = {}
+            self._removed = set()
+            self._fitted_at = meta.get('fitted_at')
+            self._synced_at = meta.get('synced_at')
+        print(f"Text model loaded from {path} ({len(self._job_ids)} postings)")
+        return True
+
+    def _write_snapshot(self, vectorizer, job_ids, matrix, hashes, fitted_at, synced_at):
+        """Write a new snapshot directory and point CURRENT at it"""
+        os.makedirs(self.model_dir, exist_ok=True)
+        version = f"snapshot-{int(time.time() * 1000)}"
+        path = os.path.join(self.model_dir, version)
+        os.makedirs(path)
+
+        matrix = matrix.tocsr()
+        with open(os.path.join(path, 'vectorizer.pkl'), 'wb') as f:
+            pickle.dump(vectorizer, f)
+        np.save(os.path.join(path, 'data.npy'), matrix.data.astype(np.float32))
+        np.save(os.path.join(path, 'indices.npy'), matrix.indices.astype(np.int32))
+        np.save(os.path.join(path, 'indptr.npy'), matrix.indptr.astype(np.int64))
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump({
+                'job_ids': job_ids,
+                'hashes': {str(job_id): value for job_id, value in hashes.items()},
+                'shape': list(matrix.shape),
+                'fitted_at': fitted_at,
+                'synced_at': synced_at,
+            }, f)
+
+        previous = self._current_dir()
+        pointer_tmp = os.path.join(self.model_dir, 'CURRENT.tmp')
+        with open(pointer_tmp, 'w') as f:
+            f.write(version)
+        os.replace(pointer_tmp, os.path.join(self.model_dir, 'CURRENT'))
+
+        if previous and os.path.isdir(previous):
+            # May fail while the old files are still mapped (Windows); cleaned up next time
+            shutil.rmtree(previous, ignore_errors=True)
+
+    # Fitting and incremental updates
+
+    def _fetch_jobs(self, connection, since=None, ids=None):
+        """Every active job; with `since`, every job updated around or after it; with `ids`, those jobs"""
+        columns = f"id, status, updated_at, {', '.join(JOB_TEXT_FIELDS)}"
+        cursor = connection.cursor(dictionary=True)
+        try:
+            if ids is not None:
+                jobs = []
+                for batch in chunked(ids, 1000):
+                    placeholders = ', '.join(['%s'] * len(batch))
+                    cursor.execute(f"SELECT {columns} FROM jobs WHERE id IN ({placeholders})", list(batch))
+                    jobs.extend(cursor.fetchall())
+                return jobs
+            if since is None:
+                cursor.execute(f"SELECT {columns} FROM jobs WHERE status = 'Active'")
+            else:
+                # Rows already indexed with the same text are skipped by hash
+                cursor.execute(f"SELECT {columns} FROM jobs WHERE updated_at >= %s - INTERVAL %s SECOND",
+                               (since, SYNC_OVERLAP))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _fetch_active(self, connection):
+        """Ids of active jobs, or None when their count matches what is indexed"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT COUNT(*) FROM jobs WHERE status = 'Active'")
+            total = cursor.fetchone()[0]
+            with self._lock:
+                indexed = len(self._hashes)
+            if total == indexed:
+                return None
+            cursor.execute("SELECT id FROM jobs WHERE status = 'Active'")
+            return {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _watermark(jobs, previous=None):
+        stamps = [str(job['updated_at']) for job in jobs if job.get('updated_at') is not None]
+        if previous is not None:
+            stamps.append(previous)
+        return max(stamps) if stamps else None
+
+    def fit(self, connection):
+        """Full refit over every active job (run offline or in a background worker)"""
+        if not HAS_SKLEARN:
+            return False
+        jobs = self._fetch_jobs(connection)
+        texts = [job_text(job) for job in jobs]
+        job_ids = [job['id'] for job in jobs]
+        if not any(text.strip() for text in texts):
+            print("Text model not fitted: no active postings with text")
+            return False
+
+        vectorizer = TfidfVectorizer(stop_words='english', max_features=self.max_features,
+                                     sublinear_tf=True, dtype=np.float32)
+        matrix = vectorizer.fit_transform(texts)
+        hashes = {job_id: _content_hash(text) for job_id, text in zip(job_ids, texts)}
+
+        self._write_snapshot(vectorizer, job_ids, matrix, hashes, time.time(), self._watermark(jobs))
+        print(f"Text model fitted on {len(job_ids)} postings")
+        return self.load()
+
+    def sync(self, connection):
+        """
+        Re-vectorize only the postings whose text changed since the last sync.
+
+        Reads the rows updated since the watermark, minus SYNC_OVERLAP for
+        late commits (closed jobs included, so they drop out). When the active
+        count still differs from the index, the active ids are read to drop
+        deleted postings and add any the window missed.
+        """
+        if not self.ready:
+            return self.fit(connection)
+
+        since = self._synced_at
+        jobs = self._fetch_jobs(connection, since)
+        with self._lock:
+            changed, closed = self._apply(jobs)
+            if since is None:
+                # Full read (snapshot without a watermark): anything not returned is gone
+                active_ids = {job['id'] for job in jobs}
+                closed.extend(job_id for job_id in self._hashes if job_id not in active_ids)
+            self._drop(closed)
+
+        deleted = []
+        if since is not None:
+            active_ids = self._fetch_active(connection)
+            if active_ids is not None:
+                with self._lock:
+                    deleted = [job_id for job_id in self._hashes if job_id not in active_ids]
+                    self._drop(deleted)
+                    missing = [job_id for job_id in active_ids if job_id not in self._hashes]
+                if missing:
+                    late = self._fetch_jobs(connection, ids=missing)
+                    with self._lock:
+                        changed.extend(self._apply(late)[0])
+
+        with self._lock:
+            self._synced_at = self._watermark(jobs, since)
+            needs_compaction = len(self._overlay) + len(self._removed) >= COMPACT_THRESHOLD
+
+        gone = len(closed) + len(deleted)
+        if changed or gone:
+            print(f"Text model synced: {len(changed)} re-vectorized, {gone} removed")
+        if needs_compaction:
+            self.compact()
+        return True
+
+    def _apply(self, jobs):
+        """Re-vectorize changed active rows; returns (changed ids, indexed ids now inactive). Caller holds the lock"""
+        changed = []
+        closed = []
+        for job in jobs:
+            job_id = job['id']
+            if job['status'] != 'Active':
+                if job_id in self._hashes:
+                    closed.append(job_id)
+                continue
+            text = job_text(job)
+            digest = _content_hash(text)
+            if self._hashes.get(job_id) != digest:
+                changed.append((job_id, text, digest))
+
+        if changed:
+            vectors = self._vectorizer.transform([text for _, text, _ in changed]).tocsr()
+            for row, (job_id, _, digest) in enumerate(changed):
+                self._overlay[job_id] = vectors[row]
+                self._hashes[job_id] = digest
+                if job_id in self._positions:
+                    self._removed.add(job_id)
+        return [job_id for job_id, _, _ in changed], closed
+
+    def _drop(self, job_ids):
+        """Forget postings that are no longer active (caller holds the lock)"""
+        for job_id in job_ids:
+            self._hashes.pop(job_id, None)
+            self._overlay.pop(job_id, None)
+            if job_id in self._positions:
+                self._removed.add(job_id)
+
+    def compact(self):
+        """Fold the overlay into a new snapshot without refitting the vocabulary"""
+        with self._lock:
+            keep = [job_id for job_id in self._job_ids if job_id not in self._removed]
+            rows = [self._matrix[self._positions[job_id]] for job_id in keep]
+            overlay_ids = list(self._overlay)
+            rows.extend(self._overlay[job_id] for job_id in overlay_ids)
+            job_ids = keep + overlay_ids
+            n_features = len(self._vectorizer.vocabulary_)
+            matrix = sparse.vstack(rows).tocsr() if rows else sparse.csr_matrix((0, n_features), dtype=np.float32)
+            hashes = dict(self._hashes)
+            self._write_snapshot(self._vectorizer, job_ids, matrix, hashes, self._fitted_at, self._synced_at)
+        return self.load()
+
+    # Scoring
+
+    def score(self, profile):
+        """Return {job_id: cosine similarity} for every indexed active job"""
+        if not self.ready:
+            return {}
+        text = profile_text(profile)
+        if not text:
+            return {}
+
+        with self._lock:
+            query = self._vectorizer.transform([text]).T.tocsc()
+            scores = {}
+            if self._matrix.shape[0] and self._matrix.shape[1]:
+                base = np.asarray((self._matrix @ query).todense()).ravel()
+                for job_id, value in zip(self._job_ids, base):
+                    if value > 0 and job_id not in self._removed:
+                        scores[job_id] = float(value)
+            for job_id, row in self._overlay.items():
+                value = float((row @ query).toarray()[0, 0])
+                if value > 0:
+                    scores[job_id] = value
+        return scores
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'available': HAS_SKLEARN,
+                'ready': self.ready,
+                'postings': len(self._hashes),
+                'overlay': len(self._overlay),
+                'stale_rows': len(self._removed),
+                'fitted_at': self._fitted_at,
+                'synced_at': self._synced_at,
+            }
+
+
+if __name__ == '__main__':
+    import mysql.connector
+
+    from config import Config
+
+    connection = mysql.connector.connect(
+        host=Config.DB_HOST, database=Config.DB_NAME, user=Config.DB_USER,
+        password=Config.DB_PASSWORD, port=Config.DB_PORT
+    )
+    try:
+        ranker = TextRanker(os.getenv('TEXT_MODEL_DIR', 'model_cache'))
+        ranker.fit(connection)
+        print(ranker.get_stats())
+    finally:
+        connection.close()